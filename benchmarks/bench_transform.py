@@ -0,0 +1,194 @@
+"""
+Benchmarks in the format of airspeed velocity (asv). Methods prefixed ``time_`` are
+timed, and methods prefixed ``peakmem_`` record the peak resident memory.
+"""
+from itertools import combinations
+
+import numpy as np
+
+import schurtransform as st
+from schurtransform.schur_transform import SchurTransform
+from schurtransform.schur_transform import ProjectionEngine
+from schurtransform.symmetric_group import is_vanishing_partition
+
+from .common import generate_registered_points
+from .common import load_lung_example
+from .common import clear_registry
+
+
+class TransformSummaries:
+    """
+    The whole transform, for each summary type. For ``COMPONENTS`` and ``NORMS`` the
+    number of series is the degree; for the ``...CONTENT`` summaries, the degree is
+    the number of factors, from ``content_series`` series.
+    """
+    params = (
+        ['COMPONENTS', 'NORMS', 'CONTENT', 'SEQUENTIAL_CONTENT', 'MEAN_CONTENT'],
+        [2, 3, 4, 5, 6],
+        [2, 3],
+        [100, 1000],
+    )
+    param_names = ['summary', 'degree', 'dimension', 'number_of_samples']
+    content_series = 8
+
+    def setup(self, summary, degree, dimension, number_of_samples):
+        if summary in ['COMPONENTS', 'NORMS']:
+            number_of_series = degree
+            self.number_of_factors = None
+        else:
+            number_of_series = TransformSummaries.content_series
+            self.number_of_factors = degree
+        self.samples = generate_registered_points(number_of_series, number_of_samples, dimension)
+        self.run(summary)
+
+    def run(self, summary):
+        return st.transform(
+            samples=self.samples,
+            summary=summary,
+            number_of_factors=self.number_of_factors,
+        )
+
+    def time_transform(self, summary, degree, dimension, number_of_samples):
+        self.run(summary)
+
+    def peakmem_transform(self, summary, degree, dimension, number_of_samples):
+        self.run(summary)
+
+
+class SeriesScaling:
+    """
+    The ``CONTENT`` summary, as the number of series (and so of index combinations)
+    and samples grows.
+    """
+    params = ([6, 10, 14], [100, 1000, 10000], [3])
+    param_names = ['number_of_series', 'number_of_samples', 'degree']
+
+    def setup(self, number_of_series, number_of_samples, degree):
+        self.samples = generate_registered_points(number_of_series, number_of_samples, 3)
+        st.transform(samples=self.samples[:degree], summary='CONTENT', number_of_factors=degree)
+
+    def time_content(self, number_of_series, number_of_samples, degree):
+        st.transform(samples=self.samples, summary='CONTENT', number_of_factors=degree)
+
+    def peakmem_content(self, number_of_series, number_of_samples, degree):
+        st.transform(samples=self.samples, summary='CONTENT', number_of_factors=degree)
+
+
+class Precision:
+    """
+    The ``CONTENT`` summary with the dense projectors, in double and single
+    precision.
+    """
+    params = (['float64', 'float32'], [4, 5], [1000, 10000])
+    param_names = ['dtype', 'degree', 'number_of_samples']
+    number_of_series = 10
+
+    def setup(self, dtype, degree, number_of_samples):
+        self.samples = generate_registered_points(Precision.number_of_series, number_of_samples, 3)
+        self.run(dtype, degree)
+
+    def run(self, dtype, degree):
+        return st.transform(
+            samples=self.samples,
+            summary='CONTENT',
+            number_of_factors=degree,
+            engine='OPERATOR',
+            dtype=dtype,
+        )
+
+    def time_content(self, dtype, degree, number_of_samples):
+        self.run(dtype, degree)
+
+    def peakmem_content(self, dtype, degree, number_of_samples):
+        self.run(dtype, degree)
+
+
+class Stages:
+    """
+    The stages of the transform, separately: recentering, the covariance (joint
+    moment) tensor, dense and permutation-based decomposition, norms, and the
+    batched ``CONTENT`` loop.
+    """
+    params = ([2, 3, 4, 5, 6], [2, 3], [1000])
+    param_names = ['degree', 'dimension', 'number_of_samples']
+
+    def setup(self, degree, dimension, number_of_samples):
+        self.transformer = SchurTransform()
+        self.samples = generate_registered_points(degree, number_of_samples, dimension)
+        self.centered = self.transformer.recenter_at_mean(self.samples)
+        self.tensor = self.transformer.calculate_covariance_tensor(self.centered)
+        self.dense = self.transformer.get_projectors(dimension, degree, engine=ProjectionEngine.OPERATOR)
+        self.permutation = self.transformer.get_projectors(dimension, degree, engine=ProjectionEngine.PERMUTATION)
+        self.content_samples = generate_registered_points(8, number_of_samples, dimension)
+
+    def time_recenter_at_mean(self, degree, dimension, number_of_samples):
+        self.transformer.recenter_at_mean(self.samples)
+
+    def time_calculate_covariance_tensor(self, degree, dimension, number_of_samples):
+        self.transformer.calculate_covariance_tensor(self.centered)
+
+    def peakmem_calculate_covariance_tensor(self, degree, dimension, number_of_samples):
+        self.transformer.calculate_covariance_tensor(self.centered)
+
+    def time_operator_apply(self, degree, dimension, number_of_samples):
+        for key, projector in self.dense.items():
+            if not is_vanishing_partition(key, dimension):
+                projector.apply(self.tensor)
+
+    def time_permutation_decomposition(self, degree, dimension, number_of_samples):
+        self.transformer.calculate_decomposition(self.tensor, self.permutation)
+
+    def time_permutation_norms(self, degree, dimension, number_of_samples):
+        self.transformer.calculate_norms(self.tensor, self.permutation)
+
+    def time_content_loop(self, degree, dimension, number_of_samples):
+        self.transformer.calculate_content(
+            self.content_samples,
+            combinations(range(self.content_samples.shape[0]), degree),
+            self.permutation,
+            engine=ProjectionEngine.PERMUTATION,
+        )
+
+    def peakmem_content_loop(self, degree, dimension, number_of_samples):
+        self.time_content_loop(degree, dimension, number_of_samples)
+
+
+class ProjectorRetrieval:
+    """
+    Retrieval of the dense projectors, without the process-wide registry (mapped
+    from the user cache), and decoding of the stored projectors which it avoids.
+    """
+    params = ([2, 3, 4, 5, 6], [2, 3])
+    param_names = ['degree', 'dimension']
+
+    def setup(self, degree, dimension):
+        SchurTransform().get_projectors(dimension, degree, engine=ProjectionEngine.OPERATOR)
+
+    def time_retrieve_projectors(self, degree, dimension):
+        clear_registry()
+        SchurTransform().get_projectors(dimension, degree, engine=ProjectionEngine.OPERATOR)
+
+    def peakmem_retrieve_projectors(self, degree, dimension):
+        clear_registry()
+        SchurTransform().get_projectors(dimension, degree, engine=ProjectionEngine.OPERATOR)
+
+    def time_decode_projectors(self, degree, dimension):
+        SchurTransform().read_stored_projectors(dimension=dimension, degree=degree)
+
+
+class LungExample:
+    """
+    The bundled lung 4DCT example (5 cases, 6 time steps, 75 points in dimension 3).
+    """
+    params = (['NORMS', 'CONTENT', 'MEAN_CONTENT', 'VARIANCE_CONTENT'],)
+    param_names = ['summary']
+
+    def setup(self, summary):
+        self.data = load_lung_example()
+        self.number_of_factors = None if summary == 'NORMS' else 3
+
+    def time_transform(self, summary):
+        st.transform(samples=self.data, summary=summary, number_of_factors=self.number_of_factors)
+
+    def peakmem_transform(self, summary):
+        st.transform(samples=self.data, summary=summary, number_of_factors=self.number_of_factors)
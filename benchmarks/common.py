@@ -0,0 +1,46 @@
+import numpy as np
+
+import schurtransform as st
+
+
+def generate_registered_points(
+    number_of_series: int=None,
+    number_of_samples: int=None,
+    dimension: int=None,
+    seed: int=0,
+):
+    """
+    :return: Synthetic "registered" spatial samples, an array with axes (series,
+        sample, spatial coordinate). A random point cloud is moved by a smooth
+        displacement field which changes a little from each series (time step) to
+        the next, resembling the lung 4DCT example.
+    :rtype: numpy.array
+    """
+    rng = np.random.default_rng(seed)
+    points = rng.normal(size=(number_of_samples, dimension))
+    frequencies = rng.normal(size=(dimension, dimension))
+    samples = []
+    for series in range(number_of_series):
+        phase = 2 * np.pi * series / max(number_of_series, 1)
+        displacement = 0.1 * np.sin(np.matmul(points, frequencies) + phase)
+        noise = 0.01 * rng.normal(size=points.shape)
+        samples.append(points + displacement + noise)
+    return np.array(samples)
+
+
+def load_lung_example():
+    """
+    :return: The lung 4DCT example data, as a dictionary of arrays of shape
+        (6, 75, 3) keyed by case number.
+    :rtype: dict
+    """
+    data = st.get_example_data('lung 4DCT')
+    return {case : np.array([np.asarray(frame) for frame in frames]) for case, frames in data.items()}
+
+
+def clear_registry():
+    """
+    Empties the process-wide registry, so that projectors are retrieved again.
+    """
+    from schurtransform.registry import get_registry
+    get_registry().clear()
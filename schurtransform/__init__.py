@@ -1,12 +1,30 @@
-
 from .schur_transform import SchurTransform
-from .examples import get_example_data
-from .plotting import create_figure
 
 global_transformer = SchurTransform()
 
+_lazy_attributes = {
+    'get_example_data' : '.examples',
+    'create_figure' : '.plotting',
+}
+
 def transform(samples, **kwargs):
     """
     See :py:meth:`.schur_transform.SchurTransform.transform`.
     """
     return global_transformer.transform(samples, **kwargs)
+
+def __getattr__(name):
+    """
+    Imports the example data and plotting functions on first use, since they depend
+    on pandas, matplotlib, and seaborn, which are not needed for the transform.
+    """
+    if name in _lazy_attributes:
+        import importlib
+        module = importlib.import_module(_lazy_attributes[name], __name__)
+        value = getattr(module, name)
+        globals()[name] = value
+        return value
+    raise AttributeError('module %r has no attribute %r' % (__name__, name))
+
+def __dir__():
+    return sorted(list(globals().keys()) + list(_lazy_attributes.keys()))
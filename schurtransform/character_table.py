@@ -1,18 +1,17 @@
-import itertools
-import importlib.resources
-from functools import lru_cache
-import re
-
-import pandas as pd
-
-from . import character_tables
+from .symmetric_group import calculate_character_table
+from .symmetric_group import parse_partition_string
+from .symmetric_group import generate_class_permutations
+from .registry import get_registry
 from .log_formats import colorized_logger
 logger = colorized_logger(__name__)
 
 
 class CharacterTable:
     """
-    Wrapper over a GAP-provided symmetric group character table.
+    Wrapper over a symmetric group character table, calculated by the
+    Murnaghan–Nakayama rule (see :py:mod:`.symmetric_group`). The labels and order of
+    the characters and conjugacy classes are those of the GAP-provided tables
+    distributed with the library.
     """
     def __init__(self,
         degree: int=None,
@@ -25,28 +24,13 @@ class CharacterTable:
         if self.degree < 2:
             logger.error('Need degree > 1, got %s.', degree)
             return
-        if self.degree > 8:
-            logger.error('Regeneration not supported yet (only degrees up to 8 are distributed with the library; see "generate_characters.sh").')
-            return
-
-        with importlib.resources.path(character_tables, 's' + str(degree) + '.csv') as path:
-            character_table = pd.read_csv(path, index_col=0)
-
-        with importlib.resources.path(character_tables, 'symmetric_group_conjugacy_classes.csv') as path:
-            conjugacy_classes = pd.read_csv(path, index_col=False)
 
-        conjugacy_classes = conjugacy_classes[conjugacy_classes['Symmetric group'] == 'S' + str(self.degree)]
-        self.conjugacy_class_sizes = {}
-        for i, row in conjugacy_classes.iterrows():
-            self.conjugacy_class_sizes[row['Partition']] = row['Conjugacy class size']
-
-        self.conjugacy_class_representatives = [str(entry) for entry in list(conjugacy_classes['Partition'])]
-
-        self.characters = {}
-        for index, row in character_table.iterrows():
-            self.characters[index] = {
-                key : row[key] for key in row.keys()
-            }
+        labels, class_sizes, characters = calculate_character_table(self.degree)
+        self.conjugacy_class_sizes = dict(class_sizes)
+        self.conjugacy_class_representatives = list(labels)
+        self.characters = {
+            key : dict(character) for key, character in characters.items()
+        }
 
     def get_conjugacy_class_representatives(self):
         return self.conjugacy_class_representatives
@@ -65,19 +49,19 @@ class CharacterTable:
         if sorted(permutation) != [i + 1 for i in range(len(permutation))]:
             logger.error('Permutation must be in positive-integer value-list format.')
             return
-        by_index = {i : permutation[i]-1 for i in range(len(permutation))}
-        cycles = []
-        while len(by_index) > 0:
-            index = list(by_index)[0]
-            cycle = [by_index[index]]
-            next_index = by_index[cycle[-1]]
-            while not next_index in cycle:
-                cycle.append(next_index)
-                next_index = by_index[cycle[-1]]
-            cycles.append(cycle)
-            for entry in cycle:
-                del by_index[entry]
-        return tuple(sorted([len(cycle) for cycle in cycles]))
+        visited = [False] * len(permutation)
+        lengths = []
+        for start in range(len(permutation)):
+            if visited[start]:
+                continue
+            length = 0
+            index = start
+            while not visited[index]:
+                visited[index] = True
+                index = permutation[index] - 1
+                length += 1
+            lengths.append(length)
+        return tuple(sorted(lengths))
 
     def get_identity_partition_string(self):
         """
@@ -95,38 +79,55 @@ class CharacterTable:
         """
         return self.characters
 
-    @lru_cache(maxsize=1)
     def get_conjugacy_classes(self):
         """
-        (This function is wrapped by functools.lru_cache.)
-        
-        :return: The literal conjugacy classes of permutations of the given degree. The
+        (The result is kept in the process-wide registry; see :py:mod:`.registry`.)
+
+        :return: The literal conjugacy classes of permutations of the given degree,
+            each generated directly from its cycle type (see
+            :py:func:`.symmetric_group.generate_class_permutations`). The
             keys are '+'-delimited integer partition strings (as given in the character
             tables), and values are the permutations in the indicated conjugacy class.
             The format of the permutations is a sequence of positive integer function
             values.
         :rtype: dict
         """
-        partition_strings = self.conjugacy_class_representatives
-        partition_strings_by_partition = {
-            tuple(sorted([
-                int(entry) for entry in partition_string.split('+')
-            ])) : partition_string for partition_string in partition_strings
-        }
-        permutations_by_partition_string = {
-            partition_string : [] for partition_string in partition_strings
-        }
-        permutations = list(itertools.permutations([i+1 for i in range(self.degree)]))
-        for permutation in permutations:
-            partition = self.partition_from_permutation(permutation)
-            partition_string = partition_strings_by_partition[partition]
-            permutations_by_partition_string[partition_string].append(permutation)
+        return get_registry().get(
+            kind='conjugacy_classes',
+            degree=self.degree,
+            factory=self.calculate_conjugacy_classes,
+        )
 
-        for partition_string, conjugacy_class in permutations_by_partition_string.items():
+    def calculate_conjugacy_classes(self):
+        """
+        :return: As in :py:meth:`get_conjugacy_classes`, without the registry.
+        :rtype: dict
+        """
+        conjugacy_classes = {}
+        for partition_string in self.conjugacy_class_representatives:
+            conjugacy_class = sorted(generate_class_permutations(
+                parse_partition_string(partition_string)
+            ))
             if len(conjugacy_class) != self.conjugacy_class_sizes[partition_string]:
                 logger.error("Found %s permutations of certain class, expected %s.",
                     len(conjugacy_class),
-                    self.conjugacy_class_sizes[cycle_type],
+                    self.conjugacy_class_sizes[partition_string],
                 )
+            conjugacy_classes[partition_string] = conjugacy_class
+        return conjugacy_classes
 
-        return {key : sorted(value) for key, value in permutations_by_partition_string.items()}
+
+def get_character_table(degree: int=None):
+    """
+    :param degree: The degree of the symmetric group.
+    :type degree: int
+
+    :return: The character table, created at most once per process (see
+        :py:mod:`.registry`).
+    :rtype: CharacterTable
+    """
+    return get_registry().get(
+        kind='character_table',
+        degree=degree,
+        factory=lambda: CharacterTable(degree=degree),
+    )
@@ -1,7 +1,5 @@
 import importlib.resources
 
-import pandas as pd
-
 from .. import lung_data
 
 def get_example_data(dataset: str=None):
@@ -15,6 +13,8 @@ def get_example_data(dataset: str=None):
         points registered across 6 time steps.
     :rtype: list
     """
+    import pandas as pd
+
     with importlib.resources.path(package=lung_data, resource='examples_manifest.csv') as path:
         lung_file_metadata = pd.read_csv(path)
 
@@ -0,0 +1,76 @@
+import numpy as np
+
+
+def calculate_gram_matrices(samples):
+    """
+    :param samples: Array with axes (series, sample, spatial coordinate), typically
+        recentered at the mean.
+    :type samples: numpy.array
+
+    :return: The cross-series Gram matrices, an array G of shape
+        (series, series, sample, sample) with G[i, k, j, l] = ⟨x_i^j, x_k^l⟩.
+    :rtype: numpy.array
+    """
+    return np.transpose(np.tensordot(samples, samples, axes=([2], [2])), (0, 2, 1, 3))
+
+
+def calculate_product_inner_product(gram_matrices, axes):
+    """
+    For T = Σ_j x_1^j ⊗ ... ⊗ x_n^j, the inner product of T with its image under a
+    permutation of the tensor factors is
+
+        ⟨T, σT⟩ = Σ_{j,l} Π_i ⟨x_i^j, x_{σ(i)}^l⟩,
+
+    which is calculated from the Gram matrices without forming T.
+
+    :param gram_matrices: As returned by :py:func:`calculate_gram_matrices`.
+    :type gram_matrices: numpy.array
+
+    :param axes: The permutation, in the format of an axes argument to
+        ``numpy.transpose`` (see
+        :py:meth:`.permutation_projectors.PermutationProjectors.axes_of_permutation`).
+    :type axes: tuple
+
+    :return: The inner product ⟨T, σT⟩.
+    :rtype: float
+    """
+    product = gram_matrices[0, axes[0]].copy()
+    for i in range(1, len(axes)):
+        product *= gram_matrices[i, axes[i]]
+    return np.sum(product)
+
+
+def calculate_class_inner_products(gram_matrices, projectors):
+    """
+    :param gram_matrices: As returned by :py:func:`calculate_gram_matrices`.
+    :type gram_matrices: numpy.array
+
+    :param projectors: The projectors, whose conjugacy classes of permutations are
+        used.
+    :type projectors: PermutationProjectors
+
+    :return: The values Σ_{σ∈C} ⟨T, σT⟩ for each conjugacy class C, in the same
+        format as
+        :py:meth:`.permutation_projectors.PermutationProjectors.calculate_class_inner_products`.
+    :rtype: numpy.array
+    """
+    return np.array([
+        sum(
+            calculate_product_inner_product(gram_matrices, axes)
+            for axes in projectors.class_axes[partition_string]
+        ) for partition_string in projectors.conjugacy_class_labels
+    ])
+
+
+def calculate_squared_norm(gram_matrices):
+    """
+    :param gram_matrices: As returned by :py:func:`calculate_gram_matrices`.
+    :type gram_matrices: numpy.array
+
+    :return: The squared norm ⟨T, T⟩ of the joint moment tensor T.
+    :rtype: float
+    """
+    return calculate_product_inner_product(
+        gram_matrices,
+        tuple(range(gram_matrices.shape[0])),
+    )
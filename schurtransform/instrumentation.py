@@ -0,0 +1,201 @@
+import time
+import tracemalloc
+from contextvars import ContextVar
+from functools import wraps
+
+from .log_formats import colorized_logger
+logger = colorized_logger(__name__)
+
+_current_instrumentation = ContextVar('schurtransform_instrumentation', default=None)
+
+
+class Instrumentation:
+    """
+    Collects, for each stage of a computation (e.g. ``'centering'``), the number of
+    calls, the total wall time, and optionally the peak memory allocated during the
+    stage (above the allocation at the start of the stage, as traced by
+    ``tracemalloc``). A stage entered again while it is already running (e.g. by
+    recursion) is counted only once.
+
+    Instrumentation is activated for the current thread (and context) with
+    :py:meth:`.schur_transform.SchurTransform.instrument`. Work done in other
+    threads or processes (e.g. by parallel workers) is not broken down into stages;
+    it appears as part of the stage which waits for it.
+    """
+    def __init__(self, trace_memory: bool=False):
+        """
+        :param trace_memory: If True, the peak allocated bytes of each stage are
+            recorded. This starts ``tracemalloc`` if it is not already tracing, which
+            slows down allocation considerably.
+        :type trace_memory: bool
+        """
+        self.trace_memory = trace_memory
+        self.stages = {}
+        self.active = []
+        self.memory_stack = []
+        self.cache = {}
+        self.started_tracing = False
+
+    def start(self):
+        if self.trace_memory and not tracemalloc.is_tracing():
+            tracemalloc.start()
+            self.started_tracing = True
+
+    def stop(self):
+        if self.started_tracing:
+            tracemalloc.stop()
+            self.started_tracing = False
+
+    def get_stage_record(self, name: str=None):
+        if not name in self.stages:
+            self.stages[name] = {'calls' : 0, 'seconds' : 0.0, 'peak_bytes' : None}
+        return self.stages[name]
+
+    def enter(self, name: str=None):
+        if name in self.active:
+            self.active.append(None)
+            return
+        self.active.append(name)
+        if self.trace_memory and tracemalloc.is_tracing():
+            current, peak = tracemalloc.get_traced_memory()
+            if len(self.memory_stack) > 0:
+                self.memory_stack[-1][1] = max(self.memory_stack[-1][1], peak)
+            tracemalloc.reset_peak()
+            self.memory_stack.append([current, current])
+        self.get_stage_record(name)['start'] = time.perf_counter()
+
+    def exit(self, name: str=None):
+        if self.active.pop() is None:
+            return
+        record = self.stages[name]
+        record['seconds'] += time.perf_counter() - record.pop('start')
+        record['calls'] += 1
+        if self.trace_memory and tracemalloc.is_tracing() and len(self.memory_stack) > 0:
+            _, peak = tracemalloc.get_traced_memory()
+            start, running_peak = self.memory_stack.pop()
+            peak = max(peak, running_peak)
+            record['peak_bytes'] = max(record['peak_bytes'] or 0, peak - start)
+            if len(self.memory_stack) > 0:
+                self.memory_stack[-1][1] = max(self.memory_stack[-1][1], peak)
+
+    def get_report(self):
+        """
+        :return: A dictionary with keys ``stages`` (for each stage, the number of
+            ``calls``, the total ``seconds``, and ``peak_bytes`` or None if memory was
+            not traced) and ``cache`` (the hits, misses, and evictions of the
+            process-wide registry during the instrumented run; see
+            :py:mod:`.registry`).
+        :rtype: dict
+        """
+        return {
+            'stages' : {
+                name : {key : value for key, value in record.items() if key != 'start'}
+                for name, record in self.stages.items()
+            },
+            'cache' : self.cache,
+        }
+
+    def get_metrics(self, prefix: str='schurtransform'):
+        """
+        :return: The report flattened into a dictionary of numbers with dotted names
+            (e.g. ``schurtransform.stage.centering.seconds``), for export to a metrics
+            system.
+        :rtype: dict
+        """
+        metrics = {}
+        for name, record in self.get_report()['stages'].items():
+            for key, value in record.items():
+                if value is not None:
+                    metrics['.'.join([prefix, 'stage', name, key])] = value
+        for key in ['hits', 'misses', 'evictions']:
+            if key in self.cache:
+                metrics['.'.join([prefix, 'cache', key])] = self.cache[key]
+        return metrics
+
+
+class Stage:
+    """
+    Context manager measuring one stage with the active :py:class:`Instrumentation`.
+    """
+    def __init__(self, instrumentation: Instrumentation=None, name: str=None):
+        self.instrumentation = instrumentation
+        self.name = name
+
+    def __enter__(self):
+        self.instrumentation.enter(self.name)
+        return self
+
+    def __exit__(self, exception_type, exception, traceback):
+        self.instrumentation.exit(self.name)
+        return False
+
+
+class NullStage:
+    """
+    Context manager doing nothing, used when instrumentation is not active.
+    """
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exception_type, exception, traceback):
+        return False
+
+
+null_stage = NullStage()
+
+
+def get_instrumentation():
+    """
+    :return: The active :py:class:`Instrumentation`, or None.
+    :rtype: Instrumentation
+    """
+    return _current_instrumentation.get()
+
+
+def set_instrumentation(instrumentation: Instrumentation=None):
+    """
+    :return: A token with which to restore the previous state with
+        :py:func:`reset_instrumentation`.
+    """
+    return _current_instrumentation.set(instrumentation)
+
+
+def reset_instrumentation(token):
+    _current_instrumentation.reset(token)
+
+
+def measure(name: str=None):
+    """
+    :param name: The stage name.
+    :type name: str
+
+    :return: A context manager measuring the enclosed code as the given stage if
+        instrumentation is active, or a shared no-op context manager otherwise.
+    """
+    instrumentation = _current_instrumentation.get()
+    if instrumentation is None:
+        return null_stage
+    return Stage(instrumentation, name)
+
+
+def instrumented(name: str=None):
+    """
+    Decorator measuring each call of the function as the given stage, if
+    instrumentation is active. Otherwise the only cost is one context variable lookup.
+
+    :param name: The stage name.
+    :type name: str
+    """
+    def decorator(function):
+        @wraps(function)
+        def wrapper(*args, **kwargs):
+            instrumentation = _current_instrumentation.get()
+            if instrumentation is None:
+                return function(*args, **kwargs)
+            instrumentation.enter(name)
+            try:
+                return function(*args, **kwargs)
+            finally:
+                instrumentation.exit(name)
+        return wrapper
+    return decorator
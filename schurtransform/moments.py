@@ -0,0 +1,325 @@
+from itertools import combinations
+
+import numpy as np
+
+from .tensor import Tensor
+from .instrumentation import instrumented
+
+
+def khatri_rao_product(left, right):
+    """
+    The Khatri-Rao product (column-wise Kronecker product) of two matrices with the
+    same number of columns. Any leading axes are treated as batch axes.
+
+    :param left: Array of shape (..., p, number of samples).
+    :type left: numpy.array
+
+    :param right: Array of shape (..., q, number of samples).
+    :type right: numpy.array
+
+    :return: Array of shape (..., p * q, number of samples) whose column j is the
+        flattened outer product of column j of ``left`` with column j of ``right``.
+    :rtype: numpy.array
+    """
+    product = left[..., :, np.newaxis, :] * right[..., np.newaxis, :, :]
+    return product.reshape(product.shape[:-3] + (-1, product.shape[-1]))
+
+
+def khatri_rao_chain(factors):
+    """
+    :param factors: A non-empty sequence of arrays, each of shape
+        (..., dimension, number of samples).
+    :type factors: list
+
+    :return: The successive Khatri-Rao product of the factors, an array of shape
+        (..., dimension ** len(factors), number of samples).
+    :rtype: numpy.array
+    """
+    product = factors[0]
+    for factor in factors[1:]:
+        product = khatri_rao_product(product, factor)
+    return product
+
+
+def calculate_joint_moment(samples):
+    """
+    Vectorized calculation of the (uncentered) joint moment sum
+
+        T = Σ_j x_1^j ⊗ x_2^j ⊗ ... ⊗ x_n^j
+
+    over the samples j. The first half of the series are combined by successive
+    Khatri-Rao products, as are the second half, and the two resulting matrices are
+    contracted over the sample index with a single matrix product. (The products are
+    formed with the sample index as the last, contiguous, axis.)
+
+    :param samples: Array with axes (series, sample, spatial coordinate).
+    :type samples: numpy.array
+
+    :return: The joint moment, an array of shape [dimension] * (number of series).
+    :rtype: numpy.array
+    """
+    return calculate_joint_moments(samples[np.newaxis])[0]
+
+
+def calculate_joint_moments(samples):
+    """
+    Batched version of :py:func:`calculate_joint_moment`, for a stack of sample sets
+    of the same shape (e.g. one for each of a block of index combinations). The
+    final contraction over the sample index is one batched matrix product.
+
+    :param samples: Array with axes (batch, series, sample, spatial coordinate).
+    :type samples: numpy.array
+
+    :return: The joint moments, an array of shape
+        [batch size] + [dimension] * (number of series).
+    :rtype: numpy.array
+    """
+    batch_size = samples.shape[0]
+    number_of_series = samples.shape[1]
+    dimension = samples.shape[3]
+    if number_of_series == 1:
+        return np.sum(samples[:, 0], axis=1)
+    factors = np.ascontiguousarray(np.swapaxes(samples, 2, 3))
+    split = number_of_series // 2
+    left = khatri_rao_chain([factors[:, i] for i in range(split)])
+    right = khatri_rao_chain([factors[:, i] for i in range(split, number_of_series)])
+    moments = np.matmul(left, np.swapaxes(right, -1, -2))
+    return moments.reshape([batch_size] + [dimension] * number_of_series)
+
+
+class SlidingWindowMoments:
+    """
+    Calculates the joint moments of consecutive windows of a sequence of (recentered)
+    sample frames, reusing the Khatri-Rao products shared by overlapping windows.
+
+    The frames in the current window are held in two stacks. The "back" stack holds
+    the most recent frames and their running Khatri-Rao product. The "front" stack
+    holds the Khatri-Rao products of every suffix of the older frames. When the
+    oldest frame leaves the window and the front stack is empty, the back stack is
+    converted into suffix products. So each frame takes part in an amortized
+    constant number of Khatri-Rao products, and the moment of each window is one
+    matrix product of the front and back aggregates. Memory does not depend on the
+    number of frames.
+    """
+    def __init__(self, window_size: int=None):
+        """
+        :param window_size: The number of consecutive frames in each window (the
+            number of tensor factors of the moments).
+        :type window_size: int
+        """
+        self.window_size = window_size
+        self.front = []
+        self.back = []
+        self.back_product = None
+        self.dimension = None
+
+    @instrumented('moments')
+    def push(self, frame):
+        """
+        :param frame: The next frame, an array of shape (sample, spatial coordinate),
+            typically recentered at its mean.
+        :type frame: numpy.array
+
+        :return: If the window is full after adding the frame, the joint moment of the
+            window (as in :py:func:`calculate_joint_moment`). Otherwise None.
+        :rtype: numpy.array
+        """
+        factor = np.ascontiguousarray(np.transpose(frame))
+        self.dimension = factor.shape[0]
+        self.back.append(factor)
+        if self.back_product is None:
+            self.back_product = factor
+        else:
+            self.back_product = khatri_rao_product(self.back_product, factor)
+        if len(self.front) + len(self.back) > self.window_size:
+            self.pop()
+        if len(self.front) + len(self.back) < self.window_size:
+            return None
+        return self.get_moment()
+
+    def pop(self):
+        """
+        Removes the oldest frame from the window.
+        """
+        if len(self.front) == 0:
+            suffix_product = None
+            for factor in reversed(self.back):
+                if suffix_product is None:
+                    suffix_product = factor
+                else:
+                    suffix_product = khatri_rao_product(factor, suffix_product)
+                self.front.append(suffix_product)
+            self.back = []
+            self.back_product = None
+        self.front.pop()
+
+    def get_moment(self):
+        """
+        :return: The joint moment of the frames currently in the window.
+        :rtype: numpy.array
+        """
+        shape = [self.dimension] * (len(self.front) + len(self.back))
+        if len(self.front) == 0:
+            return np.sum(self.back_product, axis=1).reshape(shape)
+        if len(self.back) == 0:
+            return np.sum(self.front[-1], axis=1).reshape(shape)
+        return np.matmul(self.front[-1], np.transpose(self.back_product)).reshape(shape)
+
+
+class MomentAccumulator:
+    """
+    Accumulates the centered joint moment of several series of samples from chunks
+    of samples, without retaining the samples.
+
+    For every subset S of the series (of size at least 2), the centered moment sum
+
+        M^S = Σ_j ⊗_{i∈S} (x_i^j - μ_i)
+
+    is kept, together with the number of samples and the means μ. Each chunk is
+    reduced to the same quantities about its own means, and then merged with the
+    running totals by the pairwise update of Chan et al. (generalized to joint
+    moments of arbitrary order). Since x - μ = (x - μ_A) + (μ_A - μ), the centered
+    moment of a part A about the combined mean is a sum, over subsets R of S, of the
+    moments M_A^R multiplied by the mean shifts of the series in S - R. Only
+    centered quantities are ever summed, which keeps the accumulation numerically
+    stable.
+    """
+    def __init__(self,
+        number_of_series: int=None,
+        dimension: int=None,
+    ):
+        """
+        :param number_of_series: The number of series (random variables), i.e. the
+            number of tensor factors of the joint moment.
+        :type number_of_series: int
+
+        :param dimension: The spatial dimension.
+        :type dimension: int
+        """
+        self.number_of_series = number_of_series
+        self.dimension = dimension
+        self.count = 0
+        self.means = np.zeros((number_of_series, dimension))
+        self.subsets = [
+            subset for size in range(2, number_of_series + 1)
+            for subset in combinations(range(number_of_series), size)
+        ]
+        self.moments = {
+            subset : np.zeros([dimension] * len(subset)) for subset in self.subsets
+        }
+
+    @instrumented('moments')
+    def update(self, chunks):
+        """
+        :param chunks: Either one chunk of samples, an array with axes (series,
+            sample, spatial coordinate), or an iterable (e.g. a generator) of such
+            chunks.
+        :type chunks: numpy.array or iterable
+        """
+        if isinstance(chunks, np.ndarray) and len(chunks.shape) == 3:
+            chunks = [chunks]
+        for chunk in chunks:
+            chunk = np.asarray(chunk, dtype=np.float64)
+            if chunk.shape[1] == 0:
+                continue
+            self.merge(MomentAccumulator.from_chunk(chunk))
+
+    @staticmethod
+    def from_chunk(chunk):
+        """
+        :param chunk: Array with axes (series, sample, spatial coordinate).
+        :type chunk: numpy.array
+
+        :return: The accumulator of exactly the samples of the chunk.
+        :rtype: MomentAccumulator
+        """
+        accumulator = MomentAccumulator(
+            number_of_series=chunk.shape[0],
+            dimension=chunk.shape[2],
+        )
+        accumulator.count = chunk.shape[1]
+        accumulator.means = np.mean(chunk, axis=1)
+        centered = chunk - accumulator.means[:, np.newaxis, :]
+        for subset in accumulator.subsets:
+            accumulator.moments[subset] = calculate_joint_moment(centered[list(subset)])
+        return accumulator
+
+    def merge(self, other):
+        """
+        Merges the samples accumulated by another accumulator into this one.
+
+        :param other: An accumulator for the same number of series and dimension.
+        :type other: MomentAccumulator
+        """
+        if other.count == 0:
+            return
+        if self.count == 0:
+            self.count = other.count
+            self.means = other.means.copy()
+            self.moments = {subset : moment.copy() for subset, moment in other.moments.items()}
+            return
+        count = self.count + other.count
+        means = self.means + (other.count / count) * (other.means - self.means)
+        shifts = [self.means - means, other.means - means]
+        parts = [self, other]
+        self.moments = {
+            subset : sum(
+                MomentAccumulator.shift_moment(part, subset, shift)
+                for part, shift in zip(parts, shifts)
+            ) for subset in self.subsets
+        }
+        self.count = count
+        self.means = means
+
+    @staticmethod
+    def shift_moment(accumulator, subset, shift):
+        """
+        :param accumulator: The accumulator of one part of the samples.
+        :type accumulator: MomentAccumulator
+
+        :param subset: The series indices of the moment.
+        :type subset: tuple
+
+        :param shift: The differences between the means of the part and the new
+            means, one row per series.
+        :type shift: numpy.array
+
+        :return: The moment M^S of the part's samples, centered at the new means.
+        :rtype: numpy.array
+        """
+        letters = [chr(ord('a') + i) for i in range(len(subset))]
+        output = ''.join(letters)
+        total = np.zeros([accumulator.dimension] * len(subset))
+        for size in range(0, len(subset) + 1):
+            if size == 1:
+                continue
+            for positions in combinations(range(len(subset)), size):
+                if size == 0:
+                    operands = [np.array(accumulator.count, dtype=np.float64)]
+                    subscripts = ['']
+                else:
+                    inner = tuple(subset[p] for p in positions)
+                    operands = [accumulator.moments[inner]]
+                    subscripts = [''.join(letters[p] for p in positions)]
+                for p in range(len(subset)):
+                    if not p in positions:
+                        operands.append(shift[subset[p]])
+                        subscripts.append(letters[p])
+                total += np.einsum(','.join(subscripts) + '->' + output, *operands)
+        return total
+
+    def get_tensor(self):
+        """
+        :return: The centered joint moment of all of the series, over all of the
+            accumulated samples.
+        :rtype: Tensor
+        """
+        if self.number_of_series == 1:
+            data = np.zeros([self.dimension])
+        else:
+            data = self.moments[tuple(range(self.number_of_series))].copy()
+        return Tensor(
+            number_of_factors=self.number_of_series,
+            dimension=self.dimension,
+            data=data,
+        )
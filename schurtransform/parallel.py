@@ -0,0 +1,404 @@
+import os
+import threading
+from math import comb
+from multiprocessing import shared_memory
+
+import numpy as np
+
+from .tensor_operator import TensorOperator
+from .sample_files import resolve_sample_reference
+from .validation import Validator
+from .symmetric_group import get_partition_strings
+from .symmetric_group import is_vanishing_partition
+from .validation import activate_validator
+from .log_formats import colorized_logger
+logger = colorized_logger(__name__)
+
+_worker_state = {}
+
+
+def unrank_combination(rank: int=None, number_of_elements: int=None, size: int=None):
+    """
+    :param rank: The position of a combination in the lexicographic order used by
+        ``itertools.combinations``.
+    :type rank: int
+
+    :param number_of_elements: The number of elements chosen from, ``0, 1, ...``.
+    :type number_of_elements: int
+
+    :param size: The number of elements in each combination.
+    :type size: int
+
+    :return: The combination with the given rank.
+    :rtype: tuple
+    """
+    combination = []
+    element = 0
+    for remaining in range(size, 0, -1):
+        while True:
+            count = comb(number_of_elements - element - 1, remaining - 1)
+            if rank < count:
+                break
+            rank -= count
+            element += 1
+        combination.append(element)
+        element += 1
+    return tuple(combination)
+
+
+def rank_combination(combination, number_of_elements: int=None):
+    """
+    :param combination: An increasing sequence of elements of ``0, 1, ...``.
+    :type combination: tuple
+
+    :param number_of_elements: The number of elements chosen from.
+    :type number_of_elements: int
+
+    :return: The position of the combination in the lexicographic order used by
+        ``itertools.combinations``. Inverse to :py:func:`unrank_combination`.
+    :rtype: int
+    """
+    rank = 0
+    previous = -1
+    size = len(combination)
+    for i, element in enumerate(combination):
+        for skipped in range(previous + 1, element):
+            rank += comb(number_of_elements - skipped - 1, size - i - 1)
+        previous = element
+    return rank
+
+
+def combinations_from_rank(number_of_elements: int=None, size: int=None, start: int=None, stop: int=None):
+    """
+    Generates the combinations with ranks from ``start`` (inclusive) to ``stop``
+    (exclusive), without generating the preceding combinations.
+
+    :return: Generator of combinations, as tuples.
+    :rtype: generator
+    """
+    if start >= stop:
+        return
+    combination = list(unrank_combination(start, number_of_elements, size))
+    for _ in range(start, stop):
+        yield tuple(combination)
+        i = size - 1
+        while i >= 0 and combination[i] == number_of_elements - size + i:
+            i -= 1
+        if i < 0:
+            return
+        combination[i] += 1
+        for j in range(i + 1, size):
+            combination[j] = combination[j - 1] + 1
+
+
+def shard_ranks(total: int=None, number_of_shards: int=None):
+    """
+    :param total: The number of items to be split.
+    :type total: int
+
+    :param number_of_shards: The requested number of shards.
+    :type number_of_shards: int
+
+    :return: Contiguous, non-empty (start, stop) rank ranges covering ``0`` to
+        ``total``, of sizes differing by at most 1. The result depends only on the
+        arguments.
+    :rtype: list
+    """
+    number_of_shards = max(1, min(number_of_shards, total))
+    quotient, remainder = divmod(total, number_of_shards)
+    shards = []
+    start = 0
+    for i in range(number_of_shards):
+        stop = start + quotient + (1 if i < remainder else 0)
+        if stop > start:
+            shards.append((start, stop))
+        start = stop
+    return shards
+
+
+class SharedArrays:
+    """
+    A collection of named numpy arrays published once, in a single
+    ``multiprocessing.shared_memory`` block, so that worker processes can attach to
+    them without copying or unpickling.
+    """
+    alignment = 64
+
+    def __init__(self, arrays: dict=None):
+        """
+        :param arrays: Keys are names (str), values are arrays. The arrays are copied
+            into the shared memory block.
+        :type arrays: dict
+        """
+        self.layout = {}
+        offset = 0
+        for name, array in arrays.items():
+            array = np.asarray(array)
+            self.layout[name] = (offset, array.shape, array.dtype.str)
+            offset += -(-array.nbytes // SharedArrays.alignment) * SharedArrays.alignment
+        self.memory = None
+        if len(self.layout) == 0:
+            return
+        self.memory = shared_memory.SharedMemory(create=True, size=max(offset, 1))
+        views = {}
+        for name, array in arrays.items():
+            view = SharedArrays.view(self.memory, self.layout[name])
+            view[...] = array
+            view.flags.writeable = False
+            views[name] = view
+        _worker_state.setdefault('shared', {})[self.memory.name] = (self.memory, views, os.getpid())
+
+    @staticmethod
+    def view(memory, entry):
+        offset, shape, dtype = entry
+        return np.ndarray(shape, dtype=np.dtype(dtype), buffer=memory.buf, offset=offset)
+
+    def get_reference(self):
+        """
+        :return: A small picklable description from which the arrays can be attached
+            with :py:func:`attach_shared_arrays`. None if there are no arrays.
+        :rtype: dict
+        """
+        if self.memory is None:
+            return None
+        return {'name' : self.memory.name, 'layout' : self.layout}
+
+    def close(self):
+        """
+        Releases and removes the shared memory block. Any projectors which this
+        process created from the shared arrays are discarded.
+        """
+        if self.memory is not None:
+            release_shared_arrays(self.memory.name)
+            self.memory.close()
+            self.memory.unlink()
+            self.memory = None
+
+
+def attach_shared_arrays(reference):
+    """
+    :param reference: As returned by :py:meth:`SharedArrays.get_reference`.
+    :type reference: dict
+
+    :return: Keys are the array names, values are read-only views of the shared
+        arrays. The attachment is made at most once per process (and not at all in
+        the process which created the arrays). Attaching a new block releases the
+        other blocks which this process did not create (attached earlier, or
+        inherited from the parent process by ``fork``; see
+        :py:func:`release_shared_arrays`), which belong to finished calls when the
+        worker processes are reused.
+    :rtype: dict
+    """
+    if reference is None:
+        return {}
+    attached = _worker_state.setdefault('shared', {})
+    if not reference['name'] in attached:
+        for name in [name for name, (_, _, owner) in attached.items() if owner != os.getpid()]:
+            release_shared_arrays(name)
+        memory = shared_memory.SharedMemory(name=reference['name'])
+        arrays = {}
+        for name, entry in reference['layout'].items():
+            array = SharedArrays.view(memory, entry)
+            array.flags.writeable = False
+            arrays[name] = array
+        attached[reference['name']] = (memory, arrays, None)
+    return attached[reference['name']][1]
+
+
+def release_shared_arrays(name: str=None):
+    """
+    Discards this process's views of the shared memory block with the given name,
+    and the projectors created from them.
+    """
+    memory, _, _ = _worker_state.get('shared', {}).pop(name, (None, None, None))
+    projectors_by_key = _worker_state.get('projectors', {})
+    for key in [key for key in projectors_by_key if key[0] == name]:
+        del projectors_by_key[key]
+    if memory is not None:
+        try:
+            memory.close()
+        except BufferError:
+            logger.debug('Views of shared memory block %s are still in use.', name)
+
+
+def format_projector_array_name(degree: int=None, dimension: int=None, partition_string: str=None):
+    return ':'.join(['projector', str(degree), str(dimension), partition_string])
+
+
+def format_samples_array_name(index: int=None):
+    return ':'.join(['samples', str(index)])
+
+
+def get_worker_projectors(
+    degree: int=None,
+    dimension: int=None,
+    engine_name: str=None,
+    shared_reference: dict=None,
+    dtype_name: str='float64',
+):
+    """
+    :param dtype_name: The name of the floating point type of dense projectors
+        which are not published in the shared arrays.
+    :type dtype_name: str
+
+    :param shared_reference: As returned by :py:meth:`SharedArrays.get_reference`.
+        Dense projectors published in the shared arrays (see
+        :py:func:`format_projector_array_name`) are wrapped without copying.
+    :type shared_reference: dict
+
+    :return: The projectors, retrieved at most once per worker process.
+    """
+    from .schur_transform import SchurTransform
+    from .schur_transform import ProjectionEngine
+    shared_arrays = attach_shared_arrays(shared_reference)
+    key = (None if shared_reference is None else shared_reference['name'], degree, dimension, engine_name, dtype_name)
+    projectors_by_key = _worker_state.setdefault('projectors', {})
+    if not key in projectors_by_key:
+        prefix = format_projector_array_name(degree, dimension, '')
+        published = {
+            name[len(prefix):] : array for name, array in shared_arrays.items()
+            if name.startswith(prefix)
+        }
+        if engine_name == ProjectionEngine.OPERATOR.name and len(published) > 0:
+            projectors_by_key[key] = {
+                partition_string : TensorOperator(
+                    number_of_factors=degree,
+                    dimension=dimension,
+                    data=published[partition_string],
+                ) if partition_string in published else TensorOperator.zero(
+                    number_of_factors=degree,
+                    dimension=dimension,
+                    dtype=np.dtype(dtype_name),
+                )
+                for partition_string in get_partition_strings(degree)
+                if partition_string in published or is_vanishing_partition(partition_string, dimension)
+            }
+        else:
+            projectors_by_key[key] = SchurTransform().get_projectors(
+                dimension=dimension,
+                degree=degree,
+                engine=ProjectionEngine[engine_name],
+                dtype=np.dtype(dtype_name),
+            )
+    return projectors_by_key[key]
+
+
+def resolve_task_samples(reference, shared_arrays: dict=None):
+    """
+    :param reference: Either ``{'shared_array' : name}`` for samples published in
+        shared memory, a reference to memory-mapped samples (see
+        :py:func:`.sample_files.get_sample_reference`), or the samples themselves.
+
+    :return: The samples array.
+    :rtype: numpy.array
+    """
+    if isinstance(reference, dict) and 'shared_array' in reference:
+        return shared_arrays[reference['shared_array']]
+    return resolve_sample_reference(reference)
+
+
+def initialize_worker(shared_reference: dict=None, projector_keys: list=None):
+    """
+    Process pool initializer. Attaches the shared arrays and loads the projectors once
+    per worker process.
+
+    :param shared_reference: As returned by :py:meth:`SharedArrays.get_reference`.
+    :type shared_reference: dict
+
+    :param projector_keys: Tuples (degree, dimension, engine name, dtype name) of the
+        projectors which will be needed.
+    :type projector_keys: list
+    """
+    for degree, dimension, engine_name, dtype_name in projector_keys:
+        get_worker_projectors(degree, dimension, engine_name, shared_reference, dtype_name)
+
+
+def run_task(task):
+    """
+    Runs one work item with a validator created from the settings in
+    ``task['validation']`` (see :py:meth:`.validation.Validator.get_settings`),
+    if present. The validator is kept by the worker for subsequent tasks with the
+    same settings, so that the ``SAMPLED`` and ``ONCE`` policies apply per worker
+    (per thread, if the executor runs tasks in threads).
+
+    :param task: As in :py:func:`calculate_task_result`.
+    :type task: dict
+
+    :return: Dictionary with keys ``result`` (as returned by
+        :py:func:`calculate_task_result`) and ``failures`` (the validation failure
+        records of this task).
+    :rtype: dict
+    """
+    settings = task.get('validation') or {}
+    key = (threading.get_ident(),) + tuple(sorted(settings.items()))
+    validators = _worker_state.setdefault('validators', {})
+    if not key in validators:
+        validators[key] = Validator(**settings)
+    validator = validators[key]
+    validator.failures = []
+    with activate_validator(validator):
+        result = calculate_task_result(task)
+    return {'result' : result, 'failures' : validator.failures}
+
+
+def calculate_task_result(task):
+    """
+    Calculates one work item of :py:meth:`.schur_transform.SchurTransform.transform_in_parallel`.
+
+    :param task: Dictionary with keys ``shared`` (the shared arrays reference),
+        ``samples`` (as in :py:func:`resolve_task_samples`), ``degree``,
+        ``engine_name``, ``summary_name``, ``dtype_name``, ``partitions`` and
+        ``remainder`` (as in :py:meth:`.schur_transform.SchurTransform.transform`),
+        and ``kind``. If ``kind`` is ``'whole'``,
+        the ``COMPONENTS`` or ``NORMS`` summary of the samples is calculated. If
+        ``kind`` is ``'shard'``, the task also has keys ``start``, ``stop`` (a range
+        of ranks of index combinations, or of consecutive windows if ``sequential``),
+        ``sequential``, and ``batch_size``, and the content of the shard is
+        calculated.
+    :type task: dict
+
+    :return: The summary, or the content as in
+        :py:meth:`.schur_transform.SchurTransform.calculate_content`.
+    """
+    from .schur_transform import SchurTransform
+    from .schur_transform import ProjectionEngine
+    from .schur_transform import DecompositionSummary
+    shared_arrays = attach_shared_arrays(task['shared'])
+    samples = resolve_task_samples(task['samples'], shared_arrays)
+    degree = task['degree']
+    engine = ProjectionEngine[task['engine_name']]
+    dtype = np.dtype(task['dtype_name'])
+    transformer = SchurTransform()
+    projectors = transformer.select_projectors(
+        get_worker_projectors(degree, samples.shape[2], engine.name, task['shared'], dtype.name),
+        task['partitions'],
+    )
+    if task['kind'] == 'whole':
+        return transformer.decompose_samples(
+            samples,
+            projectors,
+            summary=DecompositionSummary[task['summary_name']],
+            engine=engine,
+            dtype=dtype,
+            remainder=task['remainder'],
+        )
+    if task['sequential']:
+        return transformer.calculate_sequential_content(
+            samples[task['start']:task['stop'] + degree - 1],
+            degree,
+            projectors,
+            engine=engine,
+            batch_size=task['batch_size'],
+            dtype=dtype,
+            remainder=task['remainder'],
+        )
+    index_combinations = combinations_from_rank(samples.shape[0], degree, task['start'], task['stop'])
+    return transformer.calculate_content(
+        samples,
+        index_combinations,
+        projectors,
+        engine=engine,
+        batch_size=task['batch_size'],
+        dtype=dtype,
+        remainder=task['remainder'],
+    )
@@ -0,0 +1,322 @@
+import copy
+from math import factorial
+
+import numpy as np
+
+from .tensor import Tensor
+from .character_table import CharacterTable
+from .character_table import get_character_table
+from .registry import get_registry
+from .symmetric_group import is_vanishing_partition
+from .log_formats import colorized_logger
+logger = colorized_logger(__name__)
+
+
+class PermutationProjectors:
+    """
+    The projectors onto the isotypic components of V⊗...⊗V, represented implicitly
+    as central idempotents of the group algebra of the symmetric group,
+
+        P_λ = (χ_λ(1)/n!) Σ_σ χ_λ(σ) σ,
+
+    rather than as dense :py:class:`.tensor_operator.TensorOperator` objects. Each
+    permutation σ acts on a tensor as a transposition of its axes, so applying all
+    projectors requires memory proportional to d^n rather than d^(2n). Permutations
+    in the same conjugacy class share a character value, so they are summed before
+    the weight is applied.
+
+    When only the norms of the components are needed, the components need not be
+    materialized at all. Since the projectors are orthogonal idempotents,
+
+        ‖P_λ T‖² = ⟨T, P_λ T⟩ = (χ_λ(1)/n!) Σ_C χ_λ(C) Σ_{σ∈C} ⟨T, σT⟩,
+
+    so all of the norms follow from the per-class inner products by one matrix
+    multiplication with the (weighted) character table. (Because the squared norms
+    are computed, a component which is very small relative to T is resolved only to
+    within about √ε‖T‖, for ε the floating point precision.)
+
+    For stacks of tensors, the permutations of each conjugacy class are applied
+    together by gathering with precomputed flat indices, provided the index arrays
+    have at most ``max_index_entries`` entries in total.
+
+    Copies restricted to some of the partitions (see :py:meth:`restrict`), or
+    omitting the components which vanish in a given dimension (see
+    :py:meth:`prune`), share the conjugacy classes. The vanishing components are
+    reported as exact zeros without being calculated.
+    """
+    max_index_entries = pow(2, 22)
+
+    def __init__(self,
+        degree: int=None,
+        character_table: CharacterTable=None,
+    ):
+        """
+        :param degree: The number of factors in the tensor product (the degree of the
+            symmetric group).
+        :type degree: int
+
+        :param character_table: The character table of the symmetric group of the
+            given degree. Created if not provided.
+        :type character_table: CharacterTable
+        """
+        self.degree = degree
+        if character_table is None:
+            character_table = get_character_table(degree)
+        self.character_table = character_table
+        self.class_axes = {
+            partition_string : [
+                PermutationProjectors.axes_of_permutation(permutation)
+                for permutation in conjugacy_class
+            ] for partition_string, conjugacy_class in character_table.get_conjugacy_classes().items()
+        }
+        identity = character_table.get_identity_partition_string()
+        self.weights = {
+            key : {
+                partition_string : character[identity] * character[partition_string] / factorial(degree)
+                for partition_string in self.class_axes
+            } for key, character in character_table.get_characters().items()
+        }
+        self.conjugacy_class_labels = list(self.class_axes.keys())
+        self.partitions = list(self.weights.keys())
+        self.weight_matrix = self.calculate_weight_matrix()
+
+    def calculate_weight_matrix(self):
+        """
+        :return: The weights of the conjugacy classes (in the order of
+            ``conjugacy_class_labels``) for each of the calculated components.
+        :rtype: numpy.array
+        """
+        return np.array([
+            [weights[partition_string] for partition_string in self.conjugacy_class_labels]
+            for weights in self.weights.values()
+        ]).reshape(len(self.weights), len(self.conjugacy_class_labels))
+
+    @staticmethod
+    def axes_of_permutation(permutation):
+        """
+        :param permutation: A permutation in the format of a sequence of positive
+            integer function values (e.g. ``(2, 3, 1)``), regarded as in the
+            ``permutation_inverse`` argument of
+            :py:class:`.tensor_operator.TensorOperator`.
+        :type permutation: tuple
+
+        :return: The axes argument to ``numpy.transpose`` which effects the same
+            operation on a tensor as the corresponding permutation operator.
+        :rtype: tuple
+        """
+        return tuple(int(i) for i in np.argsort([value - 1 for value in permutation]))
+
+    def get_class_flat_indices(self, dimension):
+        """
+        :param dimension: The dimension of the base vector space.
+        :type dimension: int
+
+        :return: For each conjugacy class (in the order of
+            ``conjugacy_class_labels``), an integer array of shape (class size,
+            dimension ** degree) whose rows are the flat indices effecting each of the
+            class's permutations on a flattened tensor. None if this would exceed
+            ``max_index_entries``. (The arrays are kept in the process-wide registry;
+            see :py:mod:`.registry`.)
+        :rtype: list
+        """
+        size = pow(dimension, self.degree)
+        if factorial(self.degree) * size > self.max_index_entries:
+            return None
+        return get_registry().get(
+            kind='class_flat_indices',
+            degree=self.degree,
+            dimension=dimension,
+            dtype=np.int64,
+            factory=lambda: self.calculate_class_flat_indices(dimension),
+        )
+
+    def calculate_class_flat_indices(self, dimension):
+        """
+        :return: As in :py:meth:`get_class_flat_indices`, without the size limit or the
+            registry.
+        :rtype: list
+        """
+        flat_indices = np.arange(pow(dimension, self.degree)).reshape([dimension] * self.degree)
+        return [
+            np.array([
+                np.transpose(flat_indices, axes).ravel()
+                for axes in self.class_axes[partition_string]
+            ]) for partition_string in self.conjugacy_class_labels
+        ]
+
+    def get_partitions(self):
+        """
+        :return: The '+'-delimited integer partition strings labelling the isotypic
+            components.
+        :rtype: list
+        """
+        return list(self.partitions)
+
+    def restrict(self, partitions: list=None):
+        """
+        :param partitions: Some of the partition strings of :py:meth:`get_partitions`.
+        :type partitions: list
+
+        :return: A copy of these projectors which calculates only the components for
+            the given partitions (in the order of :py:meth:`get_partitions`). The
+            conjugacy classes and index arrays are shared.
+        :rtype: PermutationProjectors
+        """
+        restricted = copy.copy(self)
+        restricted.partitions = [key for key in self.partitions if key in partitions]
+        restricted.weights = {
+            key : weights for key, weights in self.weights.items() if key in partitions
+        }
+        restricted.weight_matrix = restricted.calculate_weight_matrix()
+        return restricted
+
+    def prune(self, dimension: int=None):
+        """
+        :param dimension: The dimension of the base vector space.
+        :type dimension: int
+
+        :return: A copy of these projectors which reports the components vanishing in
+            the given dimension (see
+            :py:func:`.symmetric_group.is_vanishing_partition`) as zeros, without
+            calculating them.
+        :rtype: PermutationProjectors
+        """
+        pruned = copy.copy(self)
+        pruned.weights = {
+            key : weights for key, weights in self.weights.items()
+            if not is_vanishing_partition(key, dimension)
+        }
+        pruned.weight_matrix = pruned.calculate_weight_matrix()
+        return pruned
+
+    def calculate_class_sum(self, data, partition_string):
+        """
+        :param data: A tensor's data array.
+        :type data: numpy.array
+
+        :param partition_string: The label of a conjugacy class.
+        :type partition_string: str
+
+        :return: The sum of the permuted copies of ``data``, over the permutations in
+            the given conjugacy class.
+        :rtype: numpy.array
+        """
+        class_sum = np.zeros(data.shape, dtype=data.dtype)
+        for axes in self.class_axes[partition_string]:
+            class_sum += np.transpose(data, axes)
+        return class_sum
+
+    def apply(self,
+        tensor: Tensor=None,
+    ):
+        """
+        :param tensor: Input tensor to be decomposed.
+        :type tensor: Tensor
+
+        :return: Keys are the integer partition strings labelling isotypic components,
+            values are the components of the input tensor, as :py:class:`.tensor.Tensor`
+            objects.
+        :rtype: dict
+        """
+        if tensor.number_of_factors != self.degree:
+            logger.error(
+                'Tensor has %s factors, but projectors are for degree %s.',
+                tensor.number_of_factors,
+                self.degree,
+            )
+            return None
+        components = {
+            key : np.zeros(tensor.data.shape, dtype=tensor.data.dtype)
+            for key in self.partitions
+        }
+        for partition_string in self.class_axes:
+            class_sum = self.calculate_class_sum(tensor.data, partition_string)
+            for key, weights in self.weights.items():
+                weight = weights[partition_string]
+                if weight != 0:
+                    components[key] += weight * class_sum
+        return {
+            key : Tensor(
+                number_of_factors=tensor.number_of_factors,
+                dimension=tensor.dimension,
+                data=data,
+            ) for key, data in components.items()
+        }
+
+    def calculate_class_inner_products(self, data):
+        """
+        :param data: A tensor's data array. Any axes preceding the last ``degree``
+            axes are treated as batch axes (e.g. for a stack of tensors).
+        :type data: numpy.array
+
+        :return: The values Σ_{σ∈C} ⟨T, σT⟩, one for each conjugacy class C (in the
+            order of ``conjugacy_class_labels``), along a trailing axis.
+        :rtype: numpy.array
+        """
+        number_of_batch_axes = len(data.shape) - self.degree
+        batch_axes = tuple(range(number_of_batch_axes))
+        flat_shape = data.shape[:number_of_batch_axes] + (-1,)
+        flattened = data.reshape(flat_shape)
+        class_flat_indices = self.get_class_flat_indices(data.shape[-1])
+        if class_flat_indices is not None:
+            return np.stack([
+                np.einsum('...i,...i->...', flattened, np.sum(flattened[..., indices], axis=-2))
+                for indices in class_flat_indices
+            ], axis=-1)
+        class_inner_products = []
+        for partition_string in self.conjugacy_class_labels:
+            total = np.zeros(data.shape[:number_of_batch_axes], dtype=data.dtype)
+            for axes in self.class_axes[partition_string]:
+                permuted = np.transpose(
+                    data,
+                    batch_axes + tuple(number_of_batch_axes + axis for axis in axes),
+                ).reshape(flat_shape)
+                total += np.einsum('...i,...i->...', flattened, permuted)
+            class_inner_products.append(total)
+        return np.stack(class_inner_products, axis=-1)
+
+    def norms_from_class_inner_products(self, class_inner_products):
+        """
+        :param class_inner_products: As returned by
+            :py:meth:`calculate_class_inner_products`. A trailing axis of conjugacy
+            classes; any leading axes are preserved.
+        :type class_inner_products: numpy.array
+
+        :return: The norms of the isotypic components, with a trailing axis of
+            partitions (in the order of :py:meth:`get_partitions`). Small negative
+            values of the squared norms, due to rounding, are clipped to 0.
+        :rtype: numpy.array
+        """
+        squared_norms = np.matmul(
+            class_inner_products,
+            self.weight_matrix.T.astype(class_inner_products.dtype, copy=False),
+        )
+        norms = np.sqrt(np.clip(squared_norms, 0, None))
+        if len(self.weights) == len(self.partitions):
+            return norms
+        all_norms = np.zeros(norms.shape[:-1] + (len(self.partitions),), dtype=norms.dtype)
+        all_norms[..., [self.partitions.index(key) for key in self.weights]] = norms
+        return all_norms
+
+    def calculate_norms(self,
+        tensor: Tensor=None,
+    ):
+        """
+        :param tensor: Input tensor.
+        :type tensor: Tensor
+
+        :return: Keys are the integer partition strings labelling isotypic components,
+            values are the Euclidean norms of the components of the input tensor.
+        :rtype: dict
+        """
+        if tensor.number_of_factors != self.degree:
+            logger.error(
+                'Tensor has %s factors, but projectors are for degree %s.',
+                tensor.number_of_factors,
+                self.degree,
+            )
+            return None
+        norms = self.norms_from_class_inner_products(
+            self.calculate_class_inner_products(tensor.data)
+        )
+        return dict(zip(self.get_partitions(), norms))
@@ -0,0 +1,356 @@
+import os
+import shutil
+import tempfile
+from math import factorial
+
+import numpy as np
+
+from .projector_encoding import encode_projectors
+from .projector_encoding import read_projectors
+from .log_formats import colorized_logger
+logger = colorized_logger(__name__)
+
+cache_directory_variable = 'SCHURTRANSFORM_CACHE_DIR'
+cache_size_variable = 'SCHURTRANSFORM_CACHE_MAX_BYTES'
+default_max_bytes = pow(2, 30)
+
+
+def get_default_cache_directory():
+    """
+    :return: The directory named by the environment variable
+        ``SCHURTRANSFORM_CACHE_DIR``, if set. Otherwise ``schurtransform`` under
+        ``XDG_CACHE_HOME`` (by default ``~/.cache``).
+    :rtype: str
+    """
+    directory = os.environ.get(cache_directory_variable)
+    if directory:
+        return directory
+    base = os.environ.get('XDG_CACHE_HOME')
+    if not base:
+        base = os.path.join(os.path.expanduser('~'), '.cache')
+    return os.path.join(base, 'schurtransform')
+
+
+def get_default_max_bytes():
+    """
+    :return: The value of the environment variable ``SCHURTRANSFORM_CACHE_MAX_BYTES``,
+        if set, else ``default_max_bytes``.
+    :rtype: int
+    """
+    value = os.environ.get(cache_size_variable)
+    if value:
+        try:
+            return int(value)
+        except ValueError:
+            logger.warning('Ignoring invalid %s: %s', cache_size_variable, value)
+    return default_max_bytes
+
+
+class ProjectorCache:
+    """
+    A persistent cache of dense projectors, in the same compact ``.npz`` format as the
+    files distributed with the library (see
+    :py:func:`.projector_encoding.encode_projectors`), kept in a user-level directory
+    so that projectors calculated on demand are reused across runs.
+
+    Files are written to a temporary file in the cache directory and then moved into
+    place with ``os.replace``, so that a reader never sees a partially written file.
+    Several processes may calculate and store the same projectors concurrently; each
+    replacement is complete, and the last one is kept.
+
+    Projectors are also kept decoded, in a given floating point type, in a directory
+    with one ``.npy`` file per partition, which is opened with ``mmap_mode='r'``
+    (see :py:meth:`load_mapped`). Every process using the same projectors then shares
+    the pages of these files through the operating system's page cache, instead of
+    holding a private copy. The directory is written under a temporary name and then
+    renamed into place, so it is either absent or complete.
+
+    When the total size of the cached files exceeds ``max_bytes``, the least recently
+    used files (or directories) are removed. Loading marks them as used (by their
+    modification time).
+    """
+    temporary_suffix = '.tmp'
+
+    def __init__(self,
+        directory: str=None,
+        max_bytes: int=None,
+    ):
+        """
+        :param directory: The cache directory, created if necessary. Default as in
+            :py:func:`get_default_cache_directory`.
+        :type directory: str
+
+        :param max_bytes: The size limit of the cache. Default as in
+            :py:func:`get_default_max_bytes`.
+        :type max_bytes: int
+        """
+        if directory is None:
+            directory = get_default_cache_directory()
+        if max_bytes is None:
+            max_bytes = get_default_max_bytes()
+        self.directory = directory
+        self.max_bytes = max_bytes
+
+    @staticmethod
+    def format_filename(degree: int=None, dimension: int=None):
+        return '_'.join([
+            'projectors',
+            'degree',
+            str(degree),
+            'dimension',
+            str(dimension) + '.npz',
+        ])
+
+    @staticmethod
+    def format_mapped_directory_name(degree: int=None, dimension: int=None, dtype=np.float64):
+        return '_'.join([
+            'projectors',
+            'degree',
+            str(degree),
+            'dimension',
+            str(dimension),
+            np.dtype(dtype).name,
+        ])
+
+    def get_path(self, degree: int=None, dimension: int=None):
+        return os.path.join(self.directory, ProjectorCache.format_filename(degree, dimension))
+
+    def get_mapped_path(self, degree: int=None, dimension: int=None, dtype=np.float64):
+        return os.path.join(
+            self.directory,
+            ProjectorCache.format_mapped_directory_name(degree, dimension, dtype),
+        )
+
+    def contains(self, degree: int=None, dimension: int=None):
+        """
+        :return: True if projectors for the given degree and dimension are cached.
+        :rtype: bool
+        """
+        return os.path.isfile(self.get_path(degree, dimension))
+
+    def load(self, degree: int=None, dimension: int=None, dtype=np.float64):
+        """
+        :param dtype: The floating point type into which the projectors are decoded.
+        :type dtype: numpy.dtype
+
+        :return: Keys are the integer partition strings, values are the projector data
+            arrays. None if not cached, or if the cached file can not be read (in which
+            case it is removed).
+        :rtype: dict
+        """
+        path = self.get_path(degree, dimension)
+        try:
+            arrays = read_projectors(path, dtype=dtype)
+        except FileNotFoundError:
+            return None
+        except (OSError, ValueError) as exception:
+            logger.warning('Removing unreadable cached projectors %s: %s', path, exception)
+            self.remove(path)
+            return None
+        try:
+            os.utime(path)
+        except OSError:
+            pass
+        logger.debug('Loaded cached projectors %s', path)
+        return arrays
+
+    def store(self, degree: int=None, dimension: int=None, arrays: dict=None):
+        """
+        Atomically writes the projectors to the cache, then evicts least recently
+        used files if the cache is too large.
+
+        :param arrays: Keys are the integer partition strings, values are the projector
+            data arrays. They are written in the compact format if they are exactly
+            representable in it, and as they are otherwise.
+        :type arrays: dict
+
+        :return: True if the projectors were written.
+        :rtype: bool
+        """
+        path = self.get_path(degree, dimension)
+        encoded = encode_projectors(arrays, denominator=factorial(degree))
+        if encoded is None:
+            logger.debug('Projectors for degree %s are not in exact rational form, storing as is.', degree)
+            encoded = arrays
+        try:
+            os.makedirs(self.directory, exist_ok=True)
+            descriptor, temporary_path = tempfile.mkstemp(
+                dir=self.directory,
+                prefix=os.path.basename(path) + '.',
+                suffix=ProjectorCache.temporary_suffix,
+            )
+        except OSError as exception:
+            logger.warning('Can not write to projector cache %s: %s', self.directory, exception)
+            return False
+        try:
+            with os.fdopen(descriptor, 'wb') as file:
+                np.savez_compressed(file, **encoded)
+                file.flush()
+                os.fsync(file.fileno())
+            os.replace(temporary_path, path)
+        except OSError as exception:
+            logger.warning('Can not write cached projectors %s: %s', path, exception)
+            self.remove(temporary_path)
+            return False
+        logger.debug('Saved projectors to cache %s', path)
+        self.evict(keep=path)
+        return True
+
+    def list_files(self):
+        """
+        :return: Tuples (path, size, modification time) of the cached projector files,
+            and of the directories of memory-mappable projectors (with the total size
+            of their files).
+        :rtype: list
+        """
+        files = []
+        try:
+            entries = list(os.scandir(self.directory))
+        except FileNotFoundError:
+            return files
+        for entry in entries:
+            if entry.name.endswith(ProjectorCache.temporary_suffix):
+                continue
+            try:
+                if entry.name.endswith('.npz'):
+                    status = entry.stat()
+                    size = status.st_size
+                elif entry.name.startswith('projectors_') and entry.is_dir():
+                    status = entry.stat()
+                    size = sum(item.stat().st_size for item in os.scandir(entry.path))
+                else:
+                    continue
+            except FileNotFoundError:
+                continue
+            files.append((entry.path, size, status.st_mtime))
+        return files
+
+    def load_mapped(self, degree: int=None, dimension: int=None, dtype=np.float64):
+        """
+        :return: Keys are the integer partition strings, values are read-only
+            memory-mapped projector data arrays of type ``dtype``. None if these are
+            not cached, or can not be read (in which case they are removed).
+        :rtype: dict
+        """
+        path = self.get_mapped_path(degree, dimension, dtype)
+        try:
+            names = sorted(os.listdir(path))
+            arrays = {
+                name[:-len('.npy')] : np.load(os.path.join(path, name), mmap_mode='r')
+                for name in names if name.endswith('.npy')
+            }
+        except FileNotFoundError:
+            return None
+        except (OSError, ValueError) as exception:
+            logger.warning('Removing unreadable cached projectors %s: %s', path, exception)
+            self.remove(path)
+            return None
+        if any(array.dtype != np.dtype(dtype) for array in arrays.values()):
+            logger.warning('Removing cached projectors %s of the wrong type.', path)
+            self.remove(path)
+            return None
+        try:
+            os.utime(path)
+        except OSError:
+            pass
+        logger.debug('Mapped cached projectors %s', path)
+        return arrays
+
+    def store_mapped(self, degree: int=None, dimension: int=None, dtype=np.float64, arrays: dict=None):
+        """
+        Writes the projectors, one ``.npy`` file per partition, to a temporary
+        directory which is then renamed into place. If another process has already
+        done so, its directory is kept.
+
+        :param arrays: Keys are the integer partition strings, values are the projector
+            data arrays, of type ``dtype``.
+        :type arrays: dict
+
+        :return: True if the projectors are in place.
+        :rtype: bool
+        """
+        path = self.get_mapped_path(degree, dimension, dtype)
+        try:
+            os.makedirs(self.directory, exist_ok=True)
+            temporary_path = tempfile.mkdtemp(
+                dir=self.directory,
+                prefix=os.path.basename(path) + '.',
+                suffix=ProjectorCache.temporary_suffix,
+            )
+        except OSError as exception:
+            logger.warning('Can not write to projector cache %s: %s', self.directory, exception)
+            return False
+        try:
+            for key, array in arrays.items():
+                with open(os.path.join(temporary_path, key + '.npy'), 'wb') as file:
+                    np.save(file, np.asarray(array, dtype=dtype))
+                    file.flush()
+                    os.fsync(file.fileno())
+            os.rename(temporary_path, path)
+        except OSError as exception:
+            self.remove(temporary_path)
+            if os.path.isdir(path):
+                return True
+            logger.warning('Can not write cached projectors %s: %s', path, exception)
+            return False
+        logger.debug('Saved memory-mappable projectors to cache %s', path)
+        self.evict(keep=path)
+        return True
+
+    def get_size(self):
+        """
+        :return: The total size in bytes of the cached projector files.
+        :rtype: int
+        """
+        return sum(size for _, size, _ in self.list_files())
+
+    def evict(self, keep: str=None):
+        """
+        Removes the least recently used files until the cache size is at most
+        ``max_bytes``.
+
+        :param keep: A path which is not to be removed (e.g. the file just stored).
+        :type keep: str
+
+        :return: The paths removed.
+        :rtype: list
+        """
+        files = sorted(self.list_files(), key=lambda entry: entry[2])
+        total = sum(size for _, size, _ in files)
+        removed = []
+        for path, size, _ in files:
+            if total <= self.max_bytes:
+                break
+            if path == keep:
+                continue
+            if self.remove(path):
+                logger.debug('Evicted cached projectors %s', path)
+                removed.append(path)
+            total -= size
+        return removed
+
+    def clear(self):
+        """
+        Removes all cached projector files and directories.
+        """
+        for path, _, _ in self.list_files():
+            self.remove(path)
+
+    @staticmethod
+    def remove(path: str=None):
+        """
+        :return: True if the file or directory was removed. False if it does not
+            exist, or can not be removed (in which case a warning is logged).
+        :rtype: bool
+        """
+        try:
+            if os.path.isdir(path):
+                shutil.rmtree(path)
+            else:
+                os.remove(path)
+            return True
+        except FileNotFoundError:
+            return False
+        except OSError as exception:
+            logger.warning('Can not remove cached projectors %s: %s', path, exception)
+            return False
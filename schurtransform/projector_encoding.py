@@ -0,0 +1,122 @@
+from math import gcd
+
+import numpy as np
+
+denominator_key = 'denominator'
+shape_key = 'shape'
+integer_types = [np.int8, np.int16, np.int32, np.int64]
+
+
+def get_integer_type(minimum: int=None, maximum: int=None):
+    """
+    :return: The smallest signed integer type holding the given range of values.
+    :rtype: type
+    """
+    for integer_type in integer_types:
+        information = np.iinfo(integer_type)
+        if information.min <= minimum and maximum <= information.max:
+            return integer_type
+    return None
+
+
+def encode_projectors(arrays: dict=None, denominator: int=None):
+    """
+    Encodes dense projectors in the compact exact format of the projector files.
+
+    The entries of the Young projectors of degree n are rational numbers whose
+    denominators divide n!, and each projector is symmetric (as a matrix from the
+    first n tensor factors to the last n). So each projector is stored as the integer
+    numerators of its upper triangle (including the diagonal), in the smallest
+    integer type holding them, together with one denominator shared by all of the
+    projectors (n!, reduced by the greatest common divisor of all numerators) and the
+    shape of the operators.
+
+    :param arrays: Keys are the integer partition strings, values are the projector
+        data arrays, all of the same shape.
+    :type arrays: dict
+
+    :param denominator: A common denominator of the entries, typically n!.
+    :type denominator: int
+
+    :return: The arrays to save (e.g. with ``numpy.savez_compressed``), or None if
+        the projectors are not symmetric with entries exactly representable with the
+        given denominator.
+    :rtype: dict
+    """
+    if len(arrays) == 0:
+        return {}
+    shape = next(iter(arrays.values())).shape
+    size = int(np.sqrt(np.prod(shape, dtype=np.int64)))
+    rows, columns = np.triu_indices(size)
+    numerators = {}
+    for key, array in arrays.items():
+        if array.shape != shape:
+            return None
+        matrix = np.asarray(array, dtype=np.float64).reshape(size, size)
+        scaled = matrix * denominator
+        rounded = np.rint(scaled)
+        if np.max(np.abs(scaled - rounded)) > 1e-6 or not np.array_equal(rounded, rounded.T):
+            return None
+        numerators[key] = rounded[rows, columns].astype(np.int64)
+    divisor = denominator
+    for values in numerators.values():
+        divisor = gcd(divisor, int(np.gcd.reduce(np.abs(values))))
+    minimum = min(int(np.min(values)) for values in numerators.values()) // divisor
+    maximum = max(int(np.max(values)) for values in numerators.values()) // divisor
+    integer_type = get_integer_type(minimum, maximum)
+    if integer_type is None:
+        return None
+    encoded = {
+        key : (values // divisor).astype(integer_type) for key, values in numerators.items()
+    }
+    encoded[denominator_key] = np.array(denominator // divisor, dtype=np.int64)
+    encoded[shape_key] = np.array(shape, dtype=np.int64)
+    return encoded
+
+
+def decode_projectors(archive=None, dtype=np.float64):
+    """
+    :param archive: A mapping (e.g. an opened ``.npz`` archive) in the format
+        returned by :py:func:`encode_projectors`. Archives of plain dense arrays
+        (without a denominator) are also accepted.
+
+    :param dtype: The floating point type of the decoded projectors.
+    :type dtype: numpy.dtype
+
+    :return: Keys are the integer partition strings, values are the projector data
+        arrays of type ``dtype``.
+    :rtype: dict
+    """
+    dtype = np.dtype(dtype)
+    keys = [key for key in archive.keys() if not key in [denominator_key, shape_key]]
+    if not denominator_key in archive.keys():
+        return {key : np.asarray(archive[key]).astype(dtype, copy=False) for key in keys}
+    denominator = dtype.type(archive[denominator_key])
+    shape = tuple(int(length) for length in archive[shape_key])
+    size = int(np.sqrt(np.prod(shape, dtype=np.int64)))
+    rows, columns = np.triu_indices(size)
+    arrays = {}
+    for key in keys:
+        values = archive[key].astype(dtype)
+        values /= denominator
+        matrix = np.empty((size, size), dtype=dtype)
+        matrix[rows, columns] = values
+        matrix[columns, rows] = values
+        arrays[key] = matrix.reshape(shape)
+    return arrays
+
+
+def read_projectors(path: str=None, dtype=np.float64):
+    """
+    :param path: A projector file, as written with the arrays returned by
+        :py:func:`encode_projectors`.
+    :type path: str
+
+    :param dtype: As in :py:func:`decode_projectors`.
+    :type dtype: numpy.dtype
+
+    :return: As in :py:func:`decode_projectors`.
+    :rtype: dict
+    """
+    with np.load(path) as archive:
+        return decode_projectors(archive, dtype=dtype)
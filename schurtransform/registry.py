@@ -0,0 +1,211 @@
+import os
+import sys
+import threading
+from collections import OrderedDict
+
+import numpy as np
+
+from .log_formats import colorized_logger
+logger = colorized_logger(__name__)
+
+registry_size_variable = 'SCHURTRANSFORM_REGISTRY_MAX_BYTES'
+default_max_bytes = pow(2, 30)
+
+
+def get_default_max_bytes():
+    """
+    :return: The value of the environment variable
+        ``SCHURTRANSFORM_REGISTRY_MAX_BYTES``, if set, else ``default_max_bytes``.
+    :rtype: int
+    """
+    value = os.environ.get(registry_size_variable)
+    if value:
+        try:
+            return int(value)
+        except ValueError:
+            logger.warning('Ignoring invalid %s: %s', registry_size_variable, value)
+    return default_max_bytes
+
+
+def estimate_size(value, seen: set=None):
+    """
+    :param value: An object held in the registry, e.g. an array, a dictionary of
+        :py:class:`.tensor_operator.TensorOperator` objects, or a
+        :py:class:`.character_table.CharacterTable`.
+
+    :return: An estimate of the memory used by the object, in bytes. Numpy arrays
+        contribute their data size, except memory-mapped arrays (and views of them),
+        whose pages belong to the operating system's file cache and count as zero;
+        containers and object attributes are traversed, each object being counted
+        once.
+    :rtype: int
+    """
+    if seen is None:
+        seen = set()
+    if id(value) in seen:
+        return 0
+    seen.add(id(value))
+    if isinstance(value, np.memmap):
+        return 0
+    if isinstance(value, np.ndarray):
+        if isinstance(value.base, np.ndarray):
+            return estimate_size(value.base, seen)
+        return value.nbytes
+    if isinstance(value, dict):
+        return sys.getsizeof(value) + sum(
+            estimate_size(key, seen) + estimate_size(item, seen) for key, item in value.items()
+        )
+    if isinstance(value, (list, tuple, set, frozenset)):
+        return sys.getsizeof(value) + sum(estimate_size(item, seen) for item in value)
+    if hasattr(value, '__dict__'):
+        return sys.getsizeof(value) + estimate_size(vars(value), seen)
+    return sys.getsizeof(value)
+
+
+class Registry:
+    """
+    A process-wide, thread-safe cache of the objects which are expensive to create
+    and are shared by all transforms: character tables, conjugacy classes, and
+    projectors. Entries are keyed by (kind, degree, dimension, dtype), where
+    dimension and dtype are None for objects which do not depend on them.
+
+    The total estimated size of the entries (see :py:func:`estimate_size`) is kept
+    below ``max_bytes`` by evicting the least recently used entries. The numbers of
+    hits, misses, and evictions are counted, in total and by kind.
+
+    An entry is created at most once even if requested by several threads at the
+    same time; the other threads wait for it.
+    """
+    def __init__(self, max_bytes: int=None):
+        """
+        :param max_bytes: The size limit. Default as in
+            :py:func:`get_default_max_bytes`.
+        :type max_bytes: int
+        """
+        if max_bytes is None:
+            max_bytes = get_default_max_bytes()
+        self.max_bytes = max_bytes
+        self.lock = threading.RLock()
+        self.key_locks = {}
+        self.entries = OrderedDict()
+        self.size = 0
+        self.reset_statistics()
+
+    @staticmethod
+    def format_key(kind: str=None, degree: int=None, dimension: int=None, dtype=None):
+        return (kind, degree, dimension, None if dtype is None else np.dtype(dtype).name)
+
+    def get(self, kind: str=None, degree: int=None, dimension: int=None, dtype=None, factory=None):
+        """
+        :param kind: The kind of object, e.g. ``'character_table'``.
+        :type kind: str
+
+        :param degree: The degree of the symmetric group.
+        :type degree: int
+
+        :param dimension: The dimension of the base vector space, if applicable.
+        :type dimension: int
+
+        :param dtype: The floating point type, if applicable.
+        :type dtype: numpy.dtype
+
+        :param factory: A function without arguments which creates the object, called
+            in case of a miss. If it returns None, nothing is stored.
+        :type factory: callable
+
+        :return: The object.
+        """
+        key = Registry.format_key(kind, degree, dimension, dtype)
+        with self.lock:
+            if key in self.entries:
+                self.record_hit(key)
+                return self.entries[key][0]
+            key_lock = self.key_locks.setdefault(key, threading.Lock())
+        try:
+            with key_lock:
+                with self.lock:
+                    if key in self.entries:
+                        self.record_hit(key)
+                        return self.entries[key][0]
+                    self.count('misses', kind)
+                value = factory()
+                if value is not None:
+                    self.put(key, value)
+        finally:
+            with self.lock:
+                self.key_locks.pop(key, None)
+        return value
+
+    def put(self, key, value):
+        size = estimate_size(value)
+        with self.lock:
+            if key in self.entries:
+                self.size -= self.entries.pop(key)[1]
+            self.entries[key] = (value, size)
+            self.size += size
+            self.evict(keep=key)
+
+    def record_hit(self, key):
+        self.entries.move_to_end(key)
+        self.count('hits', key[0])
+
+    def count(self, counter: str=None, kind: str=None):
+        self.statistics[counter] += 1
+        by_kind = self.statistics['by_kind'].setdefault(kind, {'hits' : 0, 'misses' : 0, 'evictions' : 0})
+        by_kind[counter] += 1
+
+    def evict(self, keep=None):
+        """
+        Evicts least recently used entries until the total size is at most
+        ``max_bytes``. The entry with key ``keep`` is not evicted.
+        """
+        with self.lock:
+            for key in list(self.entries.keys()):
+                if self.size <= self.max_bytes:
+                    break
+                if key == keep:
+                    continue
+                _, size = self.entries.pop(key)
+                self.size -= size
+                self.count('evictions', key[0])
+                logger.debug('Evicted %s from registry (%s bytes).', key, size)
+
+    def get_statistics(self):
+        """
+        :return: The counts of hits, misses, and evictions (also by kind, under
+            ``by_kind``), and the current number of entries, total size in bytes, and
+            size limit.
+        :rtype: dict
+        """
+        with self.lock:
+            statistics = dict(self.statistics)
+            statistics['by_kind'] = {
+                kind : dict(counts) for kind, counts in self.statistics['by_kind'].items()
+            }
+            statistics['entries'] = len(self.entries)
+            statistics['bytes'] = self.size
+            statistics['max_bytes'] = self.max_bytes
+            return statistics
+
+    def reset_statistics(self):
+        with self.lock:
+            self.statistics = {'hits' : 0, 'misses' : 0, 'evictions' : 0, 'by_kind' : {}}
+
+    def clear(self):
+        """
+        Removes all entries (the statistics are kept).
+        """
+        with self.lock:
+            self.entries.clear()
+            self.size = 0
+
+
+registry = Registry()
+
+
+def get_registry():
+    """
+    :return: The process-wide registry.
+    :rtype: Registry
+    """
+    return registry
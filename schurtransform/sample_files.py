@@ -0,0 +1,121 @@
+import os
+import mmap
+
+import numpy as np
+
+from .instrumentation import instrumented
+from .log_formats import colorized_logger
+logger = colorized_logger(__name__)
+
+default_block_size = pow(2, 16)
+
+
+def open_samples(samples):
+    """
+    :param samples: Samples, or the path to a file of samples. A ``.npy`` file is
+        opened as a read-only memory map, so that it is not read into memory all at
+        once. A ``.npz`` archive is opened lazily, as a mapping from case identifiers
+        (the archive's keys) to the sample arrays; each case is only read when
+        accessed.
+    :type samples: str, os.PathLike, or other
+
+    :return: The opened samples, or ``samples`` unchanged if it is not a path.
+    :rtype: numpy.memmap, numpy.lib.npyio.NpzFile, or other
+    """
+    if not isinstance(samples, (str, os.PathLike)):
+        return samples
+    path = os.fspath(samples)
+    extension = os.path.splitext(path)[1].lower()
+    if extension == '.npy':
+        return np.load(path, mmap_mode='r')
+    if extension == '.npz':
+        return np.load(path)
+    logger.error('Unsupported samples file type: %s (expected .npy or .npz).', path)
+    return None
+
+
+def iterate_sample_blocks(samples, block_size: int=None):
+    """
+    :param samples: Array with axes (series, sample, spatial coordinate), possibly
+        memory-mapped.
+    :type samples: numpy.array
+
+    :param block_size: The number of samples per block. Default
+        ``default_block_size``.
+    :type block_size: int
+
+    :return: Generator of the consecutive blocks ``samples[:, start:stop, :]``, read
+        into memory one at a time. For the default C order, each series' part of a
+        block is contiguous on disk.
+    :rtype: generator
+    """
+    if block_size is None:
+        block_size = default_block_size
+    for start in range(0, samples.shape[1], block_size):
+        yield np.asarray(samples[:, start:start + block_size, :], dtype=np.float64)
+
+
+@instrumented('centering')
+def calculate_means(samples, block_size: int=None):
+    """
+    :param samples: As in :py:func:`iterate_sample_blocks`.
+    :type samples: numpy.array
+
+    :param block_size: As in :py:func:`iterate_sample_blocks`.
+    :type block_size: int
+
+    :return: The mean of each series, an array of shape (series, spatial
+        coordinate), computed one block at a time.
+    :rtype: numpy.array
+    """
+    total = np.zeros((samples.shape[0], samples.shape[2]))
+    for block in iterate_sample_blocks(samples, block_size=block_size):
+        total += np.sum(block, axis=1)
+    return total / samples.shape[1]
+
+
+def is_memory_mapped(samples):
+    """
+    :return: True if ``samples`` is a memory-mapped array.
+    :rtype: bool
+    """
+    return isinstance(samples, np.memmap)
+
+
+def get_sample_reference(samples):
+    """
+    :param samples: An array of samples.
+    :type samples: numpy.array
+
+    :return: For a memory-mapped array backed by a file, a description from which it
+        can be reopened (e.g. in another process) without copying the data. Otherwise
+        ``samples`` itself.
+    """
+    if is_memory_mapped(samples) and samples.filename is not None and isinstance(samples.base, mmap.mmap):
+        return {
+            'filename' : samples.filename,
+            'dtype' : samples.dtype.str,
+            'shape' : samples.shape,
+            'offset' : samples.offset,
+            'order' : 'F' if samples.flags.f_contiguous and not samples.flags.c_contiguous else 'C',
+        }
+    return samples
+
+
+def resolve_sample_reference(reference):
+    """
+    :param reference: As returned by :py:func:`get_sample_reference`.
+
+    :return: The samples array, reopening a memory map if necessary.
+    :rtype: numpy.array
+    """
+    if isinstance(reference, dict):
+        return np.memmap(
+            reference['filename'],
+            dtype=np.dtype(reference['dtype']),
+            mode='r',
+            shape=tuple(reference['shape']),
+            offset=reference['offset'],
+            order=reference['order'],
+        )
+    return reference
@@ -1,7 +1,12 @@
+import os
 import importlib.resources
+from collections.abc import Mapping
+from concurrent.futures import ProcessPoolExecutor
+from contextlib import contextmanager
 from enum import Enum, auto
-from functools import lru_cache
 from itertools import combinations
+from itertools import islice
+from math import comb
 from math import factorial
 
 import numpy as np
@@ -9,6 +14,45 @@ import numpy as np
 from .tensor import Tensor
 from .tensor_operator import TensorOperator
 from .character_table import CharacterTable
+from .character_table import get_character_table
+from .registry import get_registry
+from .symmetric_group import count_partitions
+from .symmetric_group import get_partition_strings
+from .symmetric_group import is_vanishing_partition
+from .validation import ValidationPolicy
+from .validation import Validator
+from .validation import ValidationError
+from .validation import get_validator
+from .validation import create_validator
+from .validation import activate_validator
+from .validation import get_relative_tolerance
+from .instrumentation import Instrumentation
+from .instrumentation import instrumented
+from .instrumentation import measure
+from .instrumentation import set_instrumentation
+from .instrumentation import reset_instrumentation
+from .moments import calculate_joint_moment
+from .moments import calculate_joint_moments
+from .moments import SlidingWindowMoments
+from .moments import MomentAccumulator
+from .permutation_projectors import PermutationProjectors
+from .gram import calculate_gram_matrices
+from .gram import calculate_class_inner_products
+from .gram import calculate_squared_norm
+from .parallel import shard_ranks
+from .parallel import SharedArrays
+from .parallel import format_projector_array_name
+from .parallel import format_samples_array_name
+from .parallel import initialize_worker
+from .parallel import run_task
+from .projector_cache import ProjectorCache
+from .projector_encoding import encode_projectors
+from .projector_encoding import read_projectors
+from .sample_files import open_samples
+from .sample_files import is_memory_mapped
+from .sample_files import iterate_sample_blocks
+from .sample_files import calculate_means
+from .sample_files import get_sample_reference
 from . import projectors as projectors_package
 from .log_formats import colorized_logger
 logger = colorized_logger(__name__)
@@ -26,19 +70,121 @@ class DecompositionSummary(Enum):
     VARIANCE_CONTENT = auto()
 
 
+class ProjectionEngine(Enum):
+    """
+    Used to select the representation of the projectors onto isotypic components.
+
+    - ``OPERATOR``. Dense :py:class:`.tensor_operator.TensorOperator` projectors,
+      retrieved from the files distributed with the library, or calculated on
+      demand and kept in the user-level projector cache (see
+      :py:class:`.projector_cache.ProjectorCache`).
+    - ``PERMUTATION``. :py:class:`.permutation_projectors.PermutationProjectors`,
+      applied as character-weighted sums of permutations of the tensor factors.
+    - ``GRAM``. Only for summaries requiring norms. The norms are calculated from
+      the cross-series Gram matrices of the samples (see :py:mod:`.gram`), without
+      forming the joint moment tensor, so that the cost does not depend on the
+      dimension.
+    """
+    OPERATOR = auto()
+    PERMUTATION = auto()
+    GRAM = auto()
+
+
 class SchurTransform:
     """
     The main computation orchestration object.
+
+    The limits ``max_dimension`` and ``max_degree`` pertain to the dense projector
+    files distributed with the library. Other dense projectors are calculated on
+    first use and cached; the ``PERMUTATION`` engine is not subject to the limits.
+
+    The cross-series Gram matrices held at once by the ``GRAM`` engine are limited
+    to ``gram_max_bytes`` (see :py:meth:`calculate_content`), and the engine is not
+    selected automatically if the Gram matrices of all of the series would exceed
+    this limit.
+
+    If ``memory_map_projectors`` is set to True (default False), dense projectors
+    are decoded once into the user-level projector cache and opened there as
+    read-only memory maps, shared by all processes (see
+    :py:meth:`.projector_cache.ProjectorCache.load_mapped`). This writes an
+    uncompressed copy of the projectors of each degree, dimension, and floating
+    point type to the cache directory.
     """
     max_dimension = 3
     max_degree = 6
+    memory_map_projectors = False
+    default_batch_size = 64
+    gram_max_bytes = pow(2, 28)
+    shards_per_worker = 4
+    remainder_key = 'remainder'
+
+    @contextmanager
+    def instrument(self,
+        trace_memory: bool=False,
+        callback=None,
+    ):
+        """
+        Context manager which activates instrumentation of the transforms run inside
+        it (in the current thread), e.g.::
+
+            with transformer.instrument() as instrumentation:
+                transformer.transform(samples, summary='NORMS')
+            report = instrumentation.get_report()
+
+        The stages measured are ``transform``, ``projector_retrieval``,
+        ``centering``, ``moments``, ``decomposition``, ``validation``, and
+        ``parallel_tasks``. Without this context manager, instrumentation costs only a
+        context variable lookup per measured call.
+
+        :param trace_memory: As in :py:class:`.instrumentation.Instrumentation`.
+        :type trace_memory: bool
+
+        :param callback: Optional function called with the report (see
+            :py:meth:`.instrumentation.Instrumentation.get_report`) on exit, e.g. to
+            export it to a metrics system.
+        :type callback: callable
+
+        :return: The :py:class:`.instrumentation.Instrumentation` object. Its
+            ``cache`` attribute records the changes in the hit, miss, and eviction
+            counts of the process-wide registry (from all threads) during the run.
+        """
+        instrumentation = Instrumentation(trace_memory=trace_memory)
+        before = get_registry().get_statistics()
+        token = set_instrumentation(instrumentation)
+        instrumentation.start()
+        try:
+            yield instrumentation
+        finally:
+            instrumentation.stop()
+            reset_instrumentation(token)
+            after = get_registry().get_statistics()
+            instrumentation.cache = {
+                key : after[key] - before[key] for key in ['hits', 'misses', 'evictions']
+            }
+            instrumentation.cache['by_kind'] = {
+                kind : {
+                    key : value - before['by_kind'].get(kind, {}).get(key, 0)
+                    for key, value in counts.items()
+                } for kind, counts in after['by_kind'].items()
+            }
+            if callback is not None:
+                callback(instrumentation.get_report())
 
+    @instrumented('transform')
     def transform(self,
         samples,
         summary: str='COMPONENTS',
         number_of_factors: int=None,
         character_table_filename: str=None,
         conjugacy_classes_table_filename: str=None,
+        engine: str=None,
+        batch_size: int=None,
+        workers: int=None,
+        executor=None,
+        validation=None,
+        dtype=None,
+        partitions: list=None,
+        remainder: bool=False,
     ):
         """
         :param samples: "Registered" spatial samples data. A multi-dimensional array, or
@@ -50,7 +196,18 @@ class SchurTransform:
 
             If a dictionary, the keys may be case identifiers and each value must be a
             list of lists of lists (or numpy array) as above.
-        :type samples: multi-dimensional array-like, or dict
+
+            Alternatively, a :py:class:`.moments.MomentAccumulator` to which the
+            samples have been supplied in chunks (only for the ``COMPONENTS`` and
+            ``NORMS`` summaries).
+
+            Alternatively, the path to a ``.npy`` file (opened as a read-only memory
+            map) or to a ``.npz`` archive whose keys are case identifiers (each case
+            is read only when it is processed); see
+            :py:func:`.sample_files.open_samples`. Memory-mapped samples are read in
+            blocks of consecutive samples, or only the series involved in the
+            current combinations, rather than all at once.
+        :type samples: multi-dimensional array-like, dict, MomentAccumulator, or path
 
         :param summary: Indication of what to return. Must be the string name of one of
             the members of the enum class :py:class:`DecompositionSummary`. See the
@@ -59,23 +216,81 @@ class SchurTransform:
 
         :param number_of_factors: In case of one of the ``...CONTENT`` summary types,
             this integer provides the number of factors (number of variables) used in
-            the joint moment. Currently this must be less than or equal to 6, unless you
-            provide your own character table and conjugacy class information.
+            the joint moment.
         :type number_of_factors: int
 
-        :param character_table_filename: Only provide this argument if you wish to
-            supply a character table for a symmetric group of degree higher than 6
-            (beyond S6). Use the file format exemplified by ``s2.csv``, ``s3.csv``, etc.
-            under the :py:mod:`schurtransform.character_tables` subpackage.
+        :param character_table_filename: Deprecated, ignored. Character tables of
+            any degree are calculated by the library (see :py:mod:`.symmetric_group`).
         :type character_table_filename: str
 
-        :param conjugacy_classes_table_filename: Only provide this argument if you wish
-            to supply a character table for a symmetric group of degree higher than 6
-            (beyond S6). Use the file format exemplified by
-            ``symmetric_group_conjugacy_classes.csv`` in the
-            :py:mod:`schurtransform.character_tables` subpackage.
+        :param conjugacy_classes_table_filename: Deprecated, ignored, as for
+            ``character_table_filename``.
         :type conjugacy_classes_filename: str
 
+        :param engine: The string name of one of the members of the enum class
+            :py:class:`ProjectionEngine`. By default, ``PERMUTATION`` is used for the
+            ``NORMS`` and ``...CONTENT`` summaries, which need only the norms of the
+            components, unless ``GRAM`` is estimated to be cheaper (for large
+            dimension compared to the number of samples). For ``COMPONENTS``, ``OPERATOR``
+            is used whenever the dense projectors for the given degree and dimension
+            are distributed with the library or cached, and ``PERMUTATION``
+            otherwise. With ``OPERATOR``, projectors which are not distributed are
+            calculated once and saved to the user-level projector cache (see
+            :py:class:`.projector_cache.ProjectorCache`); if
+            ``memory_map_projectors`` is True, the first use of the projectors for
+            a degree, dimension, and ``dtype`` also writes their decoded,
+            uncompressed arrays there.
+        :type engine: str
+
+        :param batch_size: In case of one of the ``...CONTENT`` summary types, the
+            number of index combinations whose joint moments are calculated and
+            decomposed together as one stacked array. Bounds the memory used. Default
+            ``default_batch_size``.
+        :type batch_size: int
+
+        :param workers: If greater than 1, the work is processed by a pool of this
+            many processes (see :py:meth:`transform_in_parallel`). For one of the
+            ``...CONTENT`` summary types, the index combinations are split by rank into
+            ``workers * shards_per_worker`` contiguous shards; for several cases, the
+            cases are also processed concurrently. The results are the same, in the
+            same order, as without ``workers``.
+        :type workers: int
+
+        :param executor: Alternatively to ``workers``, a
+            ``concurrent.futures.Executor`` to which the tasks are submitted.
+        :type executor: concurrent.futures.Executor
+
+        :param validation: Which consistency checks of the decompositions to perform,
+            and how to report failures. The string name of a member of
+            :py:class:`.validation.ValidationPolicy` (failures are logged), or a
+            :py:class:`.validation.Validator` (whose ``failures`` attribute collects
+            structured failure records after the call, and which may raise
+            :py:class:`.validation.ValidationError` instead). Default ``ALWAYS``.
+        :type validation: str or Validator
+
+        :param dtype: The floating point type in which the whole calculation is
+            carried out (samples, recentering, moments, projectors, and contraction),
+            e.g. ``'float32'``, which halves the memory and memory traffic at a
+            precision of about 7 significant digits. The tolerances of the
+            validation scale with the precision (see
+            :py:func:`.validation.get_relative_tolerance`). Default ``float64``.
+        :type dtype: str or numpy.dtype
+
+        :param partitions: The '+'-delimited integer partition strings of the
+            isotypic components to calculate, e.g. ``['1+1+1', '3']`` for the fully
+            symmetric and fully antisymmetric components of degree 3. Only these
+            projectors are applied, and only these components appear in the result.
+            Default all. An empty selection, or a partition string not labelling
+            an isotypic component of the degree, raises ``ValueError``.
+        :type partitions: list
+
+        :param remainder: If True, the result also has the key ``'remainder'``, for
+            the remainder T - Σ P_λ T of the joint moment T after the selected
+            components (or its norm; by orthogonality, ‖T - Σ P_λ T‖² = ‖T‖² -
+            Σ ‖P_λ T‖², so that a remainder norm very small relative to ‖T‖ is
+            resolved only to within about √ε‖T‖).
+        :type remainder: bool
+
         :return: Depending on the value of ``summary``,
 
             - ``COMPONENTS``. Returns the tensor components of the Schur-Weyl
@@ -97,15 +312,210 @@ class SchurTransform:
 
         :rtype: dict
         """
-        if isinstance(samples, dict):
-            return {case : self.transform(
-                samples[case],
-                summary = summary,
+        dtype = self.resolve_dtype(dtype)
+        if dtype is None:
+            return
+        with activate_validator(create_validator(validation)):
+            return self.transform_samples(
+                samples,
+                summary=summary,
+                number_of_factors=number_of_factors,
+                engine=engine,
+                batch_size=batch_size,
+                workers=workers,
+                executor=executor,
+                dtype=dtype,
+                partitions=partitions,
+                remainder=remainder,
+            )
+
+    def transform_samples(self,
+        samples,
+        summary: str='COMPONENTS',
+        number_of_factors: int=None,
+        engine: str=None,
+        batch_size: int=None,
+        workers: int=None,
+        executor=None,
+        dtype=np.float64,
+        partitions: list=None,
+        remainder: bool=False,
+    ):
+        """
+        As :py:meth:`transform`, with the validation policy already activated (see
+        :py:func:`.validation.activate_validator`) and ``dtype`` resolved (see
+        :py:meth:`resolve_dtype`).
+        """
+        opened = open_samples(samples)
+        if opened is None:
+            return
+        opened_file = opened is not samples
+        samples = opened
+
+        if isinstance(samples, Mapping):
+            if self.is_parallel(workers, executor):
+                results = self.transform_in_parallel(
+                    samples,
+                    summary = summary,
+                    number_of_factors = number_of_factors,
+                    engine = engine,
+                    batch_size = batch_size,
+                    workers = workers,
+                    executor = executor,
+                    dtype = dtype,
+                    partitions = partitions,
+                    remainder = remainder,
+                )
+            else:
+                results = {case : self.transform_samples(
+                    samples[case],
+                    summary = summary,
+                    number_of_factors = number_of_factors,
+                    engine = engine,
+                    batch_size = batch_size,
+                    dtype = dtype,
+                    partitions = partitions,
+                    remainder = remainder,
+                ) for case in samples}
+            if opened_file:
+                samples.close()
+            return results
+
+        if isinstance(samples, MomentAccumulator):
+            return self.transform_accumulated(
+                samples,
+                summary=summary,
+                engine=engine,
+                dtype=dtype,
+                partitions=partitions,
+                remainder=remainder,
+            )
+
+        prepared = self.prepare_case(samples, summary=summary, number_of_factors=number_of_factors, engine=engine)
+        if prepared is None:
+            return
+        samples, summary, degree, engine = prepared
+
+        if summary in self.content_summaries() and self.is_parallel(workers, executor):
+            return self.transform_in_parallel(
+                {None : samples},
+                summary = summary.name,
                 number_of_factors = number_of_factors,
-                character_table_filename = character_table_filename,
-                conjugacy_classes_table_filename = conjugacy_classes_table_filename,
-            ) for case in samples}
+                engine = engine.name,
+                batch_size = batch_size,
+                workers = workers,
+                executor = executor,
+                dtype = dtype,
+                partitions = partitions,
+                remainder = remainder,
+            )[None]
 
+        dimension = samples.shape[2]
+        logger.debug(
+            'Calculating projectors of type degree=%s and dimension=%s with engine %s.',
+            degree,
+            dimension,
+            engine.name,
+        )
+        projectors = self.get_projectors(
+            dimension=dimension,
+            degree=degree,
+            engine=engine,
+            dtype=dtype,
+            partitions=partitions,
+        )
+        if projectors is None:
+            return
+        if summary in [DecompositionSummary.COMPONENTS, DecompositionSummary.NORMS]:
+            return self.decompose_samples(
+                samples,
+                projectors,
+                summary=summary,
+                engine=engine,
+                dtype=dtype,
+                remainder=remainder,
+            )
+
+        if summary == DecompositionSummary.SEQUENTIAL_CONTENT:
+            content = self.calculate_sequential_content(
+                samples,
+                degree,
+                projectors,
+                engine=engine,
+                batch_size=batch_size,
+                dtype=dtype,
+                remainder=remainder,
+            )
+        else:
+            content = self.calculate_content(
+                samples,
+                combinations(list(range(samples.shape[0])), degree),
+                projectors,
+                engine=engine,
+                batch_size=batch_size,
+                dtype=dtype,
+                remainder=remainder,
+            )
+        return self.summarize_content(content, summary)
+
+    @staticmethod
+    def content_summaries():
+        """
+        :return: The summaries which are calculated from the decompositions of the
+            joint moments of many subsets of the series.
+        :rtype: list
+        """
+        return [
+            DecompositionSummary.CONTENT,
+            DecompositionSummary.SEQUENTIAL_CONTENT,
+            DecompositionSummary.MEAN_CONTENT,
+            DecompositionSummary.VARIANCE_CONTENT,
+        ]
+
+    @staticmethod
+    def is_parallel(workers: int=None, executor=None):
+        """
+        :return: True if the arguments ``workers`` and ``executor`` of
+            :py:meth:`transform` request parallel processing.
+        :rtype: bool
+        """
+        return (workers is not None and workers > 1) or executor is not None
+
+    @staticmethod
+    def resolve_dtype(dtype=None):
+        """
+        :param dtype: The ``dtype`` argument of :py:meth:`transform`.
+        :type dtype: str or numpy.dtype
+
+        :return: The floating point type, float64 if ``dtype`` is None. None if
+            ``dtype`` is not a floating point type.
+        :rtype: numpy.dtype
+        """
+        if dtype is None:
+            return np.dtype(np.float64)
+        try:
+            dtype = np.dtype(dtype)
+        except TypeError:
+            logger.error('Not a numpy dtype: %s', dtype)
+            return None
+        if not np.issubdtype(dtype, np.floating):
+            logger.error('Expected a floating point dtype, got %s.', dtype.name)
+            return None
+        return dtype
+
+    def prepare_case(self,
+        samples,
+        summary: str='COMPONENTS',
+        number_of_factors: int=None,
+        engine: str=None,
+    ):
+        """
+        Validates the arguments of :py:meth:`transform` for one case.
+
+        :return: The samples as an array, the summary and engine as enum members, and
+            the degree of the projectors. None if the arguments are invalid.
+        :rtype: tuple
+        """
         if isinstance(samples, list):
             samples = np.array(samples)
 
@@ -120,11 +530,9 @@ class SchurTransform:
             )
             return
 
-        number_of_series = samples.shape[0]
-        dimension = samples.shape[2]
         summary = DecompositionSummary[summary]
         if summary in [DecompositionSummary.COMPONENTS, DecompositionSummary.NORMS]:
-            degree = number_of_series
+            degree = samples.shape[0]
         else:
             degree = number_of_factors
             if number_of_factors is None:
@@ -134,74 +542,1001 @@ class SchurTransform:
                 )
                 return
 
-        logger.debug(
-            'Calculating projectors of type degree=%s and dimension=%s.',
+        engine = self.select_engine(
+            engine,
             degree,
-            dimension,
-        )
-        projectors = self.recalculate_projectors(
-            dimension=dimension,
-            degree=degree,
+            samples.shape[2],
+            summary=summary,
+            number_of_samples=samples.shape[1],
+            number_of_series=samples.shape[0],
         )
-        if summary in [DecompositionSummary.COMPONENTS, DecompositionSummary.NORMS]:
-            logger.debug('Centralizing input sample data.')
-            centered = self.recenter_at_mean(samples)
+        if engine is None:
+            return
+        return samples, summary, degree, engine
+
+    def decompose_samples(self,
+        samples,
+        projectors,
+        summary: DecompositionSummary=DecompositionSummary.COMPONENTS,
+        engine: ProjectionEngine=ProjectionEngine.PERMUTATION,
+        dtype=np.float64,
+        remainder: bool=False,
+    ):
+        """
+        The ``COMPONENTS`` or ``NORMS`` summary of the decomposition of the joint
+        moment of all of the series.
+
+        :param samples: As in :py:meth:`calculate_content`. Memory-mapped samples are
+            accumulated in blocks (see :py:class:`.moments.MomentAccumulator`).
+        :type samples: numpy.array
+
+        :param projectors: As in :py:meth:`calculate_decomposition`.
+        :type projectors: dict or PermutationProjectors
+
+        :param summary: ``COMPONENTS`` or ``NORMS``.
+        :type summary: DecompositionSummary
+
+        :param engine: As in :py:meth:`calculate_sample_norms`.
+        :type engine: ProjectionEngine
+
+        :param dtype: The floating point type of the calculation.
+        :type dtype: numpy.dtype
+
+        :param remainder: As in :py:meth:`transform`.
+        :type remainder: bool
+
+        :return: As in :py:meth:`transform`.
+        :rtype: dict
+        """
+        if is_memory_mapped(samples) and engine is not ProjectionEngine.GRAM:
+            logger.debug('Accumulating moments of memory-mapped samples in blocks.')
+            accumulator = MomentAccumulator(number_of_series=samples.shape[0], dimension=samples.shape[2])
+            accumulator.update(iterate_sample_blocks(samples))
+            return self.transform_accumulated(
+                accumulator,
+                summary=summary.name,
+                engine=engine.name,
+                dtype=dtype,
+                projectors=projectors,
+                remainder=remainder,
+            )
+
+        logger.debug('Centralizing input sample data.')
+        centered = self.recenter_at_mean(samples, dtype=dtype)
+
+        if summary == DecompositionSummary.COMPONENTS:
             logger.debug('Creating covariance tensor.')
             covariance_tensor = self.calculate_covariance_tensor(centered)
             logger.debug('Decomposing covariance tensor.')
             decomposition = self.calculate_decomposition(covariance_tensor, projectors)
             logger.debug('Validating decomposition.')
             self.validate_decomposition(decomposition, covariance_tensor)
+            if remainder:
+                decomposition[SchurTransform.remainder_key] = self.calculate_remainder(decomposition, covariance_tensor)
+            return decomposition
 
-            if summary == DecompositionSummary.COMPONENTS:
-                return decomposition
+        logger.debug('Calculating norms of components of covariance tensor.')
+        return self.calculate_sample_norms(centered, projectors, engine, remainder=remainder)
 
-            if summary == DecompositionSummary.NORMS:
-                return {i: np.linalg.norm(component.data) for i, component in decomposition.items()}
+    def summarize_content(self, content, summary: DecompositionSummary=DecompositionSummary.CONTENT):
+        """
+        :param content: As returned by :py:meth:`calculate_content`.
+        :type content: dict
 
-        if summary in [
-            DecompositionSummary.CONTENT,
-            DecompositionSummary.SEQUENTIAL_CONTENT,
-            DecompositionSummary.MEAN_CONTENT,
-            DecompositionSummary.VARIANCE_CONTENT,
-        ]:
-            if summary == DecompositionSummary.SEQUENTIAL_CONTENT:
-                index_combinations = [
-                    [i + j for j in range(degree)] for i in range(number_of_series-(degree-1))
-                ]
+        :param summary: One of the ``...CONTENT`` summaries.
+        :type summary: DecompositionSummary
+
+        :return: As in :py:meth:`transform`.
+        :rtype: dict
+        """
+        if summary is DecompositionSummary.MEAN_CONTENT:
+            return {i : np.mean(content[i]) for i in content.keys()}
+        if summary is DecompositionSummary.VARIANCE_CONTENT:
+            return {i : np.var(content[i]) for i in content.keys()}
+        return content
+
+    def transform_in_parallel(self,
+        cases: Mapping=None,
+        summary: str='COMPONENTS',
+        number_of_factors: int=None,
+        engine: str=None,
+        batch_size: int=None,
+        workers: int=None,
+        executor=None,
+        dtype=np.float64,
+        partitions: list=None,
+        remainder: bool=False,
+    ):
+        """
+        Parallel version of :py:meth:`transform` for several cases at once. All of the
+        work is flattened into one list of tasks, scheduled together: one task per
+        case for the ``COMPONENTS`` and ``NORMS`` summaries, and for the
+        ``...CONTENT`` summaries contiguous ranges of the ranks of each case's index
+        combinations (or consecutive windows), which each worker generates directly
+        from the starting rank (see :py:func:`.parallel.combinations_from_rank`).
+
+        The dense ``OPERATOR`` projectors needed, and the samples of the cases which
+        are not memory-mapped, are copied once into shared memory (see
+        :py:class:`.parallel.SharedArrays`); worker processes attach to them rather
+        than each loading its own copy. Memory-mapped samples are sent as a reference
+        to their file. Validation in the workers follows the settings of the active
+        validator (see :py:func:`.parallel.run_task`), and their failure records are
+        added to its ``failures``.
+
+        :param cases: Keys are case identifiers, values are samples as in
+            :py:meth:`transform`.
+        :type cases: Mapping
+
+        :param summary: As in :py:meth:`transform`.
+        :type summary: str
+
+        :param number_of_factors: As in :py:meth:`transform`.
+        :type number_of_factors: int
+
+        :param engine: As in :py:meth:`transform`.
+        :type engine: str
+
+        :param batch_size: As in :py:meth:`transform`.
+        :type batch_size: int
+
+        :param workers: The number of worker processes, if ``executor`` is not
+            provided. Also determines the number of shards of each case's
+            combinations. Default the number of CPUs.
+        :type workers: int
+
+        :param executor: A ``concurrent.futures.Executor`` to use instead of a new
+            process pool.
+        :type executor: concurrent.futures.Executor
+
+        :param dtype: The floating point type of the calculation. Samples published
+            in shared memory are cast to it.
+        :type dtype: numpy.dtype
+
+        :param partitions: As in :py:meth:`transform`. Only the selected dense
+            projectors are published in shared memory. (Memory-mapped projectors are
+            not published; workers map the same files.)
+        :type partitions: list
+
+        :param remainder: As in :py:meth:`transform`.
+        :type remainder: bool
+
+        :return: Keys are the case identifiers, values are as returned by
+            :py:meth:`transform`, in the same order as without parallelism.
+        :rtype: dict
+        """
+        if workers is None:
+            workers = os.cpu_count() or 1
+        validator = get_validator()
+        dtype = np.dtype(dtype)
+        results = {}
+        prepared_cases = {}
+        for case in cases:
+            samples = cases[case]
+            if isinstance(samples, MomentAccumulator):
+                results[case] = self.transform_accumulated(
+                    samples,
+                    summary=summary,
+                    engine=engine,
+                    dtype=dtype,
+                    partitions=partitions,
+                    remainder=remainder,
+                )
+                continue
+            prepared = self.prepare_case(samples, summary=summary, number_of_factors=number_of_factors, engine=engine)
+            if prepared is None:
+                results[case] = None
+                continue
+            prepared_cases[case] = prepared
+
+        arrays = {}
+        projector_keys = []
+        projector_partitions = {}
+        tasks = []
+        task_cases = []
+        contents = {}
+        for index, (case, (samples, summary_member, degree, engine_member)) in enumerate(prepared_cases.items()):
+            dimension = samples.shape[2]
+            key = (degree, dimension, engine_member.name, dtype.name)
+            if not key in projector_keys:
+                projector_keys.append(key)
+                projectors = self.get_projectors(
+                    dimension=dimension,
+                    degree=degree,
+                    engine=engine_member,
+                    dtype=dtype,
+                    partitions=partitions,
+                )
+                if projectors is None:
+                    return
+                if isinstance(projectors, PermutationProjectors):
+                    projector_partitions[key] = projectors.get_partitions()
+                else:
+                    projector_partitions[key] = list(projectors.keys())
+                if engine_member is ProjectionEngine.OPERATOR:
+                    for partition_string, data in SchurTransform.get_stored_arrays(projectors).items():
+                        if is_memory_mapped(data):
+                            continue
+                        arrays[format_projector_array_name(degree, dimension, partition_string)] = data
+            if is_memory_mapped(samples):
+                sample_reference = get_sample_reference(samples)
             else:
-                index_combinations = combinations(list(range(number_of_series)), degree)
-
-            character_table = CharacterTable(degree=degree)
-            content = {key : [] for key in character_table.get_characters()}
-            for combination in index_combinations:
-                subsample = samples[list(combination), :, :]
-                centered = self.recenter_at_mean(subsample)
-                covariance_tensor = self.calculate_covariance_tensor(centered)
-                decomposition = self.calculate_decomposition(covariance_tensor, projectors)
-                self.validate_decomposition(decomposition, covariance_tensor)
-                norms = {i: np.linalg.norm(comp.data) for i, comp in decomposition.items()}
-                for i, norm in norms.items():
-                    content[i].append(norm)
-
-            if summary is DecompositionSummary.CONTENT:
-                return content
-            if summary is DecompositionSummary.SEQUENTIAL_CONTENT:
-                return content
-            if summary is DecompositionSummary.MEAN_CONTENT:
-                return {i : np.mean(content[i]) for i in content.keys()}
-            if summary is DecompositionSummary.VARIANCE_CONTENT:
-                return {i : np.var(content[i]) for i in content.keys()}
-
-    @lru_cache(maxsize=5)
+                name = format_samples_array_name(index)
+                arrays[name] = np.asarray(samples, dtype=dtype)
+                sample_reference = {'shared_array' : name}
+            task = {
+                'validation' : validator.get_settings(),
+                'samples' : sample_reference,
+                'degree' : degree,
+                'engine_name' : engine_member.name,
+                'summary_name' : summary_member.name,
+                'dtype_name' : dtype.name,
+                'partitions' : partitions,
+                'remainder' : remainder,
+            }
+            if summary_member in [DecompositionSummary.COMPONENTS, DecompositionSummary.NORMS]:
+                tasks.append(dict(task, kind='whole'))
+                task_cases.append(case)
+                continue
+            sequential = summary_member == DecompositionSummary.SEQUENTIAL_CONTENT
+            if sequential:
+                total = max(samples.shape[0] - degree + 1, 0)
+            else:
+                total = comb(samples.shape[0], degree)
+            contents[case] = self.initialize_content(projector_partitions[key], remainder=remainder)
+            for start, stop in shard_ranks(total, workers * SchurTransform.shards_per_worker):
+                tasks.append(dict(
+                    task,
+                    kind='shard',
+                    start=start,
+                    stop=stop,
+                    sequential=sequential,
+                    batch_size=batch_size,
+                ))
+                task_cases.append(case)
+
+        shared = SharedArrays(arrays)
+        try:
+            for task in tasks:
+                task['shared'] = shared.get_reference()
+            logger.debug('Running %s tasks for %s cases.', len(tasks), len(prepared_cases))
+            with measure('parallel_tasks'):
+                if executor is None:
+                    with ProcessPoolExecutor(
+                        max_workers=workers,
+                        initializer=initialize_worker,
+                        initargs=(shared.get_reference(), projector_keys),
+                    ) as pool:
+                        task_results = list(pool.map(run_task, tasks))
+                else:
+                    task_results = list(executor.map(run_task, tasks))
+        finally:
+            shared.close()
+
+        for case, task, task_output in zip(task_cases, tasks, task_results):
+            validator.failures.extend(task_output['failures'])
+            task_result = task_output['result']
+            if task['kind'] == 'whole':
+                results[case] = task_result
+                continue
+            for key, norms in task_result.items():
+                contents[case][key].extend(norms)
+        for case, content in contents.items():
+            results[case] = self.summarize_content(content, prepared_cases[case][1])
+        return {case : results[case] for case in cases}
+
+    def transform_accumulated(self,
+        accumulator: MomentAccumulator=None,
+        summary: str='COMPONENTS',
+        engine: str=None,
+        dtype=np.float64,
+        partitions: list=None,
+        remainder: bool=False,
+        projectors=None,
+    ):
+        """
+        The transform of the joint moment held by a
+        :py:class:`.moments.MomentAccumulator`.
+
+        :param accumulator: The accumulated samples.
+        :type accumulator: MomentAccumulator
+
+        :param summary: ``COMPONENTS`` or ``NORMS``, as in :py:meth:`transform`.
+        :type summary: str
+
+        :param engine: As in :py:meth:`transform`, except that ``GRAM`` is not
+            supported (the samples are not retained).
+        :type engine: str
+
+        :param dtype: The floating point type of the decomposition. (The moments are
+            accumulated in float64.)
+        :type dtype: numpy.dtype
+
+        :param partitions: As in :py:meth:`transform`.
+        :type partitions: list
+
+        :param remainder: As in :py:meth:`transform`.
+        :type remainder: bool
+
+        :param projectors: The projectors to use, if already retrieved (in which case
+            ``engine`` and ``partitions`` are ignored).
+        :type projectors: dict or PermutationProjectors
+
+        :return: As in :py:meth:`transform`.
+        :rtype: dict
+        """
+        summary = DecompositionSummary[summary]
+        if not summary in [DecompositionSummary.COMPONENTS, DecompositionSummary.NORMS]:
+            logger.error('Accumulated moments support only COMPONENTS or NORMS, not %s.', summary.name)
+            return
+        degree = accumulator.number_of_series
+        dimension = accumulator.dimension
+        if projectors is None:
+            engine = self.select_engine(engine, degree, dimension, summary=summary)
+            if engine is ProjectionEngine.GRAM:
+                logger.error('The GRAM engine requires the samples, not only their moments.')
+                return
+            if engine is None:
+                return
+            projectors = self.get_projectors(
+                dimension=dimension,
+                degree=degree,
+                engine=engine,
+                dtype=dtype,
+                partitions=partitions,
+            )
+            if projectors is None:
+                return
+        covariance_tensor = accumulator.get_tensor()
+        covariance_tensor.data = covariance_tensor.data.astype(dtype, copy=False)
+        if summary == DecompositionSummary.COMPONENTS:
+            decomposition = self.calculate_decomposition(covariance_tensor, projectors)
+            self.validate_decomposition(decomposition, covariance_tensor)
+            if remainder:
+                decomposition[SchurTransform.remainder_key] = self.calculate_remainder(decomposition, covariance_tensor)
+            return decomposition
+        norms = self.calculate_norms(covariance_tensor, projectors)
+        self.validate_norms(norms, tensor=covariance_tensor)
+        if remainder:
+            norms[SchurTransform.remainder_key] = self.calculate_remainder_norm(
+                norms,
+                np.vdot(covariance_tensor.data, covariance_tensor.data),
+            )
+        return norms
+
+    def calculate_content(self,
+        samples,
+        index_combinations,
+        projectors,
+        engine: ProjectionEngine=ProjectionEngine.PERMUTATION,
+        batch_size: int=None,
+        dtype=np.float64,
+        remainder: bool=False,
+    ):
+        """
+        Calculates the norms of the components of the decompositions of the joint
+        moments of many subsets of the series. The series are recentered only once
+        (recentering a subset of the series separately gives the same result). The
+        index combinations are processed in blocks: the joint moments of a block are
+        built as one stacked array, and all projectors are applied to the whole block
+        at once. With the ``GRAM`` engine, the cross-series Gram matrices of the
+        series occurring in a block are calculated once, from just those series, and
+        each combination uses the corresponding sub-block. If these would exceed
+        ``gram_max_bytes``, the Gram matrices are calculated for each combination
+        separately.
+
+        :param samples: "Registered" spatial samples data, with axes (series, sample,
+            spatial coordinate).
+        :type samples: numpy.array
+
+        :param index_combinations: Iterable of sequences of series indices, each of
+            length the degree of the projectors.
+        :type index_combinations: iterable
+
+        :param projectors: As in :py:meth:`calculate_decomposition`.
+        :type projectors: dict or PermutationProjectors
+
+        :param engine: As in :py:meth:`calculate_sample_norms`.
+        :type engine: ProjectionEngine
+
+        :param batch_size: The number of index combinations per block. Default
+            ``default_batch_size``.
+        :type batch_size: int
+
+        :param dtype: The floating point type of the recentered samples and of the
+            moments. The dense projectors should have the same type.
+        :type dtype: numpy.dtype
+
+        :param remainder: If True, the norms of the remainders after the components
+            (see :py:meth:`transform`) are included, with key ``'remainder'``.
+        :type remainder: bool
+
+        :return: Keys are the integer partition strings labelling isotypic components,
+            values are lists of the norms of the corresponding components, in the
+            order of the index combinations.
+        :rtype: dict
+        """
+        if batch_size is None:
+            batch_size = SchurTransform.default_batch_size
+        if is_memory_mapped(samples):
+            means = calculate_means(samples)
+        else:
+            centered = self.recenter_at_mean(samples, dtype=dtype)
+        partitions, stacked_projectors = self.prepare_batch_projectors(projectors)
+        content = self.initialize_content(partitions, remainder=remainder)
+        iterator = iter(index_combinations)
+        while True:
+            block = [list(combination) for combination in islice(iterator, batch_size)]
+            if len(block) == 0:
+                break
+            if engine is ProjectionEngine.GRAM:
+                block_series = sorted(set(index for combination in block for index in combination))
+                gram_bytes = pow(len(block_series) * samples.shape[1], 2) * np.dtype(dtype).itemsize
+                if gram_bytes <= SchurTransform.gram_max_bytes:
+                    groups = [block]
+                else:
+                    groups = [[combination] for combination in block]
+                norms = []
+                for group in groups:
+                    series = sorted(set(index for combination in group for index in combination))
+                    if is_memory_mapped(samples):
+                        subsamples = np.subtract(samples[series], means[series][:, np.newaxis, :], dtype=dtype)
+                    else:
+                        subsamples = centered[series]
+                    with measure('moments'):
+                        gram_matrices = calculate_gram_matrices(subsamples)
+                    positions = {index : position for position, index in enumerate(series)}
+                    for combination in group:
+                        indices = [positions[index] for index in combination]
+                        norms.append(self.calculate_gram_norms(
+                            gram_matrices[np.ix_(indices, indices)],
+                            projectors,
+                            remainder=remainder,
+                        ))
+                for key in content:
+                    content[key].extend([n[key] for n in norms])
+            else:
+                indices = np.array(block)
+                if is_memory_mapped(samples):
+                    subsamples = np.subtract(samples[indices], means[indices][:, :, np.newaxis, :], dtype=dtype)
+                else:
+                    subsamples = centered[indices]
+                with measure('moments'):
+                    moments = calculate_joint_moments(subsamples)
+                self.append_batch_norms(content, moments, projectors, stacked_projectors)
+        return content
+
+    def calculate_sequential_content(self,
+        samples,
+        degree: int=None,
+        projectors=None,
+        engine: ProjectionEngine=ProjectionEngine.PERMUTATION,
+        batch_size: int=None,
+        dtype=np.float64,
+        remainder: bool=False,
+    ):
+        """
+        Specialization of :py:meth:`calculate_content` to the consecutive windows of
+        series ``[i, i+1, ..., i+degree-1]``. The Khatri-Rao products shared by
+        overlapping windows are reused (see
+        :py:class:`.moments.SlidingWindowMoments`), so that the time is linear in the
+        number of series.
+
+        :param samples: As in :py:meth:`calculate_content`.
+        :type samples: numpy.array
+
+        :param degree: The number of series in each window.
+        :type degree: int
+
+        :param projectors: As in :py:meth:`calculate_content`.
+        :type projectors: dict or PermutationProjectors
+
+        :param engine: As in :py:meth:`calculate_content`. The ``GRAM`` engine does
+            not use the joint moments; instead the Gram matrices of the series of a
+            block of windows are shared by the windows of the block.
+        :type engine: ProjectionEngine
+
+        :param batch_size: The number of windows whose moments are decomposed
+            together.
+        :type batch_size: int
+
+        :param dtype: As in :py:meth:`calculate_content`.
+        :type dtype: numpy.dtype
+
+        :param remainder: As in :py:meth:`calculate_content`.
+        :type remainder: bool
+
+        :return: As in :py:meth:`calculate_content`, in the order of the windows.
+        :rtype: dict
+        """
+        number_of_series = samples.shape[0]
+        if engine is ProjectionEngine.GRAM:
+            windows = [[i + j for j in range(degree)] for i in range(number_of_series - degree + 1)]
+            return self.calculate_content(
+                samples,
+                windows,
+                projectors,
+                engine=engine,
+                batch_size=batch_size,
+                dtype=dtype,
+                remainder=remainder,
+            )
+        if batch_size is None:
+            batch_size = SchurTransform.default_batch_size
+        if is_memory_mapped(samples):
+            means = calculate_means(samples)
+            centered = (np.subtract(samples[i], means[i], dtype=dtype) for i in range(number_of_series))
+        else:
+            centered = self.recenter_at_mean(samples, dtype=dtype)
+        partitions, stacked_projectors = self.prepare_batch_projectors(projectors)
+        content = self.initialize_content(partitions, remainder=remainder)
+        window = SlidingWindowMoments(window_size=degree)
+        block = []
+        for frame in centered:
+            moment = window.push(frame)
+            if moment is not None:
+                block.append(moment)
+            if len(block) == batch_size:
+                self.append_batch_norms(content, np.stack(block), projectors, stacked_projectors)
+                block = []
+        if len(block) > 0:
+            self.append_batch_norms(content, np.stack(block), projectors, stacked_projectors)
+        return content
+
+    def stream_sequential_content(self,
+        frames,
+        degree: int=None,
+        engine: str=None,
+        dtype=None,
+        partitions: list=None,
+        remainder: bool=False,
+    ):
+        """
+        Streaming version of the ``SEQUENTIAL_CONTENT`` summary. Each frame is one
+        series of the samples (with axes sample and spatial coordinate), and is
+        recentered at its mean on arrival. Only the frames of the current window (and
+        their Khatri-Rao products) are retained.
+
+        :param frames: Iterable of arrays of shape (sample, spatial coordinate), e.g.
+            a generator yielding frames as they are acquired.
+        :type frames: iterable
+
+        :param degree: The number of consecutive frames in each window.
+        :type degree: int
+
+        :param engine: The string name of ``PERMUTATION`` (default) or ``OPERATOR``.
+        :type engine: str
+
+        :param dtype: As in :py:meth:`transform`.
+        :type dtype: str or numpy.dtype
+
+        :param partitions: As in :py:meth:`transform`.
+        :type partitions: list
+
+        :param remainder: As in :py:meth:`transform`.
+        :type remainder: bool
+
+        :return: Generator yielding, once for each complete window, a dictionary whose
+            keys are the integer partition strings and whose values are the norms of
+            the components of the window's joint moment.
+        :rtype: generator
+        """
+        if engine is None:
+            engine = ProjectionEngine.PERMUTATION
+        else:
+            engine = ProjectionEngine[engine]
+        if engine is ProjectionEngine.GRAM:
+            logger.error('The GRAM engine does not support streaming.')
+            return
+        dtype = self.resolve_dtype(dtype)
+        if dtype is None:
+            return
+        window = SlidingWindowMoments(window_size=degree)
+        projectors = None
+        for frame in frames:
+            frame = np.asarray(frame, dtype=dtype)
+            if projectors is None:
+                projectors = self.get_projectors(
+                    dimension=frame.shape[1],
+                    degree=degree,
+                    engine=engine,
+                    dtype=dtype,
+                    partitions=partitions,
+                )
+                if projectors is None:
+                    return
+                keys, stacked_projectors = self.prepare_batch_projectors(projectors)
+            moment = window.push(frame - np.mean(frame, axis=0))
+            if moment is None:
+                continue
+            content = self.initialize_content(keys, remainder=remainder)
+            self.append_batch_norms(content, moment[np.newaxis], projectors, stacked_projectors)
+            yield {key : norms[0] for key, norms in content.items()}
+
+    @staticmethod
+    def initialize_content(partitions: list=None, remainder: bool=False):
+        """
+        :return: Empty lists of norms, keyed by the partition strings (and
+            ``'remainder'`` if ``remainder`` is True).
+        :rtype: dict
+        """
+        content = {key : [] for key in partitions}
+        if remainder:
+            content[SchurTransform.remainder_key] = []
+        return content
+
+    def prepare_batch_projectors(self, projectors):
+        """
+        :param projectors: As in :py:meth:`calculate_decomposition`.
+        :type projectors: dict or PermutationProjectors
+
+        :return: The list of partition strings, and in case of dense projectors the
+            stacked projector matrix as returned by :py:meth:`stack_projectors` (else
+            None).
+        :rtype: tuple
+        """
+        if isinstance(projectors, PermutationProjectors):
+            return projectors.get_partitions(), None
+        partitions = list(projectors.keys())
+        return partitions, self.stack_projectors(projectors, partitions)
+
+    def append_batch_norms(self,
+        content,
+        moments,
+        projectors,
+        stacked_projectors=None,
+    ):
+        """
+        Calculates and validates the norms of the components of a stack of moments,
+        and appends them to the lists of ``content``.
+
+        :param content: Keys are partition strings, values are lists of norms. If
+            there is also the key ``'remainder'``, the norms of the remainders are
+            appended to its list.
+        :type content: dict
+
+        :param moments: A stack of joint moment tensors, with a leading batch axis.
+        :type moments: numpy.array
+
+        :param projectors: As in :py:meth:`calculate_batch_norms`.
+        :type projectors: dict or PermutationProjectors
+
+        :param stacked_projectors: As in :py:meth:`calculate_batch_norms`.
+        :type stacked_projectors: numpy.array
+        """
+        block_norms = self.calculate_batch_norms(moments, projectors, stacked_projectors)
+        self.validate_batch_norms(block_norms, moments)
+        keys = [key for key in content if key != SchurTransform.remainder_key]
+        for p, key in enumerate(keys):
+            content[key].extend(block_norms[:, p])
+        if SchurTransform.remainder_key in content:
+            batch_size = moments.shape[0]
+            squared_norms = np.sum(np.square(moments.reshape(batch_size, -1)), axis=1)
+            content[SchurTransform.remainder_key].extend(
+                self.calculate_remainder_norm(block_norms, squared_norms)
+            )
+
+    @staticmethod
+    def stack_projectors(projectors, partitions):
+        """
+        :param projectors: Dense projectors, as returned by
+            :py:meth:`recalculate_projectors`.
+        :type projectors: dict
+
+        :param partitions: The order in which to stack the projectors.
+        :type partitions: list
+
+        :return: The projectors regarded as square matrices, stacked vertically. The
+            product of this matrix with a flattened tensor is the concatenation of the
+            flattened components of the tensor. Projectors of vanishing components
+            (see :py:func:`.symmetric_group.is_vanishing_partition`) are omitted. None
+            if all are omitted.
+        :rtype: numpy.array
+        """
+        matrices = []
+        for key in partitions:
+            projector = projectors[key]
+            if is_vanishing_partition(key, projector.dimension):
+                continue
+            rank = int(np.sqrt(projector.data.size) + 0.5)
+            matrices.append(projector.data.reshape(rank, rank))
+        if len(matrices) == 0:
+            return None
+        return np.concatenate(matrices, axis=0)
+
+    @instrumented('decomposition')
+    def calculate_batch_norms(self,
+        moments,
+        projectors,
+        stacked_projectors=None,
+    ):
+        """
+        :param moments: A stack of joint moment tensors, with a leading batch axis.
+        :type moments: numpy.array
+
+        :param projectors: As in :py:meth:`calculate_decomposition`.
+        :type projectors: dict or PermutationProjectors
+
+        :param stacked_projectors: In case of dense projectors, as returned by
+            :py:meth:`stack_projectors`.
+        :type stacked_projectors: numpy.array
+
+        :return: The norms of the components of each tensor, with axes (batch,
+            partition). The columns of vanishing components are exactly zero.
+        :rtype: numpy.array
+        """
+        if isinstance(projectors, PermutationProjectors):
+            return projectors.norms_from_class_inner_products(
+                projectors.calculate_class_inner_products(moments)
+            )
+        batch_size = moments.shape[0]
+        computed = [
+            p for p, (key, projector) in enumerate(projectors.items())
+            if not is_vanishing_partition(key, projector.dimension)
+        ]
+        norms = np.zeros((batch_size, len(projectors)), dtype=moments.dtype)
+        if len(computed) == 0:
+            return norms
+        flattened = moments.reshape(batch_size, -1)
+        components = np.matmul(flattened, stacked_projectors.T)
+        components = components.reshape(batch_size, -1, flattened.shape[1])
+        norms[:, computed] = np.linalg.norm(components, axis=2)
+        return norms
+
+    @instrumented('validation')
+    def validate_batch_norms(self, norms, moments):
+        """
+        Batched version of :py:meth:`validate_norms`.
+
+        :param norms: As returned by :py:meth:`calculate_batch_norms`.
+        :type norms: numpy.array
+
+        :param moments: The stack of tensors whose component norms were calculated.
+        :type moments: numpy.array
+
+        :return: True if for each tensor in the stack, the squared norms of the
+            components sum to the squared norm of the tensor (within an error
+            tolerance), or do not exceed it if only some of the components were
+            calculated.
+        :rtype: bool
+        """
+        degree = len(moments.shape) - 1
+        dimension = moments.shape[1]
+        validator = get_validator()
+        if not validator.should_validate('batch_norms', degree, dimension):
+            return True
+        batch_size = moments.shape[0]
+        squared_norms = np.sum(np.square(moments.reshape(batch_size, -1)), axis=1)
+        resummed = np.sum(np.square(norms), axis=1)
+        if norms.shape[1] == count_partitions(degree):
+            defects = np.abs(resummed - squared_norms)
+        else:
+            defects = np.clip(resummed - squared_norms, 0, None)
+        relative_tolerance = get_relative_tolerance(moments.dtype)
+        failures = defects > squared_norms * relative_tolerance
+        if np.any(failures):
+            logger.error(
+                'Squared norms of components do not sum to squared norm of original tensor in %s of %s cases.',
+                np.sum(failures),
+                batch_size,
+            )
+            logger.error('Largest defect: %s', np.max(defects))
+            worst = int(np.argmax(defects))
+            validator.record_failure({
+                'check' : 'batch_norms',
+                'degree' : degree,
+                'dimension' : dimension,
+                'defect' : float(defects[worst]),
+                'tolerance' : float(squared_norms[worst] * relative_tolerance),
+                'reference' : float(squared_norms[worst]),
+                'failures' : int(np.sum(failures)),
+                'batch_size' : batch_size,
+            })
+            return False
+        else:
+            logger.debug('Squared norms of components sum to squared norm of original tensor.')
+            return True
+
+    def select_engine(self,
+        engine: str=None,
+        degree: int=None,
+        dimension: int=None,
+        summary: DecompositionSummary=DecompositionSummary.COMPONENTS,
+        number_of_samples: int=None,
+        number_of_series: int=None,
+    ):
+        """
+        :param engine: The string name of a member of :py:class:`ProjectionEngine`, or
+            None for automatic selection.
+        :type engine: str
+
+        :param degree: The number of factors in the tensor product.
+        :type degree: int
+
+        :param dimension: The dimension of the base vector space.
+        :type dimension: int
+
+        :param summary: The summary to be calculated.
+        :type summary: DecompositionSummary
+
+        :param number_of_samples: The number of samples of each series.
+        :type number_of_samples: int
+
+        :param number_of_series: The number of series, if different from ``degree``
+            (for the content summaries).
+        :type number_of_series: int
+
+        :return: The engine to use. If none was requested, for summaries requiring
+            only norms ``GRAM`` or ``PERMUTATION``, whichever has the lower estimated
+            cost, with ``GRAM`` excluded if the Gram matrices of all of the series
+            (number of series² × number of samples² entries) would exceed
+            ``gram_max_bytes``; otherwise ``OPERATOR`` if the dense projectors are distributed with
+            the library or cached, else ``PERMUTATION``. None if the requested engine does not
+            support the summary.
+        :rtype: ProjectionEngine
+        """
+        if engine is not None:
+            engine = ProjectionEngine[engine]
+            if engine is ProjectionEngine.GRAM and summary is DecompositionSummary.COMPONENTS:
+                logger.error('The GRAM engine does not calculate components, only norms.')
+                return None
+            return engine
+        if summary is not DecompositionSummary.COMPONENTS:
+            if number_of_samples is not None:
+                if number_of_series is None:
+                    number_of_series = degree
+                tensor_cost = (number_of_samples + factorial(degree)) * pow(dimension, degree)
+                gram_cost = (degree * degree * dimension + factorial(degree) * degree) * pow(number_of_samples, 2)
+                gram_bytes = pow(number_of_series * number_of_samples, 2) * np.dtype(np.float64).itemsize
+                if gram_cost < tensor_cost and gram_bytes <= SchurTransform.gram_max_bytes:
+                    return ProjectionEngine.GRAM
+            return ProjectionEngine.PERMUTATION
+        if self.projectors_are_available(dimension=dimension, degree=degree):
+            return ProjectionEngine.OPERATOR
+        return ProjectionEngine.PERMUTATION
+
+    @instrumented('projector_retrieval')
+    def get_projectors(self,
+        dimension: int=None,
+        degree: int=None,
+        engine: ProjectionEngine=ProjectionEngine.OPERATOR,
+        dtype=np.float64,
+        partitions: list=None,
+    ):
+        """
+        :param dimension: The dimension of the base vector space.
+        :type dimension: int
+
+        :param degree: The number of factors in the tensor product.
+        :type degree: int
+
+        :param engine: The projector representation.
+        :type engine: ProjectionEngine
+
+        :param dtype: The floating point type of dense projectors. Stored projectors
+            are decoded directly into this type (see :py:meth:`retrieve_projectors`);
+            each type is kept in the registry separately.
+        :type dtype: numpy.dtype
+
+        :param partitions: If provided, only the projectors for these partition
+            strings are returned (see :py:meth:`select_projectors`).
+        :type partitions: list
+
+        :return: Either the dictionary of dense projectors as returned by
+            :py:meth:`recalculate_projectors`, or a
+            :py:class:`.permutation_projectors.PermutationProjectors` object (which
+            applies to tensors of any type).
+        """
+        if partitions is not None:
+            return self.select_projectors(
+                self.get_projectors(dimension=dimension, degree=degree, engine=engine, dtype=dtype),
+                partitions,
+            )
+        if engine in [ProjectionEngine.PERMUTATION, ProjectionEngine.GRAM]:
+            return self.get_permutation_projectors(degree=degree, dimension=dimension)
+        return get_registry().get(
+            kind='projectors',
+            degree=degree,
+            dimension=dimension,
+            dtype=dtype,
+            factory=lambda: self.retrieve_projectors(dimension=dimension, degree=degree, dtype=dtype),
+        )
+
+    @staticmethod
+    def select_projectors(projectors=None, partitions: list=None):
+        """
+        :param projectors: As in :py:meth:`calculate_decomposition`, or None.
+        :type projectors: dict or PermutationProjectors
+
+        :param partitions: Partition strings labelling some of the projectors, or a
+            single partition string. None for all.
+        :type partitions: list
+
+        :return: The projectors for the given partitions only, in the original order.
+        :rtype: dict or PermutationProjectors
+
+        :raises ValueError: If ``partitions`` is empty, or if one of the partitions
+            does not label a projector.
+        """
+        if partitions is not None and len(partitions) == 0:
+            raise ValueError('The selection of partitions is empty; pass None for all partitions.')
+        if projectors is None or partitions is None:
+            return projectors
+        if isinstance(partitions, str):
+            partitions = [partitions]
+        if isinstance(projectors, PermutationProjectors):
+            available = projectors.get_partitions()
+        else:
+            available = list(projectors.keys())
+        unknown = [partition for partition in partitions if not partition in available]
+        if len(unknown) > 0:
+            raise ValueError('No projectors for partitions %s. Expected some of: %s' % (unknown, available))
+        selected = [key for key in available if key in partitions]
+        if isinstance(projectors, PermutationProjectors):
+            return projectors.restrict(selected)
+        return {key : projectors[key] for key in selected}
+
+    @staticmethod
+    def cast_projectors(projectors: dict=None, dtype=None):
+        """
+        :param projectors: Dense projectors, as returned by
+            :py:meth:`recalculate_projectors`, or None.
+        :type projectors: dict
+
+        :param dtype: A floating point type.
+        :type dtype: numpy.dtype
+
+        :return: The projectors with data of the given type.
+        :rtype: dict
+        """
+        if projectors is None:
+            return None
+        return {
+            key : TensorOperator.zero(
+                number_of_factors=projector.number_of_factors,
+                dimension=projector.dimension,
+                dtype=dtype,
+            ) if is_vanishing_partition(key, projector.dimension) else projector.astype(dtype)
+            for key, projector in projectors.items()
+        }
+
+    def get_permutation_projectors(self,
+        degree: int=None,
+        dimension: int=None,
+    ):
+        """
+        (The result is kept in the process-wide registry; see :py:mod:`.registry`.)
+
+        :param degree: The number of factors in the tensor product.
+        :type degree: int
+
+        :param dimension: If provided, the components which vanish in this dimension
+            are not calculated (see
+            :py:meth:`.permutation_projectors.PermutationProjectors.prune`).
+        :type dimension: int
+
+        :return: The projectors onto isotypic components, represented as weighted
+            sums of permutations.
+        :rtype: PermutationProjectors
+        """
+        if dimension is not None:
+            return get_registry().get(
+                kind='permutation_projectors',
+                degree=degree,
+                dimension=dimension,
+                factory=lambda: self.get_permutation_projectors(degree=degree).prune(dimension),
+            )
+        return get_registry().get(
+            kind='permutation_projectors',
+            degree=degree,
+            factory=lambda: PermutationProjectors(degree=degree),
+        )
+
     def recalculate_projectors(self,
         dimension: int=None,
         degree: int=None,
         get_cached: bool=True,
     ):
         """
-        (This function is wrapped by ``functools.lru_cache``).
-
         :param dimension: The dimension of the base vector space.
         :type dimension: int
 
@@ -209,46 +1544,44 @@ class SchurTransform:
         :type degree: int
 
         :param get_cached: Default True. If True, attempts to retrieve the projectors
-            from cached numpy-exported archive files.
+            from the process-wide registry (see :py:mod:`.registry`), or else from
+            cached numpy-exported archive files.
         :type get_cached: bool
 
         :return: Keys are the integer partition strings, values are the
             :py:class:`.tensor_operator.TensorOperator` objects of the corresponding
-            Young projectors.
+            Young projectors. The projectors of the components which vanish in the
+            given dimension (see :py:func:`.symmetric_group.is_vanishing_partition`)
+            are not calculated; they are zero operators as returned by
+            :py:meth:`.tensor_operator.TensorOperator.zero`.
         :rtype: dict
         """
         if get_cached:
-            projectors = self.retrieve_projectors(dimension=dimension, degree=degree)
-            return projectors
+            return self.get_projectors(dimension=dimension, degree=degree, engine=ProjectionEngine.OPERATOR)
 
-        character_table = CharacterTable(degree=degree)
+        character_table = get_character_table(degree)
         logger.debug('Grouping permutations on %s elements into conjugacy classes.', degree)
         conjugacy_classes = character_table.get_conjugacy_classes()
+        logger.debug('Aggregating permutation operators along %s classes.', len(conjugacy_classes))
         aggregated_permutation_operators = {
-            partition_string : TensorOperator(
+            partition_string : TensorOperator.permutation_sum(
                 number_of_factors=degree,
                 dimension=dimension,
-            ) for partition_string in conjugacy_classes.keys()
+                permutations=conjugacy_class,
+            ) for partition_string, conjugacy_class in conjugacy_classes.items()
         }
-        logger.debug('Aggregating permutation operators along %s classes.', len(conjugacy_classes))
-        for partition_string, conjugacy_class in conjugacy_classes.items():
-            logger.debug('Doing aggregation over %s elements.', len(conjugacy_class))
-            for permutation in conjugacy_class:
-                aggregated_permutation_operators[partition_string].add(
-                    TensorOperator(
-                        number_of_factors=degree,
-                        dimension=dimension,
-                        permutation_inverse=permutation,
-                    ),
-                    inplace=True
-                )
         projectors = {
-            key : TensorOperator(
+            key : TensorOperator.zero(
+                number_of_factors=degree,
+                dimension=dimension,
+            ) if is_vanishing_partition(key, dimension) else TensorOperator(
                 number_of_factors=degree,
                 dimension=dimension,
             ) for key in character_table.get_characters().keys()
         }
         for key, character in character_table.get_characters().items():
+            if is_vanishing_partition(key, dimension):
+                continue
             for partition_string, aggregated_operator in aggregated_permutation_operators.items():
                 projectors[key].add(
                     aggregated_operator.scale_by(amount=character[partition_string]),
@@ -256,6 +1589,8 @@ class SchurTransform:
                 )
             character_dimension = character[character_table.get_identity_partition_string()]
             projectors[key].scale_by(amount=character_dimension / factorial(degree), inplace=True)
+        if not get_validator().should_validate('projectors', degree, dimension):
+            return projectors
         if not self.validate_projectors(projectors, character_table):
             return None
         return projectors
@@ -267,7 +1602,7 @@ class SchurTransform:
         """
         :param projectors: The projectors onto isotypic components, as returned by
             :py:meth:`recalculate_projectors`.
-        :type projectors: list
+        :type projectors: dict
 
         :param character_table: The wrapper object around the character table for the
             symmetric group pertaining to the tensor product space which is the
@@ -285,27 +1620,39 @@ class SchurTransform:
             number_of_factors=degree,
             dimension=dimension,
         )
-        for projector in projectors.values():
-            accumulator.add(projector, inplace=True)
+        for key, projector in projectors.items():
+            if not is_vanishing_partition(key, dimension):
+                accumulator.add(projector, inplace=True)
         identity_scaled = TensorOperator(
             number_of_factors=degree,
             dimension = dimension,
             identity = True,
         )
-        tolerance = np.linalg.norm(accumulator.data) / pow(10, 9)
-        if not np.linalg.norm(accumulator.data - identity_scaled.data) < tolerance:
+        reference = np.linalg.norm(accumulator.data)
+        tolerance = reference * get_relative_tolerance(accumulator.data.dtype)
+        defect = np.linalg.norm(accumulator.data - identity_scaled.data)
+        if not defect < tolerance:
             logger.error('Projectors do not sum to identity.')
-            logger.error(
-                'Norm of defect: %s',
-                np.linalg.norm(accumulator.data - identity_scaled.data),
-            )
+            logger.error('Norm of defect: %s', defect)
+            get_validator().record_failure({
+                'check' : 'projectors',
+                'degree' : degree,
+                'dimension' : dimension,
+                'defect' : float(defect),
+                'tolerance' : float(tolerance),
+                'reference' : float(reference),
+            })
             return False
         else:
             logger.debug('Projectors sum to identity.')
             return True
 
+    @instrumented('centering')
     def recenter_at_mean(self,
         samples,
+        out=None,
+        preserve_dtype: bool=False,
+        dtype=None,
     ):
         """
         :param samples: "Registered" spatial samples data. A multi-dimensional array, or
@@ -317,25 +1664,42 @@ class SchurTransform:
 
         :type samples: multi-dimensional array-like
 
+        :param out: Optional buffer of the same shape as ``samples`` into which the
+            recentered values are written. May be ``samples`` itself, for recentering
+            in place.
+        :type out: numpy.array
+
+        :param preserve_dtype: If True and ``samples`` has a floating point dtype, the
+            result has the same dtype (rather than float64). Ignored if ``out`` is
+            provided, in which case the dtype of ``out`` is used.
+        :type preserve_dtype: bool
+
+        :param dtype: The floating point type of the result (and of the calculation
+            of the means). Takes precedence over ``preserve_dtype``, and is ignored if
+            ``out`` is provided.
+        :type dtype: numpy.dtype
+
         :return: Same as ``samples``, except that a translation is applied to each
             spatial variable which results in the new variable having mean vector equal
             to 0.
         :rtype: numpy.array
         """
-        degree = samples.shape[0]
-        number_of_samples = samples.shape[1]
-        dimension = samples.shape[2]
-        means = np.array(
-            [[np.mean(samples[i,:,a]) for a in range(dimension)] for i in range(degree)]
-        )
-        recentered = np.zeros(samples.shape)
-        for i in range(degree):
-            for a in range(dimension):
-                m = means[i,a]
-                for j in range(number_of_samples):
-                    recentered[i,j,a] = samples[i,j,a] - m
-        return recentered
+        samples = np.asarray(samples)
+        if out is not None:
+            dtype = out.dtype
+        elif dtype is not None:
+            dtype = np.dtype(dtype)
+        elif preserve_dtype and np.issubdtype(samples.dtype, np.floating):
+            dtype = samples.dtype
+        else:
+            dtype = np.float64
+        means = np.mean(samples, axis=1, keepdims=True, dtype=dtype)
+        if out is None:
+            out = np.empty(samples.shape, dtype=dtype)
+        np.subtract(samples, means, out=out)
+        return out
 
+    @instrumented('moments')
     def calculate_covariance_tensor(self, samples):
         """
         :param samples: "Registered" spatial samples data. A multi-dimensional array, or
@@ -351,24 +1715,17 @@ class SchurTransform:
         :rtype: Tensor
         """
         degree = samples.shape[0]
-        number_of_samples = samples.shape[1]
         dimension = samples.shape[2]
         covariance_tensor = Tensor(
             number_of_factors=degree,
             dimension=dimension,
+            data=calculate_joint_moment(samples),
         )
-        it = covariance_tensor.get_entry_iterator()
-        for entry in it:
-            M = it.multi_index
-            it[0] = np.sum([
-                np.prod([
-                    samples[i, j, M[i]] for i in range(degree)
-                ]) for j in range(number_of_samples)
-            ])
         if (covariance_tensor.data == 0).all():
             logger.warning('Covariance tensor is identically 0.')
         return covariance_tensor
 
+    @instrumented('decomposition')
     def calculate_decomposition(self,
         tensor,
         projectors,
@@ -378,21 +1735,235 @@ class SchurTransform:
         :type tensor: Tensor
 
         :param projectors: Projector operators onto isotypic components, as returned by
-            :py:meth:`recalculate_projectors`.
-        :type projectors: dict
+            :py:meth:`recalculate_projectors`, or a
+            :py:class:`.permutation_projectors.PermutationProjectors` object.
+        :type projectors: dict or PermutationProjectors
 
         :return: Keys are the integer partition strings labelling isotypic components,
             values are the components of the input tensor, as :py:class:`.tensor.Tensor`
             objects.
         :rtype: dict
         """
-        degree = len(tensor.data.shape)
+        if isinstance(projectors, PermutationProjectors):
+            return projectors.apply(tensor)
         decomposition = {}
         for partition_string, projector in projectors.items():
-            component = projector.apply(tensor)
+            if is_vanishing_partition(partition_string, projector.dimension):
+                component = Tensor(
+                    number_of_factors=tensor.number_of_factors,
+                    dimension=tensor.dimension,
+                    dtype=tensor.data.dtype,
+                )
+            else:
+                component = projector.apply(tensor)
             decomposition[partition_string] = component
         return decomposition
 
+    @instrumented('decomposition')
+    def calculate_norms(self,
+        tensor,
+        projectors,
+    ):
+        """
+        :param tensor: Input tensor to be decomposed.
+        :type tensor: Tensor
+
+        :param projectors: As in :py:meth:`calculate_decomposition`. In case of
+            :py:class:`.permutation_projectors.PermutationProjectors`, the components
+            are not materialized.
+        :type projectors: dict or PermutationProjectors
+
+        :return: Keys are the integer partition strings labelling isotypic components,
+            values are the Euclidean norms of the components of the input tensor.
+        :rtype: dict
+        """
+        if isinstance(projectors, PermutationProjectors):
+            return projectors.calculate_norms(tensor)
+        zero = tensor.data.dtype.type(0)
+        return {
+            i : zero if is_vanishing_partition(i, projector.dimension) else np.linalg.norm(
+                projector.apply(tensor).data
+            )
+            for i, projector in projectors.items()
+        }
+
+    def calculate_sample_norms(self,
+        centered,
+        projectors,
+        engine: ProjectionEngine=ProjectionEngine.PERMUTATION,
+        remainder: bool=False,
+    ):
+        """
+        Calculates and validates the norms of the components of the decomposition of
+        the joint moment of the given samples.
+
+        :param centered: Samples recentered at the mean, as returned by
+            :py:meth:`recenter_at_mean`.
+        :type centered: numpy.array
+
+        :param projectors: As in :py:meth:`calculate_decomposition`. The ``GRAM``
+            engine requires :py:class:`.permutation_projectors.PermutationProjectors`.
+        :type projectors: dict or PermutationProjectors
+
+        :param engine: If ``GRAM``, the norms are calculated from the Gram matrices
+            of the samples. Otherwise, from the joint moment tensor.
+        :type engine: ProjectionEngine
+
+        :param remainder: If True, the norm of the remainder after the components
+            (see :py:meth:`transform`) is included, with key ``'remainder'``.
+        :type remainder: bool
+
+        :return: As in :py:meth:`calculate_norms`.
+        :rtype: dict
+        """
+        if engine is ProjectionEngine.GRAM:
+            with measure('moments'):
+                gram_matrices = calculate_gram_matrices(centered)
+            return self.calculate_gram_norms(gram_matrices, projectors, remainder=remainder)
+        covariance_tensor = self.calculate_covariance_tensor(centered)
+        norms = self.calculate_norms(covariance_tensor, projectors)
+        self.validate_norms(norms, tensor=covariance_tensor)
+        if remainder:
+            squared_norm = np.vdot(covariance_tensor.data, covariance_tensor.data)
+            norms[SchurTransform.remainder_key] = self.calculate_remainder_norm(norms, squared_norm)
+        return norms
+
+    def calculate_gram_norms(self,
+        gram_matrices,
+        projectors,
+        remainder: bool=False,
+    ):
+        """
+        Calculates and validates the norms of the components of the decomposition of
+        a joint moment, from the Gram matrices of its series.
+
+        :param gram_matrices: As returned by :py:func:`.gram.calculate_gram_matrices`
+            for the series of the joint moment (e.g. a sub-block, indexed by an index
+            combination, of the Gram matrices of all of the series).
+        :type gram_matrices: numpy.array
+
+        :param projectors: As in :py:meth:`calculate_sample_norms`.
+        :type projectors: PermutationProjectors
+
+        :param remainder: As in :py:meth:`calculate_sample_norms`.
+        :type remainder: bool
+
+        :return: As in :py:meth:`calculate_norms`.
+        :rtype: dict
+        """
+        with measure('decomposition'):
+            norms = dict(zip(
+                projectors.get_partitions(),
+                projectors.norms_from_class_inner_products(
+                    calculate_class_inner_products(gram_matrices, projectors)
+                ),
+            ))
+        squared_norm = calculate_squared_norm(gram_matrices)
+        self.validate_norms(norms, squared_norm=squared_norm, degree=gram_matrices.shape[0])
+        if remainder:
+            norms[SchurTransform.remainder_key] = self.calculate_remainder_norm(norms, squared_norm)
+        return norms
+
+    @staticmethod
+    def calculate_remainder_norm(norms, squared_norm):
+        """
+        :param norms: Norms of some of the components of a tensor T, as a dictionary
+            as returned by :py:meth:`calculate_norms`, or an array with a trailing
+            axis of partitions as returned by :py:meth:`calculate_batch_norms`.
+        :type norms: dict or numpy.array
+
+        :param squared_norm: The squared norm ‖T‖² (an array for a batch).
+        :type squared_norm: float or numpy.array
+
+        :return: The norm of the remainder T - Σ P_λ T, √(‖T‖² - Σ ‖P_λ T‖²) by
+            orthogonality of the components (small negative values due to rounding
+            are clipped to 0).
+        :rtype: float or numpy.array
+        """
+        if isinstance(norms, dict):
+            norms = np.array(list(norms.values()))
+        return np.sqrt(np.clip(squared_norm - np.sum(np.square(norms), axis=-1), 0, None))
+
+    @staticmethod
+    def calculate_remainder(decomposition: dict=None, tensor: Tensor=None):
+        """
+        :param decomposition: Some of the components of ``tensor``, as returned by
+            :py:meth:`calculate_decomposition`.
+        :type decomposition: dict
+
+        :param tensor: The decomposed tensor.
+        :type tensor: Tensor
+
+        :return: The remainder, ``tensor`` minus the sum of the components.
+        :rtype: Tensor
+        """
+        data = np.array(tensor.data)
+        for component in decomposition.values():
+            np.subtract(data, component.data, out=data)
+        return Tensor(
+            number_of_factors=tensor.number_of_factors,
+            dimension=tensor.dimension,
+            data=data,
+        )
+
+    @instrumented('validation')
+    def validate_norms(self, norms, tensor=None, squared_norm: float=None, degree: int=None):
+        """
+        :param norms: Norms of the components of an additive Schur-Weyl decomposition,
+            as returned e.g. by :py:meth:`calculate_norms`.
+        :type norms: dict
+
+        :param tensor: A given tensor.
+        :type tensor: Tensor
+
+        :param squared_norm: The squared norm of the given tensor, if ``tensor`` is not
+            supplied.
+        :type squared_norm: float
+
+        :param degree: The number of tensor factors of the given tensor, if ``tensor``
+            is not supplied.
+        :type degree: int
+
+        :return: True if the squared norms sum to the squared norm of the supplied
+            tensor (within an error tolerance), as they must for an orthogonal
+            decomposition. If only some of the components were calculated, True if
+            the sum does not exceed the squared norm of the tensor.
+        :rtype: bool
+        """
+        if tensor is not None:
+            degree = len(tensor.data.shape)
+            dimension = tensor.data.shape[0]
+        else:
+            dimension = None
+        validator = get_validator()
+        if not validator.should_validate('norms', degree, dimension):
+            return True
+        if tensor is not None:
+            squared_norm = np.vdot(tensor.data, tensor.data)
+        resummed = sum(norm * norm for norm in norms.values())
+        tolerance = squared_norm * get_relative_tolerance(np.result_type(squared_norm, *norms.values()))
+        if len(norms) == count_partitions(degree):
+            defect = abs(resummed - squared_norm)
+        else:
+            defect = max(resummed - squared_norm, 0)
+        if not defect <= tolerance:
+            logger.error('Squared norms of components do not sum to squared norm of original tensor.')
+            logger.error('Defect: %s', defect)
+            logger.error('Squared norm of original tensor: %s', squared_norm)
+            validator.record_failure({
+                'check' : 'norms',
+                'degree' : degree,
+                'dimension' : dimension,
+                'defect' : float(defect),
+                'tolerance' : float(tolerance),
+                'reference' : float(squared_norm),
+            })
+            return False
+        else:
+            logger.debug('Squared norms of components sum to squared norm of original tensor.')
+            return True
+
+    @instrumented('validation')
     def validate_decomposition(self, decomposition, tensor):
         """
         :param decomposition: Additive Schur-Weyl decomposition, as returned e.g. by
@@ -403,22 +1974,43 @@ class SchurTransform:
         :type tensor: Tensor
 
         :return: True if the sum of the components of the decomposition equals to the
-            supplied tensor (within an error tolerance).
+            supplied tensor (within an error tolerance). If only some of the components
+            were calculated, True if the remainder (the tensor minus the sum of the
+            components) is orthogonal to the sum of the components, as it must be.
         :rtype: bool
         """
         degree = len(tensor.data.shape)
         dimension = tensor.data.shape[0]
-        resummed = Tensor(
-            number_of_factors = degree,
-            dimension = dimension,
-        )
-        for i, component in decomposition.items():
-            resummed.add(component, inplace=True)
-        tolerance = np.linalg.norm(tensor.data) / pow(10, 9)
-        if not np.linalg.norm(resummed.data - tensor.data) < tolerance:
-            logger.error('Components do not sum to original tensor.')
-            logger.error('Norm of defect: %s', np.linalg.norm(resummed.data - tensor.data))
-            logger.error('Norm of original tensor: %s', np.linalg.norm(tensor.data))
+        validator = get_validator()
+        if not validator.should_validate('decomposition', degree, dimension):
+            return True
+        defect_tensor = np.array(tensor.data, dtype=np.result_type(tensor.data, np.float64))
+        for component in decomposition.values():
+            np.subtract(defect_tensor, component.data, out=defect_tensor)
+        reference = np.linalg.norm(tensor.data)
+        tolerance = reference * get_relative_tolerance(tensor.data.dtype)
+        complete = len(decomposition) == count_partitions(degree)
+        if complete:
+            defect = np.linalg.norm(defect_tensor)
+        elif reference > 0:
+            defect = abs(np.vdot(defect_tensor, tensor.data - defect_tensor)) / reference
+        else:
+            defect = 0
+        if not defect < tolerance:
+            if complete:
+                logger.error('Components do not sum to original tensor.')
+            else:
+                logger.error('Remainder is not orthogonal to the components.')
+            logger.error('Norm of defect: %s', defect)
+            logger.error('Norm of original tensor: %s', reference)
+            validator.record_failure({
+                'check' : 'decomposition',
+                'degree' : degree,
+                'dimension' : dimension,
+                'defect' : float(defect),
+                'tolerance' : float(tolerance),
+                'reference' : float(reference),
+            })
             return False
         else:
             logger.debug('Components sum to original tensor.')
@@ -426,17 +2018,41 @@ class SchurTransform:
 
     @staticmethod
     def format_projectors_filename(degree, dimension):
-        return '_'.join([
-            'projectors',
-            'degree',
-            str(degree),
-            'dimension',
-            str(dimension) + '.npz',
-        ])
+        return ProjectorCache.format_filename(degree, dimension)
 
-    def retrieve_projectors(self, dimension: int=None, degree: int=None):
+    @staticmethod
+    def projectors_are_distributed(dimension: int=None, degree: int=None):
+        """
+        :return: True if the dense projectors for the given dimension and degree are
+            available among the files distributed with the library.
+        :rtype: bool
         """
-        Retrieve projectors from archived numpy-exported files.
+        if degree > SchurTransform.max_degree or dimension > SchurTransform.max_dimension:
+            return False
+        filename = SchurTransform.format_projectors_filename(degree, dimension)
+        return importlib.resources.is_resource(projectors_package, filename)
+
+    @staticmethod
+    def projectors_are_available(dimension: int=None, degree: int=None):
+        """
+        :return: True if the dense projectors for the given dimension and degree are
+            distributed with the library or are in the user-level projector cache
+            (see :py:class:`.projector_cache.ProjectorCache`).
+        :rtype: bool
+        """
+        if SchurTransform.projectors_are_distributed(dimension=dimension, degree=degree):
+            return True
+        return ProjectorCache().contains(degree=degree, dimension=dimension)
+
+    def retrieve_projectors(self, dimension: int=None, degree: int=None, dtype=np.float64):
+        """
+        Retrieve projectors from archived numpy-exported files. With
+        ``memory_map_projectors``, the memory-mapped projectors of the user-level
+        projector cache (see :py:class:`.projector_cache.ProjectorCache`) are used if
+        available. Otherwise they are read as in :py:meth:`read_stored_projectors`
+        and, with ``memory_map_projectors``, saved to the cache in memory-mappable
+        form and mapped from there. If the cache can not be written, the projectors
+        read are used directly.
 
         :param dimension: Spatial dimension.
         :type dimension: int
@@ -444,33 +2060,118 @@ class SchurTransform:
         :param degree: Degree of symmetric group.
         :type degree: int
 
+        :param dtype: The floating point type into which the stored exact projectors
+            are decoded.
+        :type dtype: numpy.dtype
+
         :return: Dictionary with keys the '+'-delimited integer partitions and values
-            the :py:class:`.tensor_operator.TensorOperator` projectors.
+            the :py:class:`.tensor_operator.TensorOperator` projectors. The projectors
+            of vanishing components are not stored; they are zero operators as
+            returned by :py:meth:`.tensor_operator.TensorOperator.zero`. The data of
+            memory-mapped projectors are read-only.
         :rtype: dict
         """
-        if degree > SchurTransform.max_degree:
-            logger.error('Can not retrieve projectors from cache for degree %s', degree)
-            return
-        if dimension > SchurTransform.max_dimension:
-            logger.error('Can not retrieve projectors from cache for dimension %s', dimension)
-            return
+        cache = ProjectorCache()
+        arrays = None
+        if SchurTransform.memory_map_projectors:
+            arrays = cache.load_mapped(degree=degree, dimension=dimension, dtype=dtype)
+        if arrays is None:
+            arrays = self.read_stored_projectors(dimension=dimension, degree=degree, dtype=dtype)
+            if arrays is None:
+                return None
+            if SchurTransform.memory_map_projectors and cache.store_mapped(
+                degree=degree,
+                dimension=dimension,
+                dtype=dtype,
+                arrays=arrays,
+            ):
+                mapped = cache.load_mapped(degree=degree, dimension=dimension, dtype=dtype)
+                if mapped is not None:
+                    arrays = mapped
 
-        filename = SchurTransform.format_projectors_filename(degree, dimension)
-        with importlib.resources.path(package=projectors_package, resource=filename) as path:
-            projectors_npy = np.load(path)
+        projectors = {}
+        for key in get_partition_strings(degree):
+            if is_vanishing_partition(key, dimension):
+                projectors[key] = TensorOperator.zero(
+                    number_of_factors=degree,
+                    dimension=dimension,
+                    dtype=dtype,
+                )
+            elif key in arrays:
+                projectors[key] = TensorOperator(
+                    number_of_factors = degree,
+                    dimension = dimension,
+                    data = arrays[key],
+                )
+            else:
+                logger.error('Stored projectors for degree %s and dimension %s lack %s.', degree, dimension, key)
+                return None
+        return projectors
 
-        projectors = {key : TensorOperator(
-            number_of_factors = degree,
-            dimension = dimension,
-            data = projectors_npy[key],
-        ) for key in projectors_npy}
+    def read_stored_projectors(self, dimension: int=None, degree: int=None, dtype=np.float64):
+        """
+        Reads projectors from the files distributed with the library if available,
+        then from the user-level projector cache. Otherwise the projectors are
+        calculated, and saved to the user-level cache for later use.
 
-        return projectors
+        :param dimension: Spatial dimension.
+        :type dimension: int
+
+        :param degree: Degree of symmetric group.
+        :type degree: int
+
+        :param dtype: The floating point type into which the stored exact projectors
+            are decoded.
+        :type dtype: numpy.dtype
+
+        :return: The data arrays of the projectors of the non-vanishing components,
+            keyed by partition string.
+        :rtype: dict
+        """
+        if self.projectors_are_distributed(dimension=dimension, degree=degree):
+            filename = SchurTransform.format_projectors_filename(degree, dimension)
+            with importlib.resources.path(package=projectors_package, resource=filename) as path:
+                return read_projectors(path, dtype=dtype)
+        cache = ProjectorCache()
+        arrays = cache.load(degree=degree, dimension=dimension, dtype=dtype)
+        if arrays is not None:
+            return arrays
+        logger.info(
+            'Calculating projectors for degree %s and dimension %s (not yet cached).',
+            degree,
+            dimension,
+        )
+        projectors = self.recalculate_projectors(
+            dimension=dimension,
+            degree=degree,
+            get_cached=False,
+        )
+        if projectors is None:
+            return None
+        arrays = SchurTransform.get_stored_arrays(projectors)
+        cache.store(degree=degree, dimension=dimension, arrays=arrays)
+        return SchurTransform.get_stored_arrays(SchurTransform.cast_projectors(projectors, dtype))
+
+    @staticmethod
+    def get_stored_arrays(projectors: dict=None):
+        """
+        :param projectors: As returned by :py:meth:`recalculate_projectors`.
+        :type projectors: dict
+
+        :return: The data arrays of the projectors of the non-vanishing components,
+            keyed by partition string, in the format of the projector files.
+        :rtype: dict
+        """
+        return {
+            key : projector.data for key, projector in projectors.items()
+            if not is_vanishing_partition(key, projector.dimension)
+        }
 
 
 def save_projectors_to_file():
     """
-    Pre-calculates the projectors and saves to numpy archive format.
+    Pre-calculates the projectors and saves to numpy archive format, encoded as in
+    :py:func:`.projector_encoding.encode_projectors`.
 
     The filenames are formatted as in "projectors_degree_5_dimension_3.npz".
     """
@@ -483,5 +2184,8 @@ def save_projectors_to_file():
                 get_cached = False,
             )
             filename = SchurTransform.format_projectors_filename(i, d)
-            np.savez(filename, **{key : projector.data for key, projector in projectors.items()})
+            np.savez_compressed(filename, **encode_projectors(
+                SchurTransform.get_stored_arrays(projectors),
+                denominator=factorial(i),
+            ))
             logger.info('Saved %s', filename)
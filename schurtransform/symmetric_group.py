@@ -0,0 +1,256 @@
+import itertools
+from collections import Counter
+from functools import lru_cache
+from math import factorial
+
+import numpy as np
+
+from .log_formats import colorized_logger
+logger = colorized_logger(__name__)
+
+
+def generate_partitions(degree: int=None):
+    """
+    :param degree: The integer to be partitioned.
+    :type degree: int
+
+    :return: The integer partitions of ``degree``, each a tuple of parts in
+        non-increasing order, listed in ascending lexicographic order (e.g. for 3,
+        ``(1, 1, 1)``, ``(2, 1)``, ``(3,)``). This is the order of the rows and columns
+        of the character tables distributed with the library.
+    :rtype: list
+    """
+    partitions = []
+
+    def extend(prefix, remainder, largest):
+        if remainder == 0:
+            partitions.append(tuple(prefix))
+            return
+        for part in range(1, min(largest, remainder) + 1):
+            extend(prefix + [part], remainder - part, part)
+
+    extend([], degree, degree)
+    return partitions
+
+
+@lru_cache(maxsize=None)
+def count_partitions(degree: int=None):
+    """
+    :return: The number of integer partitions of ``degree``, i.e. the number of
+        isotypic components of a tensor of that degree. (This function is wrapped by
+        ``functools.lru_cache``.)
+    :rtype: int
+    """
+    return len(generate_partitions(degree))
+
+
+def get_partition_strings(degree: int=None):
+    """
+    :return: The '+'-delimited strings of the partitions of ``degree``, in the order
+        of :py:func:`generate_partitions`.
+    :rtype: list
+    """
+    return [format_partition(partition) for partition in generate_partitions(degree)]
+
+
+def is_vanishing_partition(partition_string: str=None, dimension: int=None):
+    """
+    By Schur–Weyl duality, the isotypic component of (ℝ^d)^⊗n for a shape with more
+    than d rows is identically zero. The partition strings of the character tables
+    distributed with the library label each component by the conjugate shape (see
+    :py:func:`calculate_character_table`), whose largest part is the number of rows
+    of the shape.
+
+    :param partition_string: The label of an isotypic component.
+    :type partition_string: str
+
+    :param dimension: The dimension d of the base vector space.
+    :type dimension: int
+
+    :return: True if the component is zero for tensors of the given dimension.
+    :rtype: bool
+    """
+    return parse_partition_string(partition_string)[0] > dimension
+
+
+def format_partition(partition):
+    """
+    :return: The '+'-delimited string of the parts of the partition, e.g. '2+1+1'.
+    :rtype: str
+    """
+    return '+'.join([str(part) for part in partition])
+
+
+def parse_partition_string(partition_string: str=None):
+    """
+    :return: The partition labelled by a '+'-delimited string, as a tuple of parts in
+        non-increasing order.
+    :rtype: tuple
+    """
+    return tuple(sorted([int(part) for part in partition_string.split('+')], reverse=True))
+
+
+def conjugate_partition(partition):
+    """
+    :return: The conjugate (transposed) partition.
+    :rtype: tuple
+    """
+    if len(partition) == 0:
+        return ()
+    return tuple(
+        sum(1 for part in partition if part > i) for i in range(partition[0])
+    )
+
+
+def calculate_class_size(cycle_type):
+    """
+    :param cycle_type: A partition, the cycle lengths of the permutations of a
+        conjugacy class.
+    :type cycle_type: tuple
+
+    :return: The number of permutations with the given cycle type,
+        n! / Π_i (i^m_i m_i!) where m_i is the number of cycles of length i.
+    :rtype: int
+    """
+    denominator = 1
+    for length, multiplicity in Counter(cycle_type).items():
+        denominator *= pow(length, multiplicity) * factorial(multiplicity)
+    return factorial(sum(cycle_type)) // denominator
+
+
+def beta_set(partition):
+    """
+    :return: The first-column hook lengths of the partition (its beta-set with as
+        many beads as parts), in decreasing order.
+    :rtype: tuple
+    """
+    number_of_parts = len(partition)
+    return tuple(part + number_of_parts - 1 - i for i, part in enumerate(partition))
+
+
+@lru_cache(maxsize=None)
+def calculate_character_from_beta_set(beads, cycle_type):
+    """
+    The Murnaghan–Nakayama rule on the abacus. Removing a border strip of length r
+    from a partition corresponds to moving a bead of its beta-set from position b to
+    the empty position b - r; the height of the strip is the number of beads strictly
+    between the two positions. (This function is wrapped by ``functools.lru_cache``.)
+
+    :param beads: A beta-set, as returned by :py:func:`beta_set`.
+    :type beads: tuple
+
+    :param cycle_type: The cycle lengths of the class, in any order.
+    :type cycle_type: tuple
+
+    :return: The value of the irreducible character on the class.
+    :rtype: int
+    """
+    if len(cycle_type) == 0:
+        return 1
+    length = cycle_type[0]
+    remaining = cycle_type[1:]
+    occupied = set(beads)
+    value = 0
+    for bead in beads:
+        target = bead - length
+        if target < 0 or target in occupied:
+            continue
+        height = sum(1 for other in beads if target < other < bead)
+        moved = tuple(sorted(
+            [other for other in beads if other != bead] + [target],
+            reverse=True,
+        ))
+        term = calculate_character_from_beta_set(moved, remaining)
+        value += -term if height % 2 else term
+    return value
+
+
+def calculate_character(shape, cycle_type):
+    """
+    :param shape: The partition labelling the irreducible representation (in the
+        standard convention, in which ``(n,)`` labels the trivial representation).
+    :type shape: tuple
+
+    :param cycle_type: The partition labelling the conjugacy class.
+    :type cycle_type: tuple
+
+    :return: The character value χ_shape(cycle_type).
+    :rtype: int
+    """
+    return calculate_character_from_beta_set(
+        beta_set(shape),
+        tuple(sorted(cycle_type, reverse=True)),
+    )
+
+
+@lru_cache(maxsize=None)
+def calculate_character_table(degree: int=None):
+    """
+    The character table of the symmetric group of the given degree, in the format
+    of the tables distributed with the library. (This function is wrapped by
+    ``functools.lru_cache``.)
+
+    Note that, as in those tables, each character is labelled by the conjugate of
+    the partition labelling it in the standard convention, so that ``'1+...+1'``
+    labels the trivial character and ``'n'`` labels the sign character.
+
+    :param degree: The degree of the symmetric group.
+    :type degree: int
+
+    :return: The list of conjugacy class labels, the dictionary of conjugacy class
+        sizes, and the characters as a dictionary of dictionaries (keys at both
+        levels '+'-delimited integer partition strings, in ascending lexicographic
+        order).
+    :rtype: tuple
+    """
+    partitions = generate_partitions(degree)
+    labels = [format_partition(partition) for partition in partitions]
+    class_sizes = {
+        label : calculate_class_size(partition) for label, partition in zip(labels, partitions)
+    }
+    characters = {
+        label : {
+            class_label : calculate_character(conjugate_partition(partition), cycle_type)
+            for class_label, cycle_type in zip(labels, partitions)
+        } for label, partition in zip(labels, partitions)
+    }
+    return labels, class_sizes, characters
+
+
+def generate_class_permutations(cycle_type):
+    """
+    Generates the permutations of a conjugacy class directly, each exactly once,
+    without enumerating the rest of the symmetric group. Each permutation is built
+    cycle by cycle; every cycle starts at the smallest element not yet used, which
+    makes its cycle decomposition canonical.
+
+    :param cycle_type: The cycle lengths, in any order.
+    :type cycle_type: tuple
+
+    :return: Generator of permutations in the format of a sequence of positive integer
+        function values, as tuples.
+    :rtype: generator
+    """
+    degree = sum(cycle_type)
+    values = [0] * degree
+
+    def extend(unused, lengths):
+        if len(unused) == 0:
+            yield tuple(values)
+            return
+        start = unused[0]
+        rest = unused[1:]
+        for length in sorted(set(lengths)):
+            remaining_lengths = list(lengths)
+            remaining_lengths.remove(length)
+            for others in itertools.permutations(rest, length - 1):
+                cycle = (start,) + others
+                for i, element in enumerate(cycle):
+                    values[element] = cycle[(i + 1) % length] + 1
+                yield from extend(
+                    [element for element in rest if not element in others],
+                    remaining_lengths,
+                )
+
+    yield from extend(list(range(degree)), list(cycle_type))
+
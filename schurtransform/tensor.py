@@ -9,6 +9,7 @@ class Tensor:
         number_of_factors: int=None,
         dimension: int=None,
         data=None,
+        dtype=np.float64,
     ):
         """
         Initializes a zero tensor.
@@ -22,11 +23,15 @@ class Tensor:
 
         :param data: The exact data array to initialize with. (Defaults to zeros).
         :type data: numpy.array
+
+        :param dtype: The floating point type of the zeros, if ``data`` is not
+            provided.
+        :type dtype: numpy.dtype
         """
         self.number_of_factors = number_of_factors
         self.dimension = dimension
         if data is None:
-            self.data = np.zeros([dimension] * number_of_factors)
+            self.data = np.zeros([dimension] * number_of_factors, dtype=dtype)
         else:
             self.data = data
 
@@ -68,6 +73,7 @@ class Tensor:
         tensor = Tensor(
             number_of_factors=self.number_of_factors,
             dimension=self.dimension,
+            dtype=self.data.dtype,
         )
         tensor.data = self.data + other_tensor.data
         return tensor
@@ -95,6 +101,7 @@ class Tensor:
         tensor = Tensor(
             number_of_factors=self.number_of_factors,
             dimension=self.dimension,
+            dtype=self.data.dtype,
         )
         tensor.data = self.data * amount
         return tensor
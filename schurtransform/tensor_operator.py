@@ -19,6 +19,7 @@ class TensorOperator:
         identity: bool=False,
         permutation_inverse=None,
         data=None,
+        dtype=np.float64,
     ):
         """
         :param number_of_factors: Number of tensor factors for the background tensor
@@ -38,8 +39,13 @@ class TensorOperator:
             positive integers (e.g. ``[2, 1, 3]``).
         :type permutation_inverse: list
 
-        :param data: If provided, initialized with exactly the given data array.
+        :param data: If provided, initialized with exactly the given data array,
+            without copying (so it may be a read-only view, e.g. a memory map).
         :type data: numpy.array
+
+        :param dtype: The floating point type of the data, if ``data`` is not
+            provided.
+        :type dtype: numpy.dtype
         """
         self.number_of_factors = number_of_factors
         self.dimension = dimension
@@ -52,32 +58,93 @@ class TensorOperator:
                 self.data = data
             return
 
-        self.data = np.zeros(
-            [dimension] * (number_of_factors * 2)
-        )
-
         if identity and not permutation_inverse is None:
             logger.error('Provide identity=True or permutation_inverse, not both.')
+            self.data = np.zeros([dimension] * (number_of_factors * 2), dtype=dtype)
             return
 
-        n = self.number_of_factors
         if identity:
-            iterator = np.nditer(self.data, flags = ['multi_index'])
-            for entry in iterator:
-                index = iterator.multi_index
-                in_index = [index[i] for i in range(n)]
-                out_index = [index[i+n] for i in range(n)]
-                if in_index == out_index :
-                    self.data[index] = 1.0
-        if not permutation_inverse is None:
-            iterator = np.nditer(self.data, flags = ['multi_index'])
-            for entry in iterator:
-                index = iterator.multi_index
-                in_index = [index[i] for i in range(n)]
-                out_index = [index[i+n] for i in range(n)]
-                permuted_in_index = [index[permutation_inverse[i]-1] for i in range(n)]
-                if permuted_in_index == out_index :
-                    self.data[index] = 1.0
+            size = pow(dimension, number_of_factors)
+            self.data = np.eye(size, dtype=dtype).reshape([dimension] * (number_of_factors * 2))
+        elif not permutation_inverse is None:
+            self.data = TensorOperator.permutation_sum(
+                number_of_factors,
+                dimension,
+                [permutation_inverse],
+            ).data.astype(dtype, copy=False)
+        else:
+            self.data = np.zeros([dimension] * (number_of_factors * 2), dtype=dtype)
+
+    @staticmethod
+    def zero(number_of_factors: int=None, dimension: int=None, dtype=np.float64):
+        """
+        :return: The zero operator. Its data is a read-only broadcast of a single
+            zero, so it takes no memory however large the operator.
+        :rtype: TensorOperator
+        """
+        return TensorOperator(
+            number_of_factors=number_of_factors,
+            dimension=dimension,
+            data=np.broadcast_to(np.zeros((), dtype=dtype), [dimension] * (number_of_factors * 2)),
+        )
+
+    @staticmethod
+    def permutation_flat_indices(
+        number_of_factors: int=None,
+        dimension: int=None,
+        permutation_inverse=None,
+    ):
+        """
+        :param permutation_inverse: As in the constructor.
+        :type permutation_inverse: list
+
+        :return: The flat output index of each flat input index under the permutation
+            operator, i.e. the column of the single nonzero entry in each row of the
+            operator regarded as a square matrix.
+        :rtype: numpy.array
+        """
+        shape = [dimension] * number_of_factors
+        coordinates = np.indices(shape).reshape(number_of_factors, -1)
+        return np.ravel_multi_index(
+            tuple(coordinates[value - 1] for value in permutation_inverse),
+            shape,
+        )
+
+    @staticmethod
+    def permutation_sum(
+        number_of_factors: int=None,
+        dimension: int=None,
+        permutations=None,
+        weights=None,
+    ):
+        """
+        The (weighted) sum of permutation operators, accumulated by scattering into
+        one array rather than by adding dense operators.
+
+        :param permutations: Permutations in the format of the ``permutation_inverse``
+            argument of the constructor.
+        :type permutations: list
+
+        :param weights: Optional coefficients, one for each permutation. Default 1.
+        :type weights: list
+
+        :return: The sum.
+        :rtype: TensorOperator
+        """
+        size = pow(dimension, number_of_factors)
+        rows = np.arange(size) * size
+        targets = np.concatenate([
+            rows + TensorOperator.permutation_flat_indices(number_of_factors, dimension, permutation)
+            for permutation in permutations
+        ])
+        if weights is not None:
+            weights = np.repeat(np.asarray(weights, dtype=np.float64), size)
+        data = np.bincount(targets, weights=weights, minlength=size * size).astype(np.float64)
+        return TensorOperator(
+            number_of_factors=number_of_factors,
+            dimension=dimension,
+            data=data.reshape([dimension] * (number_of_factors * 2)),
+        )
 
     def apply(self,
         input_tensor: Tensor=None,
@@ -140,6 +207,7 @@ class TensorOperator:
         tensor_operator = TensorOperator(
             number_of_factors=self.number_of_factors,
             dimension=self.dimension,
+            dtype=self.data.dtype,
         )
         tensor_operator.data = self.data + other_operator.data
         return tensor_operator
@@ -166,10 +234,27 @@ class TensorOperator:
             self.data = self.data * amount
             return None
 
-        tensor_operator = TensorOperator(self.number_of_factors, self.dimension)
+        tensor_operator = TensorOperator(self.number_of_factors, self.dimension, dtype=self.data.dtype)
         tensor_operator.data = self.data * amount
         return tensor_operator
 
+    def astype(self, dtype=None):
+        """
+        :param dtype: A floating point type.
+        :type dtype: numpy.dtype
+
+        :return: This operator if its data already has the given type, else a copy
+            cast to it.
+        :rtype: TensorOperator
+        """
+        if self.data.dtype == np.dtype(dtype):
+            return self
+        return TensorOperator(
+            number_of_factors=self.number_of_factors,
+            dimension=self.dimension,
+            data=self.data.astype(dtype),
+        )
+
     def __repr__(self):
         return OperatorPrinter.repr_of_tensor_operator(self.data)
 
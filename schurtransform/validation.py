@@ -0,0 +1,205 @@
+from contextlib import contextmanager
+from contextvars import ContextVar
+from enum import Enum, auto
+
+import numpy as np
+
+from .log_formats import colorized_logger
+logger = colorized_logger(__name__)
+
+_current_validator = ContextVar('schurtransform_validator', default=None)
+
+
+class ValidationPolicy(Enum):
+    """
+    Used to select which of the consistency checks of decompositions (components
+    summing to the original tensor, or squared norms summing to its squared norm) and
+    of projectors (summing to the identity) are performed.
+
+    - ``ALWAYS``. Every check.
+    - ``NEVER``. No checks.
+    - ``SAMPLED``. The first check of each kind, and then every ``interval``-th one,
+      or alternatively a random ``fraction`` of them.
+    - ``ONCE``. The first check of each kind for each projector set (degree and
+      dimension).
+    """
+    ALWAYS = auto()
+    NEVER = auto()
+    SAMPLED = auto()
+    ONCE = auto()
+
+
+class ValidationError(Exception):
+    """
+    Raised by a :py:class:`Validator` with ``raise_on_failure``, carrying the
+    structured failure records.
+    """
+    def __init__(self, failures: list=None):
+        self.failures = failures
+        super().__init__('%s validation failure(s): %s' % (len(failures), failures))
+
+    def __reduce__(self):
+        return (ValidationError, (self.failures,))
+
+
+class Validator:
+    """
+    Decides which checks are performed, according to a :py:class:`ValidationPolicy`,
+    and collects the failures as structured records. Each record is a dictionary
+    with keys ``check`` (``'decomposition'``, ``'norms'``, ``'batch_norms'``, or
+    ``'projectors'``), ``degree``, ``dimension``, ``defect``, ``tolerance``, and
+    ``reference`` (the size of the quantity checked against), and for batches also
+    ``failures`` and ``batch_size``.
+    """
+    def __init__(self,
+        policy: str='ALWAYS',
+        interval: int=None,
+        fraction: float=None,
+        seed: int=None,
+        raise_on_failure: bool=False,
+    ):
+        """
+        :param policy: The string name of a member of :py:class:`ValidationPolicy`.
+        :type policy: str
+
+        :param interval: For ``SAMPLED``, every ``interval``-th check of each kind is
+            performed. Default 10, unless ``fraction`` is given.
+        :type interval: int
+
+        :param fraction: For ``SAMPLED``, alternatively to ``interval``, the
+            probability with which each check is performed.
+        :type fraction: float
+
+        :param seed: The seed for the random selection with ``fraction``.
+        :type seed: int
+
+        :param raise_on_failure: If True, a :py:class:`ValidationError` is raised at
+            the first failure. Otherwise failures are logged and recorded in
+            ``failures``, and the results are still returned.
+        :type raise_on_failure: bool
+        """
+        self.policy = ValidationPolicy[policy]
+        if self.policy is ValidationPolicy.SAMPLED and interval is None and fraction is None:
+            interval = 10
+        self.interval = interval
+        self.fraction = fraction
+        self.seed = seed
+        self.raise_on_failure = raise_on_failure
+        self.random_generator = np.random.default_rng(seed)
+        self.counts = {}
+        self.checks_performed = 0
+        self.failures = []
+
+    def get_settings(self):
+        """
+        :return: The constructor arguments, e.g. to create an equivalent validator in
+            another process.
+        :rtype: dict
+        """
+        return {
+            'policy' : self.policy.name,
+            'interval' : self.interval,
+            'fraction' : self.fraction,
+            'seed' : self.seed,
+            'raise_on_failure' : self.raise_on_failure,
+        }
+
+    def should_validate(self, check: str=None, degree: int=None, dimension: int=None):
+        """
+        :param check: The kind of check.
+        :type check: str
+
+        :param degree: The degree of the projectors involved.
+        :type degree: int
+
+        :param dimension: The dimension of the base vector space, if known.
+        :type dimension: int
+
+        :return: True if the check is to be performed.
+        :rtype: bool
+        """
+        if self.policy is ValidationPolicy.ALWAYS:
+            decision = True
+        elif self.policy is ValidationPolicy.NEVER:
+            decision = False
+        else:
+            key = (check,) if self.policy is ValidationPolicy.SAMPLED else (check, degree, dimension)
+            count = self.counts.get(key, 0)
+            self.counts[key] = count + 1
+            if self.policy is ValidationPolicy.ONCE:
+                decision = count == 0
+            elif self.fraction is not None:
+                decision = count == 0 or self.random_generator.random() < self.fraction
+            else:
+                decision = count % self.interval == 0
+        if decision:
+            self.checks_performed += 1
+        return decision
+
+    def record_failure(self, failure: dict=None):
+        """
+        :param failure: The failure record.
+        :type failure: dict
+        """
+        self.failures.append(failure)
+        if self.raise_on_failure:
+            raise ValidationError([failure])
+
+
+def get_relative_tolerance(dtype=np.float64):
+    """
+    :param dtype: The floating point type in which the checked quantities were
+        calculated.
+    :type dtype: numpy.dtype
+
+    :return: The tolerance of the checks, relative to the size of the quantity
+        checked against: √ε / 10, for ε the precision of ``dtype`` (about 1.5e-9 for
+        float64 and 3.5e-5 for float32). Integer types are treated as float64.
+    :rtype: float
+    """
+    if not np.issubdtype(dtype, np.floating):
+        dtype = np.float64
+    return float(np.sqrt(np.finfo(dtype).eps)) / 10
+
+
+def get_validator():
+    """
+    :return: The active :py:class:`Validator`, or a new one with the ``ALWAYS``
+        policy if none is active.
+    :rtype: Validator
+    """
+    validator = _current_validator.get()
+    if validator is None:
+        return Validator()
+    return validator
+
+
+@contextmanager
+def activate_validator(validator: Validator=None):
+    """
+    Context manager activating the given validator for the checks made inside it (in
+    the current thread).
+
+    :param validator: The validator.
+    :type validator: Validator
+    """
+    token = _current_validator.set(validator)
+    try:
+        yield validator
+    finally:
+        _current_validator.reset(token)
+
+
+def create_validator(specification=None):
+    """
+    :param specification: A :py:class:`Validator`, the string name of a member of
+        :py:class:`ValidationPolicy`, or None (for ``ALWAYS``).
+
+    :return: The validator.
+    :rtype: Validator
+    """
+    if isinstance(specification, Validator):
+        return specification
+    if specification is None:
+        return Validator()
+    return Validator(policy=specification)
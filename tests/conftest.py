@@ -0,0 +1,17 @@
+import os
+
+import pytest
+
+
+@pytest.fixture(autouse=True, scope='session')
+def projector_cache_directory(tmp_path_factory):
+    """
+    Keeps the projectors cached during the tests out of the user-level cache.
+    """
+    previous = os.environ.get('SCHURTRANSFORM_CACHE_DIR')
+    os.environ['SCHURTRANSFORM_CACHE_DIR'] = str(tmp_path_factory.mktemp('projector_cache'))
+    yield
+    if previous is None:
+        del os.environ['SCHURTRANSFORM_CACHE_DIR']
+    else:
+        os.environ['SCHURTRANSFORM_CACHE_DIR'] = previous
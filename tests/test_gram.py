@@ -0,0 +1,86 @@
+import numpy as np
+
+import schurtransform as st
+from schurtransform.schur_transform import SchurTransform
+from schurtransform.schur_transform import DecompositionSummary
+from schurtransform.permutation_projectors import PermutationProjectors
+from schurtransform.gram import calculate_gram_matrices
+from schurtransform.gram import calculate_class_inner_products
+from schurtransform.gram import calculate_squared_norm
+
+
+def test_class_inner_products_agree_with_tensor():
+    t = SchurTransform()
+    rng = np.random.default_rng(5)
+    for degree in [2, 3, 4]:
+        for dimension in [2, 3, 4]:
+            centered = t.recenter_at_mean(rng.normal(size=(degree, 8, dimension)))
+            tensor = t.calculate_covariance_tensor(centered)
+            projectors = PermutationProjectors(degree=degree)
+            gram_matrices = calculate_gram_matrices(centered)
+            assert(np.allclose(
+                calculate_class_inner_products(gram_matrices, projectors),
+                projectors.calculate_class_inner_products(tensor.data),
+            ))
+            assert(np.isclose(calculate_squared_norm(gram_matrices), np.vdot(tensor.data, tensor.data)))
+
+def test_gram_engine():
+    rng = np.random.default_rng(6)
+    samples = rng.normal(size=(4, 10, 3))
+    gram = st.transform(samples=samples, summary='NORMS', engine='GRAM')
+    permutation = st.transform(samples=samples, summary='NORMS', engine='PERMUTATION')
+    for key in permutation:
+        assert(np.isclose(gram[key], permutation[key], atol=1e-6))
+
+    gram = st.transform(samples=samples, summary='CONTENT', number_of_factors=2, engine='GRAM')
+    permutation = st.transform(samples=samples, summary='CONTENT', number_of_factors=2)
+    for key in permutation:
+        assert(np.allclose(gram[key], permutation[key], atol=1e-6))
+
+    assert(st.transform(samples=samples, engine='GRAM') is None)
+
+def test_high_dimension_selects_gram():
+    t = SchurTransform()
+    rng = np.random.default_rng(7)
+    engine = t.select_engine(None, 5, 40, summary=DecompositionSummary.NORMS, number_of_samples=6)
+    assert(engine.name == 'GRAM')
+    samples = rng.normal(size=(5, 6, 40))
+    content = st.transform(samples=samples, summary='CONTENT', number_of_factors=3)
+    permutation = st.transform(samples=samples, summary='CONTENT', number_of_factors=3, engine='PERMUTATION')
+    assert(list(content.keys()) == list(permutation.keys()))
+    for key in permutation:
+        assert(np.allclose(content[key], permutation[key], atol=1e-6))
+
+    norms = st.transform(samples=samples[:3], summary='NORMS')
+    permutation = st.transform(samples=samples[:3], summary='NORMS', engine='PERMUTATION')
+    assert(list(norms.keys()) == list(permutation.keys()))
+    for key in permutation:
+        assert(np.isclose(norms[key], permutation[key], atol=1e-6))
+
+def test_gram_memory_limit(monkeypatch):
+    t = SchurTransform()
+    rng = np.random.default_rng(8)
+    samples = rng.normal(size=(6, 8, 30))
+    expected = st.transform(samples=samples, summary='CONTENT', number_of_factors=3, engine='PERMUTATION')
+    blocks = st.transform(samples=samples, summary='CONTENT', number_of_factors=3, engine='GRAM', batch_size=4)
+    monkeypatch.setattr(SchurTransform, 'gram_max_bytes', 1)
+    separate = st.transform(samples=samples, summary='CONTENT', number_of_factors=3, engine='GRAM', batch_size=4)
+    for key in expected:
+        assert(np.allclose(blocks[key], expected[key], atol=1e-6))
+        assert(np.allclose(separate[key], expected[key], atol=1e-6))
+
+    summary = DecompositionSummary.CONTENT
+    assert(t.select_engine(None, 3, 30, summary=summary, number_of_samples=8).name == 'PERMUTATION')
+    monkeypatch.setattr(SchurTransform, 'gram_max_bytes', pow(2, 28))
+    assert(t.select_engine(None, 3, 30, summary=summary, number_of_samples=8, number_of_series=6).name == 'GRAM')
+    assert(t.select_engine(None, 3, 30, summary=summary, number_of_samples=8, number_of_series=pow(10, 4)).name == 'PERMUTATION')
+
+def test_gram_content_of_memory_mapped_samples(tmp_path):
+    rng = np.random.default_rng(9)
+    samples = rng.normal(size=(5, 8, 30))
+    path = str(tmp_path / 'samples.npy')
+    np.save(path, samples)
+    mapped = st.transform(samples=np.load(path, mmap_mode='r'), summary='CONTENT', number_of_factors=3, engine='GRAM')
+    expected = st.transform(samples=samples, summary='CONTENT', number_of_factors=3, engine='GRAM')
+    for key in expected:
+        assert(np.allclose(mapped[key], expected[key]))
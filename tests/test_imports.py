@@ -0,0 +1,45 @@
+import os
+import sys
+import json
+import subprocess
+
+import schurtransform
+
+import_budget_seconds = 1.0
+
+script = '''
+import sys
+import time
+import json
+start = time.perf_counter()
+import schurtransform
+elapsed = time.perf_counter() - start
+import numpy as np
+samples = np.random.default_rng(0).normal(size=(3, 10, 2))
+schurtransform.transform(samples=samples, summary='NORMS')
+schurtransform.transform(samples=samples, summary='CONTENT', number_of_factors=2)
+heavy = [name for name in ['pandas', 'matplotlib', 'seaborn'] if name in sys.modules]
+print(json.dumps({'elapsed' : elapsed, 'heavy' : heavy}))
+'''
+
+def run_in_subprocess(code):
+    package_directory = os.path.dirname(os.path.dirname(os.path.abspath(schurtransform.__file__)))
+    environment = dict(os.environ)
+    environment['PYTHONPATH'] = os.pathsep.join([package_directory, environment.get('PYTHONPATH', '')])
+    result = subprocess.run([sys.executable, '-c', code], capture_output=True, text=True, env=environment)
+    assert(result.returncode == 0)
+    return json.loads(result.stdout.strip().split('\n')[-1])
+
+def test_transform_needs_only_numpy():
+    result = run_in_subprocess(script)
+    assert(result['heavy'] == [])
+    assert(result['elapsed'] < import_budget_seconds)
+
+def test_lazy_attributes():
+    assert('create_figure' in dir(schurtransform))
+    assert(callable(schurtransform.get_example_data))
+    try:
+        schurtransform.not_an_attribute
+        assert(False)
+    except AttributeError:
+        pass
@@ -0,0 +1,37 @@
+import numpy as np
+
+from schurtransform.schur_transform import SchurTransform
+from schurtransform.instrumentation import get_instrumentation
+
+
+def test_stages_reported():
+    rng = np.random.default_rng(19)
+    samples = rng.normal(size=(6, 30, 3))
+    transformer = SchurTransform()
+    reports = []
+    with transformer.instrument(trace_memory=True, callback=reports.append) as instrumentation:
+        transformer.transform(samples, summary='CONTENT', number_of_factors=3)
+        transformer.transform(samples[:3], summary='COMPONENTS')
+    assert(get_instrumentation() is None)
+    assert(len(reports) == 1)
+    stages = reports[0]['stages']
+    for stage in ['transform', 'projector_retrieval', 'centering', 'moments', 'decomposition', 'validation']:
+        assert(stages[stage]['calls'] > 0)
+        assert(stages[stage]['seconds'] >= 0)
+        assert(stages[stage]['peak_bytes'] is not None)
+    assert(stages['transform']['calls'] == 2)
+    assert(stages['transform']['seconds'] >= stages['moments']['seconds'])
+    assert(reports[0]['cache']['hits'] + reports[0]['cache']['misses'] > 0)
+    metrics = instrumentation.get_metrics()
+    assert(metrics['schurtransform.stage.transform.calls'] == 2)
+
+def test_disabled_by_default():
+    rng = np.random.default_rng(20)
+    transformer = SchurTransform()
+    transformer.transform(rng.normal(size=(3, 10, 2)), summary='NORMS')
+    assert(get_instrumentation() is None)
+    with transformer.instrument() as instrumentation:
+        transformer.transform({'a' : rng.normal(size=(3, 10, 2))}, summary='NORMS')
+    report = instrumentation.get_report()
+    assert(report['stages']['transform']['calls'] == 1)
+    assert(report['stages']['transform']['peak_bytes'] is None)
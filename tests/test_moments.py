@@ -0,0 +1,48 @@
+import numpy as np
+
+from schurtransform.moments import calculate_joint_moment
+from schurtransform.moments import calculate_joint_moments
+from schurtransform.moments import SlidingWindowMoments
+from schurtransform.moments import MomentAccumulator
+
+
+def test_batched_moments():
+    rng = np.random.default_rng(11)
+    for degree in [1, 2, 3, 4]:
+        stack = rng.normal(size=(3, degree, 5, 2))
+        moments = calculate_joint_moments(stack)
+        for i in range(3):
+            assert(np.allclose(moments[i], calculate_joint_moment(stack[i])))
+
+def test_sliding_window_moments():
+    rng = np.random.default_rng(12)
+    frames = rng.normal(size=(13, 6, 3))
+    for window_size in [1, 2, 3, 5]:
+        window = SlidingWindowMoments(window_size=window_size)
+        moments = [window.push(frame) for frame in frames]
+        for i, moment in enumerate(moments):
+            if i < window_size - 1:
+                assert(moment is None)
+            else:
+                expected = calculate_joint_moment(frames[i - window_size + 1:i + 1])
+                assert(np.allclose(moment, expected))
+
+def test_moment_accumulator():
+    rng = np.random.default_rng(14)
+    for number_of_series in [1, 2, 3, 4]:
+        samples = rng.normal(loc=1000.0, size=(number_of_series, 50, 3))
+        centered = samples - np.mean(samples, axis=1, keepdims=True)
+        expected = calculate_joint_moment(centered)
+        accumulator = MomentAccumulator(number_of_series=number_of_series, dimension=3)
+        boundaries = [0, 1, 7, 7, 20, 50]
+        accumulator.update(samples[:, start:stop] for start, stop in zip(boundaries[:-1], boundaries[1:]))
+        assert(accumulator.count == 50)
+        assert(np.allclose(accumulator.means, np.mean(samples, axis=1)))
+        assert(np.allclose(accumulator.get_tensor().data, expected))
+
+        first = MomentAccumulator(number_of_series=number_of_series, dimension=3)
+        first.update(samples[:, :30])
+        second = MomentAccumulator(number_of_series=number_of_series, dimension=3)
+        second.update(samples[:, 30:])
+        first.merge(second)
+        assert(np.allclose(first.get_tensor().data, expected))
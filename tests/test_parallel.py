@@ -0,0 +1,124 @@
+from concurrent.futures import ThreadPoolExecutor
+from concurrent.futures import ProcessPoolExecutor
+from itertools import combinations
+
+import numpy as np
+
+import schurtransform as st
+from schurtransform.parallel import rank_combination
+from schurtransform.parallel import unrank_combination
+from schurtransform.parallel import combinations_from_rank
+from schurtransform.parallel import shard_ranks
+from schurtransform.parallel import SharedArrays
+from schurtransform.parallel import attach_shared_arrays
+from schurtransform.parallel import _worker_state
+
+
+def count_attached_blocks():
+    return len(_worker_state.get('shared', {}))
+
+def test_rank_unrank():
+    for n in [1, 4, 7]:
+        for k in range(1, n + 1):
+            expected = list(combinations(range(n), k))
+            for rank, combination in enumerate(expected):
+                assert(unrank_combination(rank, n, k) == combination)
+                assert(rank_combination(combination, n) == rank)
+            assert(list(combinations_from_rank(n, k, 0, len(expected))) == expected)
+            for start, stop in shard_ranks(len(expected), 3):
+                assert(list(combinations_from_rank(n, k, start, stop)) == expected[start:stop])
+
+def test_shards_cover_ranks():
+    for total in [1, 5, 17, 100]:
+        for number_of_shards in [1, 3, 8, 200]:
+            shards = shard_ranks(total, number_of_shards)
+            assert(shards[0][0] == 0)
+            assert(shards[-1][1] == total)
+            for (start1, stop1), (start2, stop2) in zip(shards[:-1], shards[1:]):
+                assert(stop1 == start2)
+            assert(shards == shard_ranks(total, number_of_shards))
+
+def test_parallel_content_matches_serial():
+    rng = np.random.default_rng(10)
+    samples = rng.normal(size=(8, 9, 3))
+    for summary in ['CONTENT', 'SEQUENTIAL_CONTENT']:
+        serial = st.transform(samples=samples, summary=summary, number_of_factors=3)
+        pooled = st.transform(samples=samples, summary=summary, number_of_factors=3, workers=2, batch_size=5)
+        with ThreadPoolExecutor(max_workers=3) as executor:
+            threaded = st.transform(samples=samples, summary=summary, number_of_factors=3, executor=executor)
+        for key in serial:
+            assert(np.allclose(serial[key], pooled[key]))
+            assert(np.allclose(serial[key], threaded[key]))
+
+def test_shared_arrays_round_trip():
+    arrays = {'a' : np.arange(7, dtype=np.int32), 'b' : np.ones((3, 5)), 'c' : np.zeros((2, 0))}
+    shared = SharedArrays(arrays)
+    try:
+        attached = attach_shared_arrays(shared.get_reference())
+        for name, array in arrays.items():
+            assert(attached[name].dtype == array.dtype)
+            assert(np.array_equal(attached[name], array))
+            assert(not attached[name].flags.writeable)
+    finally:
+        shared.close()
+
+def test_parallel_cases_match_serial():
+    rng = np.random.default_rng(11)
+    cases = {
+        'first' : rng.normal(size=(3, 12, 3)),
+        'second' : rng.normal(size=(3, 10, 2)),
+        'third' : rng.normal(size=(4, 15, 3)),
+    }
+    for summary, engine in [('NORMS', None), ('COMPONENTS', 'OPERATOR'), ('MEAN_CONTENT', 'OPERATOR'), ('CONTENT', None)]:
+        serial = st.transform(samples=cases, summary=summary, number_of_factors=2, engine=engine)
+        pooled = st.transform(samples=cases, summary=summary, number_of_factors=2, engine=engine, workers=2)
+        with ThreadPoolExecutor(max_workers=2) as executor:
+            threaded = st.transform(samples=cases, summary=summary, number_of_factors=2, engine=engine, executor=executor)
+        for results in [pooled, threaded]:
+            assert(list(results.keys()) == list(serial.keys()))
+            for case in cases:
+                for key, value in serial[case].items():
+                    if summary == 'COMPONENTS':
+                        assert(np.allclose(value.data, results[case][key].data))
+                    else:
+                        assert(np.allclose(value, results[case][key]))
+
+def test_selected_partitions_in_parallel():
+    rng = np.random.default_rng(24)
+    samples = rng.normal(size=(6, 30, 2))
+    expected = st.transform(samples=samples, summary='CONTENT', number_of_factors=3, partitions=['2+1'], remainder=True)
+    with ThreadPoolExecutor(max_workers=2) as executor:
+        result = st.transform(
+            samples=samples,
+            summary='CONTENT',
+            number_of_factors=3,
+            partitions=['2+1'],
+            remainder=True,
+            executor=executor,
+        )
+    assert(list(result.keys()) == ['2+1', 'remainder'])
+    for key in expected:
+        assert(np.allclose(result[key], expected[key]))
+
+def test_reused_workers_release_shared_arrays():
+    rng = np.random.default_rng(19)
+    samples = rng.normal(size=(5, 9, 3))
+    with ProcessPoolExecutor(max_workers=1) as executor:
+        for _ in range(4):
+            st.transform(samples=samples, summary='CONTENT', number_of_factors=3, engine='OPERATOR', executor=executor)
+            assert(executor.submit(count_attached_blocks).result() == 1)
+
+def test_parallel_cases_without_combinations():
+    rng = np.random.default_rng(20)
+    cases = {'long' : rng.normal(size=(6, 20, 3)), 'short' : rng.normal(size=(2, 20, 3))}
+    for summary in ['CONTENT', 'SEQUENTIAL_CONTENT']:
+        serial = st.transform(samples=cases, summary=summary, number_of_factors=3)
+        with ThreadPoolExecutor(max_workers=2) as executor:
+            threaded = st.transform(samples=cases, summary=summary, number_of_factors=3, executor=executor)
+            single = st.transform(samples=cases['short'], summary=summary, number_of_factors=3, executor=executor)
+        assert(list(threaded.keys()) == list(serial.keys()))
+        assert(serial['short'] == {'1+1+1' : [], '2+1' : [], '3' : []})
+        assert(threaded['short'] == serial['short'])
+        assert(single == serial['short'])
+        for key, norms in serial['long'].items():
+            assert(np.allclose(threaded['long'][key], norms))
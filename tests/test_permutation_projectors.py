@@ -0,0 +1,93 @@
+import itertools
+
+import numpy as np
+
+import schurtransform as st
+from schurtransform.schur_transform import SchurTransform
+from schurtransform.tensor import Tensor
+from schurtransform.tensor_operator import TensorOperator
+from schurtransform.permutation_projectors import PermutationProjectors
+
+
+def random_tensor(number_of_factors, dimension, seed=0):
+    rng = np.random.default_rng(seed)
+    return Tensor(
+        number_of_factors=number_of_factors,
+        dimension=dimension,
+        data=rng.normal(size=[dimension] * number_of_factors),
+    )
+
+def test_axes_agree_with_permutation_operators():
+    tensor = random_tensor(3, 2)
+    for permutation in itertools.permutations([1, 2, 3]):
+        operator = TensorOperator(
+            number_of_factors=3,
+            dimension=2,
+            permutation_inverse=list(permutation),
+        )
+        axes = PermutationProjectors.axes_of_permutation(permutation)
+        assert(np.allclose(operator.apply(tensor).data, np.transpose(tensor.data, axes)))
+
+def test_agreement_with_dense_projectors():
+    t = SchurTransform()
+    for degree in [2, 3, 4, 5]:
+        for dimension in [2, 3]:
+            tensor = random_tensor(degree, dimension, seed=degree)
+            dense = t.calculate_decomposition(tensor, t.recalculate_projectors(dimension=dimension, degree=degree))
+            implicit = t.calculate_decomposition(tensor, PermutationProjectors(degree=degree))
+            assert(set(dense.keys()) == set(implicit.keys()))
+            for key in dense:
+                assert(np.allclose(dense[key].data, implicit[key].data))
+            assert(t.validate_decomposition(implicit, tensor))
+
+def test_transform_beyond_distributed_projectors():
+    rng = np.random.default_rng(3)
+    samples = rng.normal(size=(6, 10, 4))
+    t = SchurTransform()
+    assert(t.select_engine(None, 6, 4).name == 'PERMUTATION')
+    norms = st.transform(samples=samples, summary='NORMS')
+    assert(len(norms) == 11)
+
+    samples = rng.normal(size=(3, 10, 5))
+    explicit = st.transform(samples=samples, summary='NORMS', engine='PERMUTATION')
+    automatic = st.transform(samples=samples, summary='NORMS')
+    assert(explicit == automatic)
+
+def test_norms_without_components():
+    t = SchurTransform()
+    for degree in [2, 3, 4, 5]:
+        for dimension in [2, 3]:
+            tensor = random_tensor(degree, dimension, seed=10 + degree)
+            projectors = PermutationProjectors(degree=degree)
+            decomposition = projectors.apply(tensor)
+            norms = projectors.calculate_norms(tensor)
+            tolerance = np.linalg.norm(tensor.data) / pow(10, 6)
+            for key, component in decomposition.items():
+                assert(abs(norms[key] - np.linalg.norm(component.data)) < tolerance)
+            assert(t.validate_norms(norms, tensor))
+
+def test_norms_engines_agree():
+    rng = np.random.default_rng(4)
+    samples = rng.normal(size=(4, 12, 3))
+    dense = st.transform(samples=samples, summary='NORMS', engine='OPERATOR')
+    implicit = st.transform(samples=samples, summary='NORMS')
+    for key in dense:
+        assert(np.isclose(dense[key], implicit[key], atol=1e-6))
+
+    dense = st.transform(samples=samples, summary='CONTENT', number_of_factors=3, engine='OPERATOR')
+    implicit = st.transform(samples=samples, summary='CONTENT', number_of_factors=3)
+    for key in dense:
+        assert(np.allclose(dense[key], implicit[key], atol=1e-6))
+
+def test_batched_class_inner_products():
+    rng = np.random.default_rng(9)
+    projectors = PermutationProjectors(degree=4)
+    stack = rng.normal(size=(5, 3, 3, 3, 3))
+    gathered = projectors.calculate_class_inner_products(stack)
+    single = np.array([projectors.calculate_class_inner_products(tensor) for tensor in stack])
+    assert(gathered.shape == (5, len(projectors.conjugacy_class_labels)))
+    assert(np.allclose(gathered, single))
+
+    unindexed = PermutationProjectors(degree=4)
+    unindexed.max_index_entries = 0
+    assert(np.allclose(unindexed.calculate_class_inner_products(stack), gathered))
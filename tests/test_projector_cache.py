@@ -0,0 +1,97 @@
+import os
+import shutil
+
+import numpy as np
+
+import schurtransform as st
+from schurtransform.schur_transform import SchurTransform
+from schurtransform.projector_cache import ProjectorCache
+
+
+def test_store_load_and_evict(tmp_path):
+    cache = ProjectorCache(directory=str(tmp_path / 'cache'), max_bytes=pow(10, 9))
+    assert(cache.load(degree=2, dimension=5) is None)
+    arrays = {'2' : np.ones((2, 2)), '1+1' : np.eye(2)}
+    assert(cache.store(degree=2, dimension=5, arrays=arrays))
+    assert(cache.contains(degree=2, dimension=5))
+    loaded = cache.load(degree=2, dimension=5)
+    for key, array in arrays.items():
+        assert(np.array_equal(loaded[key], array))
+    assert(all(name.endswith('.npz') for name in os.listdir(cache.directory)))
+
+    size = cache.get_size()
+    cache.max_bytes = size + size // 2
+    os.utime(cache.get_path(2, 5), (0, 0))
+    cache.store(degree=3, dimension=5, arrays=arrays)
+    assert(not cache.contains(degree=2, dimension=5))
+    assert(cache.contains(degree=3, dimension=5))
+
+def test_unreadable_file_is_removed(tmp_path):
+    cache = ProjectorCache(directory=str(tmp_path))
+    with open(cache.get_path(2, 4), 'wb') as file:
+        file.write(b'not an archive')
+    assert(cache.load(degree=2, dimension=4) is None)
+    assert(not cache.contains(degree=2, dimension=4))
+
+def test_projectors_generated_on_demand(tmp_path, monkeypatch):
+    monkeypatch.setenv('SCHURTRANSFORM_CACHE_DIR', str(tmp_path))
+    assert(not SchurTransform.projectors_are_available(dimension=4, degree=3))
+    rng = np.random.default_rng(17)
+    samples = rng.normal(size=(3, 10, 4))
+    first = st.transform(samples=samples, summary='COMPONENTS', engine='OPERATOR')
+    assert(SchurTransform.projectors_are_available(dimension=4, degree=3))
+    second = SchurTransform().transform(samples=samples, summary='COMPONENTS')
+    expected = st.transform(samples=samples, summary='COMPONENTS', engine='PERMUTATION')
+    for key, component in expected.items():
+        assert(np.allclose(first[key].data, component.data))
+        assert(np.allclose(second[key].data, component.data))
+
+def test_memory_mapped_projectors(tmp_path, monkeypatch):
+    monkeypatch.setenv('SCHURTRANSFORM_CACHE_DIR', str(tmp_path))
+    cache = ProjectorCache()
+    assert(cache.load_mapped(degree=3, dimension=3) is None)
+    t = SchurTransform()
+    projectors = t.retrieve_projectors(dimension=3, degree=3)
+    assert(not any(isinstance(projector.data, np.memmap) for projector in projectors.values()))
+    assert(os.listdir(tmp_path) == [])
+    monkeypatch.setattr(SchurTransform, 'memory_map_projectors', True)
+    for dtype in [np.float64, np.float32]:
+        projectors = t.retrieve_projectors(dimension=3, degree=3, dtype=dtype)
+        for projector in projectors.values():
+            assert(isinstance(projector.data, np.memmap))
+            assert(not projector.data.flags.writeable)
+            assert(projector.data.dtype == dtype)
+    assert(sorted(os.listdir(tmp_path)) == [
+        'projectors_degree_3_dimension_3_float32',
+        'projectors_degree_3_dimension_3_float64',
+    ])
+    expected = t.read_stored_projectors(dimension=3, degree=3)
+    mapped = t.retrieve_projectors(dimension=3, degree=3)
+    for key, array in expected.items():
+        assert(np.array_equal(mapped[key].data, array))
+
+    rng = np.random.default_rng(5)
+    samples = rng.normal(size=(3, 10, 3))
+    result = st.transform(samples=samples, summary='COMPONENTS', engine='OPERATOR')
+    expected = st.transform(samples=samples, summary='COMPONENTS', engine='PERMUTATION')
+    for key, component in expected.items():
+        assert(np.allclose(result[key].data, component.data))
+
+    cache.max_bytes = 0
+    cache.evict()
+    assert(os.listdir(tmp_path) == [])
+
+def test_failed_removal_is_logged(tmp_path, monkeypatch):
+    cache = ProjectorCache(directory=str(tmp_path))
+    arrays = {'2' : np.ones((2, 2)), '1+1' : np.eye(2)}
+    assert(cache.store_mapped(degree=2, dimension=5, arrays=arrays))
+
+    def refuse(path):
+        raise PermissionError(path)
+    monkeypatch.setattr(os, 'remove', refuse)
+    monkeypatch.setattr(shutil, 'rmtree', refuse)
+    assert(not ProjectorCache.remove(cache.get_mapped_path(2, 5)))
+    cache.clear()
+    cache.max_bytes = 0
+    assert(cache.evict() == [])
+    assert(cache.load_mapped(degree=2, dimension=5) is not None)
@@ -0,0 +1,43 @@
+import importlib.resources
+from math import factorial
+
+import numpy as np
+
+from schurtransform.schur_transform import SchurTransform
+from schurtransform import projectors as projectors_package
+from schurtransform.projector_encoding import encode_projectors
+from schurtransform.projector_encoding import decode_projectors
+from schurtransform.projector_encoding import read_projectors
+
+
+def test_round_trip_is_exact():
+    t = SchurTransform()
+    projectors = t.recalculate_projectors(dimension=3, degree=4, get_cached=False)
+    arrays = t.get_stored_arrays(projectors)
+    encoded = encode_projectors(arrays, denominator=factorial(4))
+    assert(int(encoded['denominator']) == 24)
+    assert(all(encoded[key].dtype == np.int8 for key in arrays))
+    assert(all(encoded[key].size == 81 * 82 // 2 for key in arrays))
+    decoded = decode_projectors(encoded)
+    for key, array in arrays.items():
+        assert(np.allclose(decoded[key], array, rtol=0, atol=1e-15))
+    single = decode_projectors(encoded, dtype=np.float32)
+    for key, array in arrays.items():
+        assert(single[key].dtype == np.float32)
+        assert(np.array_equal(single[key], array.astype(np.float32)))
+
+def test_inexact_arrays_are_not_encoded():
+    assert(encode_projectors({'2' : np.full((2, 2), 0.3)}, denominator=2) is None)
+    assert(encode_projectors({'2' : np.array([[0.0, 1.0], [0.0, 0.0]])}, denominator=2) is None)
+    legacy = {'2' : np.eye(4)}
+    assert(np.array_equal(decode_projectors(legacy)['2'], legacy['2']))
+
+def test_distributed_projectors_resolve_identity():
+    for degree in [2, 3, 4, 5, 6]:
+        for dimension in [2, 3]:
+            filename = SchurTransform.format_projectors_filename(degree, dimension)
+            with importlib.resources.path(projectors_package, filename) as path:
+                arrays = read_projectors(path)
+            size = pow(dimension, degree)
+            total = sum(array.reshape(size, size) for array in arrays.values())
+            assert(np.allclose(total, np.eye(size), rtol=0, atol=1e-12))
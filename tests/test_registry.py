@@ -0,0 +1,89 @@
+import threading
+
+import numpy as np
+
+from schurtransform.schur_transform import SchurTransform
+from schurtransform.registry import Registry
+from schurtransform.registry import get_registry
+from schurtransform.registry import default_max_bytes
+from schurtransform.registry import estimate_size
+from schurtransform.character_table import get_character_table
+
+
+def test_hits_misses_and_eviction():
+    registry = Registry(max_bytes=3 * 8000 + 2000)
+    calls = []
+    def factory(i):
+        calls.append(i)
+        return np.zeros(1000)
+    for i in range(3):
+        registry.get(kind='array', degree=i, dimension=2, dtype=np.float64, factory=lambda: factory(i))
+    registry.get(kind='array', degree=0, dimension=2, dtype=np.float64, factory=lambda: factory(0))
+    assert(calls == [0, 1, 2])
+    registry.get(kind='array', degree=3, dimension=2, dtype=np.float64, factory=lambda: factory(3))
+    statistics = registry.get_statistics()
+    assert(statistics['hits'] == 1)
+    assert(statistics['misses'] == 4)
+    assert(statistics['evictions'] == 1)
+    assert(statistics['by_kind']['array']['misses'] == 4)
+    assert(statistics['entries'] == 3)
+    assert(statistics['bytes'] <= statistics['max_bytes'])
+    registry.get(kind='array', degree=0, dimension=2, dtype=np.float64, factory=lambda: factory(0))
+    assert(calls == [0, 1, 2, 3])
+    registry.get(kind='array', degree=1, dimension=2, dtype=np.float64, factory=lambda: factory(1))
+    assert(calls == [0, 1, 2, 3, 1])
+    registry.get(kind='array', degree=0, dimension=2, dtype=np.float32, factory=lambda: factory(0))
+    assert(calls == [0, 1, 2, 3, 1, 0])
+
+def test_concurrent_creation_happens_once():
+    registry = Registry()
+    calls = []
+    barrier = threading.Barrier(8)
+    def factory():
+        calls.append(1)
+        return 'value'
+    def request():
+        barrier.wait()
+        assert(registry.get(kind='item', degree=2, factory=factory) == 'value')
+    threads = [threading.Thread(target=request) for _ in range(8)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    assert(len(calls) == 1)
+    assert(registry.get_statistics()['hits'] == 7)
+
+def test_shared_across_instances():
+    registry = get_registry()
+    assert(get_character_table(5) is get_character_table(5))
+    first = SchurTransform().get_projectors(dimension=2, degree=3)
+    before = registry.get_statistics()['by_kind']['projectors']['hits']
+    second = SchurTransform().get_projectors(dimension=2, degree=3)
+    assert(first is second)
+    assert(registry.get_statistics()['by_kind']['projectors']['hits'] == before + 1)
+
+def test_invalid_size_variable(monkeypatch):
+    monkeypatch.setenv('SCHURTRANSFORM_REGISTRY_MAX_BYTES', 'many')
+    assert(Registry().max_bytes == default_max_bytes)
+    monkeypatch.setenv('SCHURTRANSFORM_REGISTRY_MAX_BYTES', '1000')
+    assert(Registry().max_bytes == 1000)
+
+def test_failed_creation_releases_key_lock():
+    registry = Registry()
+    def factory():
+        raise RuntimeError('failed')
+    try:
+        registry.get(kind='item', degree=2, factory=factory)
+    except RuntimeError:
+        pass
+    assert(registry.key_locks == {})
+    assert(registry.get(kind='item', degree=2, factory=lambda: 'value') == 'value')
+    assert(registry.key_locks == {})
+
+def test_memory_mapped_arrays_are_not_counted(tmp_path):
+    path = str(tmp_path / 'array.npy')
+    np.save(path, np.zeros(100000))
+    mapped = np.load(path, mmap_mode='r')
+    assert(estimate_size(mapped) == 0)
+    assert(estimate_size(np.asarray(mapped)[:10]) == 0)
+    assert(estimate_size(np.zeros(1000)) == 8000)
@@ -0,0 +1,53 @@
+from concurrent.futures import ThreadPoolExecutor
+
+import numpy as np
+
+import schurtransform as st
+from schurtransform.sample_files import open_samples
+from schurtransform.sample_files import calculate_means
+from schurtransform.sample_files import get_sample_reference
+from schurtransform.sample_files import resolve_sample_reference
+
+
+def test_memory_mapped_samples(tmp_path):
+    rng = np.random.default_rng(16)
+    samples = rng.normal(size=(6, 20, 3))
+    path = tmp_path / 'samples.npy'
+    np.save(path, samples)
+    mapped = open_samples(str(path))
+    assert(isinstance(mapped, np.memmap))
+    assert(np.allclose(calculate_means(mapped, block_size=7), np.mean(samples, axis=1)))
+    assert(np.array_equal(resolve_sample_reference(get_sample_reference(mapped)), samples))
+
+    for summary in ['COMPONENTS', 'NORMS']:
+        expected = st.transform(samples=samples[:4], summary=summary)
+        result = st.transform(samples=np.load(path, mmap_mode='r')[:4], summary=summary)
+        for key in expected:
+            if summary == 'COMPONENTS':
+                assert(np.allclose(result[key].data, expected[key].data))
+            else:
+                assert(np.isclose(result[key], expected[key], atol=1e-6))
+
+    for summary in ['CONTENT', 'SEQUENTIAL_CONTENT']:
+        expected = st.transform(samples=samples, summary=summary, number_of_factors=3)
+        results = [
+            st.transform(samples=path, summary=summary, number_of_factors=3, batch_size=4),
+            st.transform(samples=str(path), summary=summary, number_of_factors=3, workers=2),
+        ]
+        with ThreadPoolExecutor(max_workers=2) as executor:
+            results.append(st.transform(samples=path, summary=summary, number_of_factors=3, executor=executor))
+        for result in results:
+            for key in expected:
+                assert(np.allclose(result[key], expected[key], atol=1e-6))
+
+def test_archive_of_cases(tmp_path):
+    rng = np.random.default_rng(17)
+    cases = {'case' + str(i) : rng.normal(size=(3, 10, 2)) for i in range(3)}
+    path = tmp_path / 'cases.npz'
+    np.savez(path, **cases)
+    expected = st.transform(samples=cases, summary='NORMS')
+    result = st.transform(samples=str(path), summary='NORMS')
+    assert(set(result.keys()) == set(cases.keys()))
+    for case in cases:
+        for key in expected[case]:
+            assert(np.isclose(result[case][key], expected[case][key], atol=1e-6))
@@ -1,7 +1,17 @@
+from itertools import combinations
+import importlib.resources
+
 import numpy as np
 
 import schurtransform as st
 from schurtransform.schur_transform import SchurTransform
+from schurtransform.tensor_operator import TensorOperator
+from schurtransform.moments import MomentAccumulator
+from schurtransform.validation import Validator
+from schurtransform.symmetric_group import get_partition_strings
+from schurtransform.symmetric_group import is_vanishing_partition
+from schurtransform.projector_encoding import read_projectors
+from schurtransform import projectors as projectors_package
 
 def test_transform_norms():
     samples = [
@@ -64,5 +74,193 @@ def test_content():
         summary='CONTENT',
     )
 
+def test_covariance_tensor_matches_entrywise_loop():
+    t = SchurTransform()
+    rng = np.random.default_rng(0)
+    for degree in [1, 2, 3, 4, 5]:
+        for dimension in [2, 3]:
+            samples = rng.normal(size=(degree, 7, dimension))
+            covariance_tensor = t.calculate_covariance_tensor(samples)
+            expected = np.zeros([dimension] * degree)
+            it = np.nditer(expected, flags=['multi_index'], op_flags=['readwrite'])
+            for entry in it:
+                M = it.multi_index
+                it[0] = np.sum([
+                    np.prod([samples[i, j, M[i]] for i in range(degree)])
+                    for j in range(samples.shape[1])
+                ])
+            assert(covariance_tensor.data.shape == tuple([dimension] * degree))
+            assert(np.allclose(covariance_tensor.data, expected))
+
+def test_recenter_at_mean():
+    t = SchurTransform()
+    rng = np.random.default_rng(1)
+    samples = rng.normal(loc=3.0, size=(4, 9, 3))
+    centered = t.recenter_at_mean(samples)
+    expected = np.array([
+        [[samples[i, j, a] - np.mean(samples[i, :, a]) for a in range(3)] for j in range(9)]
+        for i in range(4)
+    ])
+    assert(centered.dtype == np.float64)
+    assert(np.allclose(centered, expected))
 
+    single_precision = t.recenter_at_mean(samples.astype(np.float32), preserve_dtype=True)
+    assert(single_precision.dtype == np.float32)
+    assert(np.allclose(single_precision, expected, atol=1e-5))
+
+    integer_samples = t.recenter_at_mean(np.arange(12).reshape(2, 3, 2), preserve_dtype=True)
+    assert(integer_samples.dtype == np.float64)
+
+    buffer = samples.copy()
+    result = t.recenter_at_mean(buffer, out=buffer)
+    assert(result is buffer)
+    assert(np.allclose(buffer, expected))
+
+def test_batched_content_matches_per_combination():
+    t = SchurTransform()
+    rng = np.random.default_rng(8)
+    samples = rng.normal(size=(7, 11, 3))
+    projectors = t.recalculate_projectors(dimension=3, degree=3)
+    expected = {key : [] for key in projectors}
+    for combination in combinations(range(7), 3):
+        centered = t.recenter_at_mean(samples[list(combination)])
+        decomposition = t.calculate_decomposition(t.calculate_covariance_tensor(centered), projectors)
+        for key, component in decomposition.items():
+            expected[key].append(np.linalg.norm(component.data))
+    for engine in ['OPERATOR', 'PERMUTATION', 'GRAM']:
+        for batch_size in [1, 4, 100]:
+            content = st.transform(
+                samples=samples,
+                summary='CONTENT',
+                number_of_factors=3,
+                engine=engine,
+                batch_size=batch_size,
+            )
+            for key in expected:
+                assert(len(content[key]) == len(expected[key]))
+                assert(np.allclose(content[key], expected[key], atol=1e-6))
 
+def test_sequential_content_and_streaming():
+    t = SchurTransform()
+    rng = np.random.default_rng(13)
+    samples = rng.normal(size=(12, 8, 3))
+    degree = 4
+    projectors = t.get_permutation_projectors(degree=degree)
+    windows = [[i + j for j in range(degree)] for i in range(12 - degree + 1)]
+    expected = t.calculate_content(samples, windows, projectors)
+    for batch_size in [1, 3, 64]:
+        content = st.transform(
+            samples=samples,
+            summary='SEQUENTIAL_CONTENT',
+            number_of_factors=degree,
+            batch_size=batch_size,
+        )
+        for key in expected:
+            assert(np.allclose(content[key], expected[key], atol=1e-6))
+    streamed = list(t.stream_sequential_content(iter(samples), degree=degree))
+    assert(len(streamed) == len(windows))
+    for i, norms in enumerate(streamed):
+        for key in expected:
+            assert(np.isclose(norms[key], expected[key][i], atol=1e-6))
+
+def test_transform_accumulated_moments():
+    rng = np.random.default_rng(15)
+    samples = rng.normal(size=(4, 40, 3))
+    accumulator = MomentAccumulator(number_of_series=4, dimension=3)
+    accumulator.update(samples[:, i:i + 6] for i in range(0, 40, 6))
+    for summary in ['COMPONENTS', 'NORMS']:
+        expected = st.transform(samples=samples, summary=summary)
+        result = st.transform(samples=accumulator, summary=summary)
+        for key in expected:
+            if summary == 'COMPONENTS':
+                assert(np.allclose(result[key].data, expected[key].data))
+            else:
+                assert(np.isclose(result[key], expected[key], atol=1e-6))
+    assert(st.transform(samples=accumulator, summary='CONTENT', number_of_factors=2) is None)
+
+def test_single_precision():
+    rng = np.random.default_rng(16)
+    samples = rng.normal(size=(6, 50, 3))
+    t = SchurTransform()
+    for engine in ['OPERATOR', 'PERMUTATION', 'GRAM']:
+        expected = st.transform(samples=samples, summary='CONTENT', number_of_factors=3, engine=engine)
+        result = st.transform(samples=samples, summary='CONTENT', number_of_factors=3, engine=engine, dtype='float32')
+        scale = np.linalg.norm([expected[key] for key in expected], axis=0)
+        for key in expected:
+            assert(np.array(result[key]).dtype == np.float32)
+            assert(np.all(np.abs(np.array(result[key]) - expected[key]) <= 1e-3 * scale))
+    components = st.transform(samples=samples[:3], summary='COMPONENTS', dtype='float32')
+    assert(all(component.data.dtype == np.float32 for component in components.values()))
+    projectors = t.get_projectors(dimension=3, degree=3, engine=t.select_engine('OPERATOR', 3, 3), dtype=np.float32)
+    assert(projectors is t.get_projectors(dimension=3, degree=3, engine=t.select_engine('OPERATOR', 3, 3), dtype=np.float32))
+    assert(all(projector.data.dtype == np.float32 for projector in projectors.values()))
+    assert(st.transform(samples=samples, dtype='int32') is None)
+
+def test_selected_partitions():
+    rng = np.random.default_rng(17)
+    samples = rng.normal(size=(5, 40, 3))
+    selected = ['1+1+1', '3']
+    for engine in ['OPERATOR', 'PERMUTATION', 'GRAM']:
+        for summary in ['NORMS', 'CONTENT', 'SEQUENTIAL_CONTENT']:
+            arguments = {'summary' : summary, 'number_of_factors' : 3, 'engine' : engine}
+            if summary == 'NORMS':
+                arguments['samples'] = samples[:3]
+            else:
+                arguments['samples'] = samples
+            expected = st.transform(**arguments)
+            validator = Validator()
+            result = st.transform(partitions=selected, remainder=True, validation=validator, **arguments)
+            assert(validator.failures == [])
+            assert(list(result.keys()) == selected + ['remainder'])
+            for key in selected:
+                assert(np.allclose(result[key], expected[key]))
+            assert(np.allclose(result['remainder'], expected['2+1'], atol=1e-6))
+    components = st.transform(samples=samples[:3], summary='COMPONENTS', partitions='3', remainder=True)
+    expected = st.transform(samples=samples[:3], summary='COMPONENTS')
+    assert(list(components.keys()) == ['3', 'remainder'])
+    assert(np.allclose(components['remainder'].data, expected['1+1+1'].data + expected['2+1'].data))
+    for engine in ['OPERATOR', 'PERMUTATION', 'GRAM']:
+        try:
+            st.transform(samples=samples[:3], summary='NORMS', engine=engine, partitions=[])
+            assert(False)
+        except ValueError:
+            pass
+        try:
+            st.transform(samples=samples[:3], summary='NORMS', engine=engine, partitions=['3', '4'])
+            assert(False)
+        except ValueError as error:
+            assert("['4']" in str(error))
+    assert(SchurTransform().validate_norms({}, squared_norm=1.0, degree=3))
+
+def test_vanishing_components():
+    rng = np.random.default_rng(18)
+    samples = rng.normal(size=(5, 30, 2))
+    for engine in ['OPERATOR', 'PERMUTATION', 'GRAM']:
+        norms = st.transform(samples=samples[:4], summary='NORMS', engine=engine)
+        assert(list(norms.keys()) == ['1+1+1+1', '2+1+1', '2+2', '3+1', '4'])
+        assert(norms['3+1'] == 0 and norms['4'] == 0)
+        assert(norms['2+1+1'] > 0)
+        content = st.transform(samples=samples, summary='CONTENT', number_of_factors=3, engine=engine)
+        assert(np.all(np.array(content['3']) == 0))
+        assert(np.all(np.array(content['2+1']) > 0))
+    components = st.transform(samples=samples[:3], summary='COMPONENTS')
+    assert(np.all(components['3'].data == 0))
+
+    t = SchurTransform()
+    projectors = t.get_projectors(dimension=2, degree=4, engine=t.select_engine('OPERATOR', 4, 2))
+    assert(all(projector is not None for projector in projectors.values()))
+    assert([key for key, projector in projectors.items() if not np.any(projector.data)] == ['3+1', '4'])
+    assert(projectors['4'].data.shape == (2,) * 8)
+    assert(all(projectors[key].data.dtype == np.float64 for key in ['3+1', '4']))
+    identity = TensorOperator(number_of_factors=4, dimension=2, identity=True)
+    assert(np.allclose(sum(projector.data for projector in projectors.values()), identity.data))
+    cast = t.cast_projectors(projectors, np.float32)
+    assert(cast['4'].data.dtype == np.float32 and not np.any(cast['4'].data))
+    for degree in [2, 3, 4, 5, 6]:
+        for dimension in [2, 3]:
+            if not t.projectors_are_distributed(dimension=dimension, degree=degree):
+                continue
+            filename = t.format_projectors_filename(degree, dimension)
+            with importlib.resources.path(projectors_package, filename) as path:
+                stored = list(read_projectors(path).keys())
+            assert(stored == [key for key in get_partition_strings(degree) if not is_vanishing_partition(key, dimension)])
@@ -0,0 +1,87 @@
+import csv
+import itertools
+import importlib.resources
+from math import factorial
+
+import numpy as np
+
+import schurtransform
+from schurtransform import character_tables
+from schurtransform.character_table import CharacterTable
+from schurtransform.symmetric_group import generate_partitions
+from schurtransform.symmetric_group import conjugate_partition
+from schurtransform.symmetric_group import calculate_class_size
+from schurtransform.symmetric_group import calculate_character
+from schurtransform.symmetric_group import calculate_character_table
+from schurtransform.symmetric_group import format_partition
+from schurtransform.symmetric_group import generate_class_permutations
+from schurtransform.symmetric_group import get_partition_strings
+from schurtransform.symmetric_group import is_vanishing_partition
+from schurtransform.tensor import Tensor
+from schurtransform.permutation_projectors import PermutationProjectors
+
+
+def read_csv(filename):
+    with importlib.resources.path(character_tables, filename) as path:
+        with open(path, newline='') as file:
+            return list(csv.reader(file))
+
+def test_partitions():
+    assert(generate_partitions(4) == [(1, 1, 1, 1), (2, 1, 1), (2, 2), (3, 1), (4,)])
+    assert([len(generate_partitions(n)) for n in range(1, 11)] == [1, 2, 3, 5, 7, 11, 15, 22, 30, 42])
+    assert(conjugate_partition((4, 2, 1)) == (3, 2, 1, 1))
+    for n in range(1, 9):
+        assert(sum(calculate_class_size(p) for p in generate_partitions(n)) == factorial(n))
+
+def test_tables_match_distributed_tables():
+    classes = read_csv('symmetric_group_conjugacy_classes.csv')[1:]
+    for degree in [2, 3, 4, 5, 6]:
+        labels, class_sizes, characters = calculate_character_table(degree)
+        rows = read_csv('s' + str(degree) + '.csv')
+        assert(rows[0][1:] == labels)
+        assert([row[0] for row in rows[1:]] == labels)
+        for row in rows[1:]:
+            assert([int(value) for value in row[1:]] == [characters[row[0]][label] for label in labels])
+        expected_sizes = {row[1] : int(row[2]) for row in classes if row[0] == 'S' + str(degree)}
+        assert(expected_sizes == class_sizes)
+        table = CharacterTable(degree=degree)
+        assert(table.get_characters() == characters)
+        assert(table.get_conjugacy_class_representatives() == labels)
+
+def test_higher_degree_orthogonality():
+    degree = 9
+    labels, class_sizes, characters = calculate_character_table(degree)
+    for key1, character1 in characters.items():
+        for key2, character2 in characters.items():
+            product = sum(character1[label] * character2[label] * class_sizes[label] for label in labels)
+            assert(product == (factorial(degree) if key1 == key2 else 0))
+    assert(calculate_character((3, 3), (2, 2, 2)) == -3)
+
+def test_class_permutations():
+    for degree in [1, 3, 5, 6]:
+        permutations = list(itertools.permutations(range(1, degree + 1)))
+        labels = [
+            format_partition(CharacterTable.partition_from_permutation(p)[::-1]) for p in permutations
+        ]
+        by_label = {}
+        for permutation, label in zip(permutations, labels):
+            by_label.setdefault(label, []).append(permutation)
+        for partition in generate_partitions(degree):
+            generated = list(generate_class_permutations(partition))
+            assert(len(generated) == len(set(generated)) == calculate_class_size(partition))
+            assert(sorted(generated) == by_label[format_partition(partition)])
+
+def test_vanishing_partitions():
+    rng = np.random.default_rng(0)
+    for degree in [2, 3, 4, 5]:
+        projectors = PermutationProjectors(degree=degree)
+        for dimension in [1, 2, 3]:
+            tensor = Tensor(
+                number_of_factors=degree,
+                dimension=dimension,
+                data=rng.normal(size=[dimension] * degree),
+            )
+            decomposition = projectors.apply(tensor)
+            for key in get_partition_strings(degree):
+                vanishes = np.linalg.norm(decomposition[key].data) < 1e-9
+                assert(is_vanishing_partition(key, dimension) == vanishes)
@@ -132,3 +132,24 @@ def test_additivity_over_operator():
             result2 = sum2
 
             assert(np.linalg.norm(result1.data - result2.data) < tolerance)
+
+def test_permutation_entries():
+    for p in [[1, 2, 3], [2, 3, 1], [3, 1, 2], [2, 1, 3]]:
+        operator = TensorOperator(number_of_factors=3, dimension=3, permutation_inverse=p)
+        iterator = np.nditer(operator.data, flags=['multi_index'])
+        for entry in iterator:
+            index = iterator.multi_index
+            expected = [index[p[i]-1] for i in range(3)] == [index[i+3] for i in range(3)]
+            assert(entry == (1.0 if expected else 0.0))
+
+def test_permutation_sum():
+    permutations = [[2, 3, 1], [3, 1, 2], [2, 1, 3]]
+    weights = [0.5, -2, 3]
+    expected = TensorOperator(number_of_factors=3, dimension=2)
+    for p, weight in zip(permutations, weights):
+        operator = TensorOperator(number_of_factors=3, dimension=2, permutation_inverse=p)
+        expected.add(operator.scale_by(amount=weight), inplace=True)
+    total = TensorOperator.permutation_sum(3, 2, permutations, weights=weights)
+    assert(np.array_equal(total.data, expected.data))
+    unweighted = TensorOperator.permutation_sum(3, 2, permutations)
+    assert(np.sum(unweighted.data) == len(permutations) * pow(2, 3))
@@ -0,0 +1,91 @@
+from concurrent.futures import ThreadPoolExecutor
+
+import numpy as np
+
+from schurtransform.schur_transform import SchurTransform
+from schurtransform.validation import Validator
+from schurtransform.validation import ValidationError
+from schurtransform.validation import activate_validator
+from schurtransform.validation import get_relative_tolerance
+
+
+def test_policies_count_checks():
+    rng = np.random.default_rng(21)
+    samples = rng.normal(size=(3, 20, 2))
+    transformer = SchurTransform()
+    for policy, expected in [('ALWAYS', 5), ('NEVER', 0), ('ONCE', 1)]:
+        validator = Validator(policy=policy)
+        for i in range(5):
+            transformer.transform(samples, summary='COMPONENTS', engine='OPERATOR', validation=validator)
+        assert(validator.checks_performed == expected)
+        assert(validator.failures == [])
+
+    validator = Validator(policy='SAMPLED', interval=3)
+    for i in range(7):
+        transformer.transform(samples, summary='NORMS', engine='OPERATOR', validation=validator)
+    assert(validator.checks_performed == 3)
+
+    validator = Validator(policy='ONCE')
+    transformer.transform(samples, summary='NORMS', engine='OPERATOR', validation=validator)
+    transformer.transform(samples[:2], summary='NORMS', engine='OPERATOR', validation=validator)
+    transformer.transform(samples, summary='NORMS', engine='OPERATOR', validation=validator)
+    assert(validator.checks_performed == 2)
+
+def test_failures_recorded_and_raised():
+    rng = np.random.default_rng(22)
+    samples = rng.normal(size=(3, 20, 2))
+    transformer = SchurTransform()
+    covariance_tensor = transformer.calculate_covariance_tensor(transformer.recenter_at_mean(samples))
+    projectors = transformer.get_projectors(dimension=2, degree=3, engine=transformer.select_engine('OPERATOR', 3, 2))
+    decomposition = transformer.calculate_decomposition(covariance_tensor, projectors)
+    decomposition['2+1'] = decomposition['2+1'].scale_by(amount=2)
+
+    validator = Validator()
+    with activate_validator(validator):
+        assert(not transformer.validate_decomposition(decomposition, covariance_tensor))
+    assert(len(validator.failures) == 1)
+    failure = validator.failures[0]
+    assert(failure['check'] == 'decomposition')
+    assert(failure['degree'] == 3 and failure['dimension'] == 2)
+    assert(failure['defect'] > failure['tolerance'])
+
+    validator = Validator(raise_on_failure=True)
+    norms = {key : 2 * norm for key, norm in transformer.calculate_norms(covariance_tensor, projectors).items()}
+    with activate_validator(validator):
+        try:
+            transformer.validate_norms(norms, tensor=covariance_tensor)
+            raised = False
+        except ValidationError as error:
+            raised = True
+            assert(error.failures[0]['check'] == 'norms')
+    assert(raised)
+
+def test_parallel_failures_collected(monkeypatch):
+    rng = np.random.default_rng(23)
+    samples = rng.normal(size=(5, 20, 2))
+    original = SchurTransform.calculate_batch_norms
+
+    def corrupted(self, *args, **kwargs):
+        return 2 * original(self, *args, **kwargs)
+
+    monkeypatch.setattr(SchurTransform, 'calculate_batch_norms', corrupted)
+    transformer = SchurTransform()
+    validator = Validator()
+    with ThreadPoolExecutor(max_workers=2) as executor:
+        content = transformer.transform(
+            samples,
+            summary='CONTENT',
+            number_of_factors=3,
+            engine='OPERATOR',
+            executor=executor,
+            validation=validator,
+        )
+    assert(content is not None)
+    assert(len(validator.failures) > 0)
+    assert(all(failure['check'] == 'batch_norms' for failure in validator.failures))
+    assert(sum(failure['failures'] for failure in validator.failures) == 10)
+
+def test_tolerance_scales_with_precision():
+    assert(get_relative_tolerance(np.float64) < 1e-8)
+    assert(get_relative_tolerance(np.float32) > 1e-5)
+    assert(get_relative_tolerance(np.int64) == get_relative_tolerance(np.float64))